@@ -0,0 +1,336 @@
+"""
+LJPW Framework V7.7+ — Checkpoint & Resume
+Preemption-safe long runs of AutopoieticEngine.
+
+A run directory holds:
+
+    checkpoint.npz      Everything step() depends on: state, parameters,
+                        time constants, tick count, elapsed time, the exact
+                        self-model windows (running sums included), forcing,
+                        event-detector state and the RNG bit-generator state
+    history/            Append-only trajectory of the recorded steps
+                        (see autopoietic_trajectory)
+
+Checkpoints are written atomically (temporary file + rename) after the
+history is flushed, and record how many history rows they cover. On resume,
+rows written after the last checkpoint are truncated away, so continuing
+reproduces the uninterrupted run bit for bit and restart costs one file read.
+"""
+
+import json
+import os
+import time
+from dataclasses import astuple
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+from autopoietic_engine import AutopoieticEngine, DynamicParameters, TimeConstants
+from autopoietic_events import Event, EventSpec
+from autopoietic_trajectory import Trajectory, TrajectoryWriter, COLUMN_NAMES
+
+
+CHECKPOINT_FILE = 'checkpoint.npz'
+HISTORY_DIR = 'history'
+FORMAT_VERSION = 1
+
+# Self-model windows saved with the checkpoint
+MODEL_WINDOWS = ('efficiency', 'entropy', 'gap')
+
+
+# ============================================================================
+# CHECKPOINTER
+# ============================================================================
+
+class Checkpointer:
+    """
+    Periodic checkpoints of one engine run in a directory.
+
+    Usage:
+        cp = Checkpointer("runs/album", every_steps=10_000)
+        engine = cp.load() if cp.exists() else cp.attach(AutopoieticEngine(state))
+        cp.run(engine, steps=1_000_000, dt=0.1)
+    """
+
+    def __init__(self, directory: str,
+                 every_steps: Optional[int] = 1000,
+                 every_seconds: Optional[float] = None,
+                 history: bool = True,
+                 buffer_rows: int = 65_536):
+        """
+        Initialize checkpointer.
+
+        Args:
+            directory: Run directory
+            every_steps: Checkpoint interval in engine steps (None = off)
+            every_seconds: Checkpoint interval in wall-clock seconds (None = off)
+            history: Stream history records to append-only column files
+            buffer_rows: History records buffered between flushes
+        """
+        self.directory = directory
+        self.every_steps = every_steps
+        self.every_seconds = every_seconds
+        self.history = history
+        self.buffer_rows = buffer_rows
+        self.sink: Optional[TrajectoryWriter] = None
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, CHECKPOINT_FILE)
+
+    @property
+    def history_dir(self) -> str:
+        return os.path.join(self.directory, HISTORY_DIR)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def attach(self, engine: AutopoieticEngine, rows: int = 0) -> AutopoieticEngine:
+        """Route the engine's history into this run's trajectory file"""
+        if self.history and engine.record_history:
+            self.sink = TrajectoryWriter(self.history_dir, rows, self.buffer_rows)
+            engine.history_sink = self.sink
+        return engine
+
+    # ------------------------------------------------------------------------
+    # SAVE
+    # ------------------------------------------------------------------------
+
+    def save(self, engine: AutopoieticEngine, **meta) -> str:
+        """
+        Flush history, then atomically write the checkpoint.
+
+        Args:
+            engine: Engine to capture
+            **meta: Extra JSON-serializable run information (e.g. dt, target)
+        """
+        if self.sink is not None:
+            self.sink.flush()
+
+        arrays = {
+            'format_version': np.array(FORMAT_VERSION),
+            'state': engine.state.to_array(),
+            'params': np.array(astuple(engine.params)),
+            'time_constants': np.array(astuple(engine.tau)),
+            'tick_count': np.array(engine.tick_count),
+            'time_elapsed': np.array(engine.time_elapsed),
+            'best_efficiency': np.array(engine.model['best_efficiency']),
+            'convergence': np.array(engine.model['convergence']),
+            'record_history': np.array(engine.record_history),
+            'history_rows': np.array(self.sink.rows if self.sink is not None else 0),
+            'forcing': engine.forcing if engine.forcing is not None else np.empty(0),
+            'coupling': engine.coupling,
+            'rng_state': np.array(json.dumps(engine.rng.bit_generator.state)
+                                  if engine.rng is not None else ''),
+            'meta': np.array(json.dumps(meta)),
+        }
+        for window in MODEL_WINDOWS:
+            for key, value in engine.model[window].get_state().items():
+                arrays[f'window_{window}_{key}'] = value
+
+        detector = engine.event_detector
+        if detector is not None:
+            arrays['event_values'] = np.asarray(detector._values, dtype=float)
+            arrays['event_converged'] = np.array(detector._converged)
+            arrays['events'] = np.array(json.dumps([
+                [e.name, e.time, e.tick, e.direction, list(e.state)] for e in detector.events
+            ]))
+
+        tmp = self.path + '.tmp'
+        with open(tmp, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        return self.path
+
+    # ------------------------------------------------------------------------
+    # LOAD
+    # ------------------------------------------------------------------------
+
+    def meta(self) -> Dict:
+        """Run information stored with the last checkpoint"""
+        with np.load(self.path) as data:
+            return json.loads(str(data['meta']))
+
+    def load(self, events: Optional[List[EventSpec]] = None) -> AutopoieticEngine:
+        """
+        Rebuild the engine from the last checkpoint.
+
+        History files are cut back to the rows the checkpoint covers and
+        re-attached, so the continued run appends exactly where it left off.
+
+        Args:
+            events: Event specs, if the run tracked custom events
+                    (default events are restored automatically)
+        """
+        with np.load(self.path) as data:
+            L, J, P, W = data['state'].tolist()
+            rng = None
+            if str(data['rng_state']):
+                state = json.loads(str(data['rng_state']))
+                bit_generator = getattr(np.random, state['bit_generator'])()
+                bit_generator.state = state
+                rng = np.random.Generator(bit_generator)
+
+            engine = AutopoieticEngine(
+                LJPWCoordinates(L=L, J=J, P=P, W=W, source="checkpoint"),
+                TimeConstants(*data['time_constants'].tolist()),
+                DynamicParameters(*data['params'].tolist()),
+                rng=rng,
+                record_history=bool(data['record_history'])
+            )
+            engine.tick_count = int(data['tick_count'])
+            engine.time_elapsed = float(data['time_elapsed'])
+            engine.model['best_efficiency'] = float(data['best_efficiency'])
+            engine.model['convergence'] = bool(data['convergence'])
+            for window in MODEL_WINDOWS:
+                engine.model[window].set_state({
+                    key: data[f'window_{window}_{key}'] for key in ('buffer', 'sum', 'sumsq', 'count')
+                })
+            if data['forcing'].size:
+                engine.forcing = data['forcing'].copy()
+            engine.coupling = data['coupling'].copy()
+
+            if 'event_values' in data:
+                detector = engine.track_events(events)
+                detector._values = data['event_values'].copy()
+                detector._converged = bool(data['event_converged'])
+                detector.events = [Event(name, t, tick, direction, tuple(state))
+                                   for name, t, tick, direction, state in json.loads(str(data['events']))]
+
+            rows = int(data['history_rows'])
+
+        return self.attach(engine, rows)
+
+    # ------------------------------------------------------------------------
+    # RUN
+    # ------------------------------------------------------------------------
+
+    def run(self, engine: AutopoieticEngine, steps: int, dt: float = 0.1,
+            verbose: bool = False) -> AutopoieticEngine:
+        """
+        Step until engine.tick_count reaches `steps`, checkpointing on the way.
+
+        `steps` is the absolute target, so the same call finishes a run
+        whether it starts fresh or from a resumed engine.
+        """
+        last_save = time.monotonic()
+        since_save = 0
+
+        while engine.tick_count < steps:
+            engine.step(dt)
+            since_save += 1
+
+            due = self.every_steps is not None and since_save >= self.every_steps
+            if self.every_seconds is not None and time.monotonic() - last_save >= self.every_seconds:
+                due = True
+            if due:
+                self.save(engine, dt=dt, target_steps=steps)
+                since_save = 0
+                last_save = time.monotonic()
+                if verbose:
+                    print(f"  checkpoint at tick {engine.tick_count}")
+
+        self.save(engine, dt=dt, target_steps=steps)
+        return engine
+
+    def load_history(self) -> Trajectory:
+        """Memory-mapped history of this run"""
+        return Trajectory(self.history_dir)
+
+
+def run_resumable(state: LJPWCoordinates, steps: int, directory: str,
+                  dt: float = 0.1,
+                  params: DynamicParameters = None,
+                  rng: Optional[np.random.Generator] = None,
+                  every_steps: Optional[int] = 1000,
+                  every_seconds: Optional[float] = None,
+                  record_history: bool = True,
+                  events=None) -> AutopoieticEngine:
+    """
+    Run (or finish) a long simulation in `directory`.
+
+    If a checkpoint exists the run resumes from it; otherwise it starts
+    from `state`. Calling this again after a crash completes the run with
+    results identical to an uninterrupted one.
+
+    Args:
+        state: Initial state (ignored when resuming)
+        steps: Total steps of the run
+        directory: Run directory
+        dt: Time step
+        params: Dynamic parameters for a fresh run
+        rng: Generator for a fresh run (its state is checkpointed)
+        every_steps, every_seconds: Checkpoint intervals
+        record_history: Stream history to column files
+        events: True / list of EventSpec to track phase-transition events
+    """
+    specs = None if events is True or events is None else events
+    checkpointer = Checkpointer(directory, every_steps, every_seconds, history=record_history)
+    if checkpointer.exists():
+        engine = checkpointer.load(specs)
+    else:
+        engine = AutopoieticEngine(state, params=params.copy() if params else None,
+                                   rng=rng, record_history=record_history)
+        if events is not None and events is not False:
+            engine.track_events(specs)
+        checkpointer.attach(engine)
+    return checkpointer.run(engine, steps, dt)
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    print("=" * 70)
+    print("LJPW V7.7+ — CHECKPOINT & RESUME TEST")
+    print("=" * 70)
+
+    start = LJPWCoordinates(L=0.3, J=0.5, P=0.9, W=0.5)
+    total = 20_000
+    root = tempfile.mkdtemp(prefix="ljpw_ckpt_")
+
+    # 1. Uninterrupted reference run
+    t0 = time.perf_counter()
+    reference = run_resumable(start, total, os.path.join(root, "reference"),
+                              every_steps=5000, events=True)
+    full_time = time.perf_counter() - t0
+
+    # 2. Run that is "preempted" part way, then resumed
+    crashed = os.path.join(root, "crashed")
+    checkpointer = Checkpointer(crashed, every_steps=5000)
+    engine = checkpointer.attach(AutopoieticEngine(start))
+    engine.track_events()
+    for _ in range(12_345):              # dies between checkpoints at 10k and 15k
+        engine.step(0.1)
+        if engine.tick_count % 5000 == 0:
+            checkpointer.save(engine, dt=0.1, target_steps=total)
+    checkpointer.sink.flush()            # partial rows past the checkpoint hit disk
+    del engine, checkpointer
+
+    t0 = time.perf_counter()
+    resumed_checkpointer = Checkpointer(crashed, every_steps=5000)
+    resumed = resumed_checkpointer.load()
+    restart_time = time.perf_counter() - t0
+    resumed_checkpointer.run(resumed, total, dt=0.1)
+
+    a = Trajectory(os.path.join(root, "reference", HISTORY_DIR))
+    b = resumed_checkpointer.load_history()
+    same_history = len(a) == len(b) and all(np.array_equal(a[name], b[name]) for name in COLUMN_NAMES)
+
+    print(f"\n1. Reference: {total} steps in {full_time:.2f}s")
+    print(f"2. Restart from tick {10_000} took {restart_time * 1000:.1f} ms")
+    print(f"   Final state identical: {reference.state.to_tuple() == resumed.state.to_tuple()}")
+    print(f"   Time identical:        {reference.time_elapsed == resumed.time_elapsed}")
+    print(f"   History identical:     {same_history} ({len(b['time'])} rows)")
+    print(f"   Events identical:      {reference.events == resumed.events}")
+    print(f"   In-memory history:     {len(resumed.history)} records")
+
+    shutil.rmtree(root)
@@ -0,0 +1,397 @@
+"""
+LJPW Framework V7.7+ — Numerical Continuation & Bifurcations
+Where exactly does stability change as one parameter varies?
+
+Equilibria of AutopoieticEngine.calculate_forces satisfy F(x; p) = 0 for
+x = (L, J, P, W). EquilibriumContinuation follows such a branch through
+(x, p) space with pseudo-arclength continuation:
+
+    predictor:  y* = y + ds * t          (t = unit tangent, null vector of [F_x | F_p])
+    corrector:  Newton on  F(x, p) = 0,  t . (y - y*) = 0
+
+Stability comes from the eigenvalues of M^-1 F_x (M = inertia weights).
+This is the linearisation of AutopoieticEngine.step near an equilibrium
+inside the LJPW box. The step's clipping of accelerations and of the
+coordinates to [STATE_LOWER, STATE_UPPER] is ignored, so branches (and
+bifurcations) outside the box or at its edges are features of the
+unclipped force law that the engine itself cannot reach. They are
+flagged with in_domain = False.
+
+- Fold (saddle-node): the tangent's parameter component changes sign
+- Branch point: det F_x changes sign without a fold (e.g. where a
+  non-trivial branch meets the trivial equilibrium at the origin)
+- Hopf: the bialternate test function prod_{i<j}(lambda_i + lambda_j)
+  changes sign while a complex-conjugate pair is present
+
+Jacobians are analytic (ensemble_jacobian / ensemble_param_jacobian), so a
+branch costs a few hundred small Newton solves instead of a brute-force
+sweep of simulations.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ljpw_v77_core import LJPWConstants
+from autopoietic_engine import DynamicParameters
+from autopoietic_ensemble import (
+    EnsembleEngine, INERTIAS, PARAM_INDEX, ensemble_forces, ensemble_jacobian,
+    ensemble_param_jacobian, params_to_array, STATE_LOWER, STATE_UPPER
+)
+
+
+# Slack when testing interpolated states against the LJPW box
+DOMAIN_TOLERANCE = 1e-9
+
+
+def inside_domain(states: np.ndarray) -> np.ndarray:
+    """True where a state (or each row of states) lies inside the LJPW box"""
+    states = np.asarray(states, dtype=float)
+    return np.all((states >= STATE_LOWER - DOMAIN_TOLERANCE) &
+                  (states <= STATE_UPPER + DOMAIN_TOLERANCE), axis=-1)
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+@dataclass
+class BifurcationPoint:
+    """A detected fold, branch or Hopf point (located by linear interpolation)"""
+    kind: str                   # 'fold', 'branch' or 'hopf'
+    parameter: float
+    state: Tuple[float, float, float, float]
+    index: int                  # branch index just after the crossing
+    in_domain: bool = True      # state inside the LJPW box, i.e. reachable by step()
+
+    @property
+    def trivial(self) -> bool:
+        """On the trivial equilibrium at the origin"""
+        return bool(np.all(np.abs(self.state) < DOMAIN_TOLERANCE))
+
+    def to_dict(self) -> Dict:
+        return {'kind': self.kind, 'parameter': self.parameter,
+                'state': list(self.state), 'index': self.index,
+                'in_domain': self.in_domain, 'trivial': self.trivial}
+
+
+@dataclass
+class Branch:
+    """A traced equilibrium branch"""
+    parameter_name: str
+    parameters: np.ndarray          # (K,)
+    states: np.ndarray              # (K, 4)
+    eigenvalues: np.ndarray         # (K, 4) complex
+    bifurcations: List[BifurcationPoint] = field(default_factory=list)
+    newton_solves: int = 0
+
+    def __len__(self) -> int:
+        return len(self.parameters)
+
+    @property
+    def stable(self) -> np.ndarray:
+        """True where every eigenvalue has negative real part"""
+        return np.all(self.eigenvalues.real < 0, axis=1)
+
+    @property
+    def in_domain(self) -> np.ndarray:
+        """True where the equilibrium lies inside the LJPW coordinate box"""
+        return inside_domain(self.states)
+
+    @property
+    def reachable_bifurcations(self) -> List[BifurcationPoint]:
+        """Bifurcations inside the LJPW box and off the trivial origin"""
+        return [b for b in self.bifurcations if b.in_domain and not b.trivial]
+
+    def to_dict(self) -> Dict:
+        return {
+            'parameter_name': self.parameter_name,
+            'parameters': self.parameters.tolist(),
+            'states': self.states.tolist(),
+            'eigenvalues_real': self.eigenvalues.real.tolist(),
+            'eigenvalues_imag': self.eigenvalues.imag.tolist(),
+            'stable': self.stable.tolist(),
+            'in_domain': self.in_domain.tolist(),
+            'bifurcations': [b.to_dict() for b in self.bifurcations],
+            'newton_solves': self.newton_solves,
+        }
+
+    def save(self, path: str) -> None:
+        """Export to .json or .npz (chosen by extension)"""
+        if path.endswith('.json'):
+            with open(path, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
+        else:
+            np.savez(path,
+                     parameter_name=self.parameter_name,
+                     parameters=self.parameters,
+                     states=self.states,
+                     eigenvalues=self.eigenvalues,
+                     stable=self.stable,
+                     in_domain=self.in_domain,
+                     bifurcations=json.dumps([b.to_dict() for b in self.bifurcations]))
+
+
+# ============================================================================
+# CONTINUATION
+# ============================================================================
+
+class EquilibriumContinuation:
+    """
+    Pseudo-arclength continuation of equilibria in one DynamicParameters field.
+    """
+
+    def __init__(self,
+                 parameter: str,
+                 base_params: DynamicParameters = None,
+                 tol: float = 1e-10,
+                 max_newton: int = 12):
+        """
+        Initialize continuation.
+
+        Args:
+            parameter: DynamicParameters field to vary (e.g. 'gamma', 'beta_W')
+            base_params: Values for every other field
+            tol: Newton residual tolerance
+            max_newton: Newton iterations before a step is rejected
+        """
+        if parameter not in PARAM_INDEX:
+            raise ValueError(f"Unknown parameter {parameter!r}")
+        self.parameter = parameter
+        self.column = PARAM_INDEX[parameter]
+        self.base_row = params_to_array(base_params or DynamicParameters())[0]
+        self.tol = tol
+        self.max_newton = max_newton
+        self.newton_solves = 0
+
+    # ------------------------------------------------------------------
+    # System pieces
+    # ------------------------------------------------------------------
+
+    def _row(self, p: float) -> np.ndarray:
+        row = self.base_row.copy()
+        row[self.column] = p
+        return row
+
+    def residual(self, x: np.ndarray, p: float) -> np.ndarray:
+        """F(x; p)"""
+        return ensemble_forces(x[None, :], self._row(p))[0]
+
+    def extended_jacobian(self, x: np.ndarray, p: float) -> np.ndarray:
+        """[F_x | F_p], shape (4, 5)"""
+        row = self._row(p)
+        Fx = ensemble_jacobian(x[None, :], row)[0]
+        Fp = ensemble_param_jacobian(x[None, :], row)[0][:, self.column]
+        return np.hstack([Fx, Fp[:, None]])
+
+    def eigenvalues(self, x: np.ndarray, p: float) -> np.ndarray:
+        """Eigenvalues of the step linearisation M^-1 F_x, sorted by real part"""
+        Fx = ensemble_jacobian(x[None, :], self._row(p))[0]
+        ev = np.linalg.eigvals(Fx / INERTIAS[:, None])
+        return ev[np.argsort(-ev.real)]
+
+    def tangent(self, x: np.ndarray, p: float, previous: Optional[np.ndarray] = None) -> np.ndarray:
+        """Unit null vector of [F_x | F_p], oriented along `previous`"""
+        _, _, vt = np.linalg.svd(self.extended_jacobian(x, p))
+        t = vt[-1]
+        if previous is not None and np.dot(t, previous) < 0:
+            t = -t
+        return t
+
+    # ------------------------------------------------------------------
+    # Newton solvers
+    # ------------------------------------------------------------------
+
+    def solve_equilibrium(self, x0: np.ndarray, p: float) -> Optional[np.ndarray]:
+        """Newton at fixed parameter; None if it does not converge"""
+        x = np.array(x0, dtype=float)
+        for _ in range(self.max_newton):
+            self.newton_solves += 1
+            F = self.residual(x, p)
+            if np.linalg.norm(F) < self.tol:
+                return x
+            Fx = self.extended_jacobian(x, p)[:, :4]
+            try:
+                x = x - np.linalg.solve(Fx, F)
+            except np.linalg.LinAlgError:
+                return None
+        return x if np.linalg.norm(self.residual(x, p)) < self.tol else None
+
+    def _correct(self, y_pred: np.ndarray, t: np.ndarray) -> Optional[np.ndarray]:
+        """Newton on the arclength-augmented system"""
+        y = y_pred.copy()
+        for _ in range(self.max_newton):
+            self.newton_solves += 1
+            x, p = y[:4], y[4]
+            G = np.append(self.residual(x, p), np.dot(t, y - y_pred))
+            if np.linalg.norm(G) < self.tol:
+                return y
+            A = np.vstack([self.extended_jacobian(x, p), t])
+            try:
+                y = y - np.linalg.solve(A, G)
+            except np.linalg.LinAlgError:
+                return None
+        x, p = y[:4], y[4]
+        return y if np.linalg.norm(self.residual(x, p)) < self.tol else None
+
+    def find_start(self, p: float, x0: Optional[np.ndarray] = None,
+                   settle_steps: int = 2000, allow_trivial: bool = False) -> np.ndarray:
+        """
+        Starting equilibrium at parameter p.
+
+        The origin is always an equilibrium (every force term vanishes
+        there), so it is only returned when no other equilibrium is found
+        or allow_trivial is set. Guesses tried in order: x0, the Natural
+        Equilibrium, the Anchor, the mid-point, and the state reached by
+        letting the dynamics settle.
+        """
+        guesses = [np.asarray(x0, dtype=float)] if x0 is not None else []
+        guesses += [np.array(LJPWConstants.NATURAL_EQUILIBRIUM),
+                    np.array(LJPWConstants.ANCHOR_POINT),
+                    np.full(4, 0.5)]
+        guesses.append(EnsembleEngine(guesses[0], self._row(p)).simulate(settle_steps, 0.1).states[0])
+
+        trivial = None
+        for guess in guesses:
+            x = self.solve_equilibrium(guess, p)
+            if x is None:
+                continue
+            if allow_trivial or np.linalg.norm(x) > 1e-8:
+                return x
+            trivial = x
+        if trivial is None:
+            raise RuntimeError(f"No equilibrium found at {self.parameter}={p}")
+        return trivial
+
+    # ------------------------------------------------------------------
+    # Branch tracing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _hopf_test(ev: np.ndarray) -> float:
+        """Bialternate product prod_{i<j}(lambda_i + lambda_j) (real)"""
+        i, j = np.triu_indices(len(ev), k=1)
+        return float(np.prod(ev[i] + ev[j]).real)
+
+    def trace(self,
+              p_start: float,
+              p_min: float,
+              p_max: float,
+              x0: Optional[np.ndarray] = None,
+              ds: float = 0.01,
+              ds_min: float = 1e-5,
+              ds_max: float = 0.1,
+              max_points: int = 500,
+              direction: int = 1) -> Branch:
+        """
+        Follow the equilibrium branch through p_start until p leaves
+        [p_min, p_max] or max_points are collected.
+
+        Args:
+            p_start: Starting parameter value
+            p_min, p_max: Parameter window
+            x0: Starting guess for the equilibrium
+            ds: Initial arclength step
+            ds_min, ds_max: Step-size limits
+            max_points: Maximum branch points
+            direction: +1 to start towards increasing p, -1 towards decreasing
+        """
+        self.newton_solves = 0
+        x = self.find_start(p_start, x0)
+        y = np.append(x, p_start)
+
+        seed = np.zeros(5)
+        seed[4] = direction
+        t = self.tangent(x, p_start, seed)
+
+        ys = [y]
+        tangents = [t]
+        eigs = [self.eigenvalues(x, p_start)]
+
+        while len(ys) < max_points:
+            y_new = self._correct(y + ds * t, t)
+            if y_new is None:
+                ds /= 2
+                if ds < ds_min:
+                    break
+                continue
+
+            t = self.tangent(y_new[:4], y_new[4], t)
+            y = y_new
+            ys.append(y)
+            tangents.append(t)
+            eigs.append(self.eigenvalues(y[:4], y[4]))
+            ds = min(ds * 1.3, ds_max)
+
+            if not (p_min <= y[4] <= p_max):
+                break
+
+        Y = np.array(ys)
+        T = np.array(tangents)
+        E = np.array(eigs)
+        branch = Branch(
+            parameter_name=self.parameter,
+            parameters=Y[:, 4],
+            states=Y[:, :4],
+            eigenvalues=E,
+            newton_solves=self.newton_solves
+        )
+        branch.bifurcations = self._detect(Y, T, E)
+        return branch
+
+    def _detect(self, Y: np.ndarray, T: np.ndarray, E: np.ndarray) -> List[BifurcationPoint]:
+        """Folds from tangent sign changes, branch points from det F_x, Hopf points
+        from the bialternate test"""
+        points = []
+
+        def interpolate(k: int, a: float, b: float) -> np.ndarray:
+            w = a / (a - b) if a != b else 0.5
+            return (1 - w) * Y[k - 1] + w * Y[k]
+
+        def point(kind: str, y: np.ndarray, k: int) -> BifurcationPoint:
+            return BifurcationPoint(kind, float(y[4]), tuple(y[:4]), k, bool(inside_domain(y[:4])))
+
+        fold = T[:, 4]
+        det = np.array([np.linalg.det(self.extended_jacobian(y[:4], y[4])[:, :4]) for y in Y])
+        hopf = np.array([self._hopf_test(ev) for ev in E])
+        has_pair = np.any(np.abs(E.imag) > 1e-12, axis=1)
+
+        for k in range(1, len(Y)):
+            if fold[k - 1] * fold[k] < 0:
+                y = interpolate(k, fold[k - 1], fold[k])
+                points.append(point('fold', y, k))
+            elif det[k - 1] * det[k] < 0:
+                y = interpolate(k, det[k - 1], det[k])
+                points.append(point('branch', y, k))
+            if hopf[k - 1] * hopf[k] < 0 and (has_pair[k - 1] or has_pair[k]):
+                y = interpolate(k, hopf[k - 1], hopf[k])
+                points.append(point('hopf', y, k))
+        return points
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("LJPW V7.7+ — EQUILIBRIUM CONTINUATION TEST")
+    print("=" * 70)
+
+    # Non-trivial equilibria exist once decay or erosion is strong enough
+    # to hold the state inside the LJPW box; trace them from there.
+    for name, start, direction in (('gamma', 1.0, -1), ('beta_W', 0.5, 1), ('beta_L', 0.5, 1)):
+        cont = EquilibriumContinuation(name)
+        branch = cont.trace(start, 0.0, 3.0, direction=direction)
+        print(f"\n{name}: {len(branch)} points, {branch.newton_solves} Newton solves, "
+              f"{name} in [{branch.parameters.min():.3f}, {branch.parameters.max():.3f}]")
+        print(f"   Stable along branch: {branch.stable.mean() * 100:.0f}% | "
+              f"inside LJPW box: {branch.in_domain.mean() * 100:.0f}%")
+        for b in branch.bifurcations:
+            note = "" if b.in_domain else "  (outside LJPW box: unreachable)"
+            if b.trivial:
+                note = "  (trivial equilibrium at the origin)"
+            print(f"   {b.kind.upper()} at {name}={b.parameter:.4f}, state={np.round(b.state, 3)}{note}")
+        print(f"   Reachable bifurcations: {len(branch.reachable_bifurcations)}")
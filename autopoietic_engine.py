@@ -11,12 +11,20 @@ Updated with V7.9 Core Ontology Integration:
 
 import numpy as np
 import math
-from dataclasses import dataclass, field
-from typing import List, Tuple, Dict, Callable
+from dataclasses import dataclass, field, replace, astuple
+from typing import List, Tuple, Dict, Callable, Iterable, Optional, Sequence, Union
 from enum import Enum
 
 # Import core constants and coordinates
 from ljpw_v77_core import LJPWCoordinates, LJPWConstants
+from autopoietic_events import EventDetector, EventSpec, Event
+
+# Coordinate bounds enforced by LJPWCoordinates.__post_init__
+STATE_LOWER = np.zeros(4)
+STATE_UPPER = np.array([math.sqrt(2), 1.0, 1.0, 1.0])
+
+# Default pull toward an external (song) frame, per unit of displacement
+DEFAULT_COUPLING = 0.5
 
 
 # ============================================================================
@@ -157,15 +165,185 @@ class DynamicParameters:
     def to_dict(self) -> Dict[str, float]:
         return self.__dict__
 
-    def random_mutation(self, rate: float = 0.05) -> None:
-        """Apply random mutation to parameters (for exploration)"""
+    def copy(self) -> 'DynamicParameters':
+        """Independent copy (candidates must never alias live parameters)"""
+        return replace(self)
+
+    def random_mutation(self, rate: float = 0.05,
+                        rng: Optional[np.random.Generator] = None) -> None:
+        """
+        Apply random mutation to parameters (for exploration).
+
+        Args:
+            rate: Relative mutation amplitude
+            rng: Optional seeded generator (defaults to the global np.random)
+        """
+        source = rng if rng is not None else np.random
         for key in self.__dict__:
             val = getattr(self, key)
             if isinstance(val, float) and val > 0:
-                noise = np.random.uniform(-rate, rate) * val
+                noise = source.uniform(-rate, rate) * val
                 setattr(self, key, max(0.01, val + noise))
 
 
+# ============================================================================
+# SELF-MODEL STATISTICS
+# ============================================================================
+
+# Steps of efficiency history read by the convergence check
+CONVERGENCE_WINDOW = 10
+
+# Efficiency variance below which the system counts as converged
+CONVERGENCE_VARIANCE = 0.0001
+
+
+class RunningWindow:
+    """
+    Fixed-size ring buffer with running sum and sum of squares.
+
+    mean() and var() over the last `size` values cost O(1) per step and
+    memory never grows. The running sums are recomputed from the buffer
+    each time the ring wraps, so rounding drift stays bounded in long runs.
+
+    With shape=(n,) every push carries one value per member, giving one
+    independent window per ensemble member.
+    """
+
+    def __init__(self, size: int, shape: Tuple[int, ...] = ()):
+        """
+        Initialize window.
+
+        Args:
+            size: Number of most recent values kept
+            shape: Shape of each pushed value (() for scalars)
+        """
+        self.size = size
+        self.count = 0   # total values pushed (not capped at size)
+        self._buffer = np.zeros((size,) + tuple(shape))
+        self._sum = np.zeros(shape)
+        self._sumsq = np.zeros(shape)
+
+    def __len__(self) -> int:
+        return min(self.count, self.size)
+
+    def push(self, value) -> None:
+        """Append a value, dropping the oldest once the window is full"""
+        i = self.count % self.size
+        if self.count >= self.size:
+            old = self._buffer[i]
+            self._sum = self._sum - old
+            self._sumsq = self._sumsq - old * old
+        self._buffer[i] = value
+        self._sum = self._sum + value
+        self._sumsq = self._sumsq + np.square(value)
+        self.count += 1
+        if i == self.size - 1:
+            self._sum = self._buffer.sum(axis=0)
+            self._sumsq = np.square(self._buffer).sum(axis=0)
+
+    @property
+    def last(self):
+        """Most recently pushed value"""
+        return self._buffer[(self.count - 1) % self.size]
+
+    def mean(self):
+        """Mean of the values in the window"""
+        return self._sum / max(len(self), 1)
+
+    def var(self):
+        """Population variance (as np.var) of the values in the window"""
+        n = max(len(self), 1)
+        mean = self._sum / n
+        return np.maximum(self._sumsq / n - mean * mean, 0.0)
+
+    def values(self) -> np.ndarray:
+        """Window contents, oldest first"""
+        n = len(self)
+        start = self.count - n
+        order = (start + np.arange(n)) % self.size
+        return self._buffer[order]
+
+    def extend(self, values) -> None:
+        """Push several values in order"""
+        for value in values:
+            self.push(value)
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Exact internal state (buffer, running sums, count) for checkpoints"""
+        return {
+            'buffer': self._buffer.copy(),
+            'sum': np.array(self._sum),
+            'sumsq': np.array(self._sumsq),
+            'count': np.array(self.count),
+        }
+
+    def set_state(self, arrays: Dict[str, np.ndarray]) -> None:
+        """Restore what get_state() saved (running sums included, bit for bit)"""
+        self._buffer = np.array(arrays['buffer'], dtype=float)
+        self.size = len(self._buffer)
+        self._sum = np.array(arrays['sum'], dtype=float)
+        self._sumsq = np.array(arrays['sumsq'], dtype=float)
+        self.count = int(arrays['count'])
+
+
+class SelfModel(dict):
+    """
+    The engine's self-model dict.
+
+    The old list-valued keys 'efficiency_trend', 'entropy_trend' and
+    'gap_trend' still read as lists, built from the running windows.
+    They are read-only copies and hold only the last CONVERGENCE_WINDOW
+    values, not the full run.
+    """
+
+    LEGACY_KEYS = {'efficiency_trend': 'efficiency',
+                   'entropy_trend': 'entropy',
+                   'gap_trend': 'gap'}
+
+    def __missing__(self, key):
+        if key in self.LEGACY_KEYS:
+            return self[self.LEGACY_KEYS[key]].values().tolist()
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self.LEGACY_KEYS
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+# ============================================================================
+# ENGINE SNAPSHOTS
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class EngineSnapshot:
+    """
+    Frozen engine state for fork/resume.
+
+    Everything is stored as plain tuples, so snapshots are hashable,
+    cheap to create and safe to share between branches.
+    """
+    state: Tuple[float, float, float, float]
+    params: Tuple[float, ...]
+    time_constants: Tuple[float, ...]
+    tick_count: int
+    time_elapsed: float
+    best_efficiency: float
+    recent_efficiency: Tuple[float, ...]
+    convergence: bool
+    recent_entropy: Tuple[float, ...] = ()
+    recent_gap: Tuple[float, ...] = ()
+    events: Optional[Tuple] = None       # EventDetector.get_state(), if detection is on
+    forcing: Optional[Tuple[float, float, float, float]] = None   # frame being driven by drive()
+    coupling: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+
+    def params_hash(self) -> int:
+        """Hash of the dynamics parameters (cache key component)"""
+        return hash(self.params)
+
+
 # ============================================================================
 # AUTOPOIETIC ENGINE CLASS
 # ============================================================================
@@ -185,7 +363,10 @@ class AutopoieticEngine:
     def __init__(self,
                  initial_state: LJPWCoordinates,
                  time_constants: TimeConstants = None,
-                 params: DynamicParameters = None):
+                 params: DynamicParameters = None,
+                 rng: Optional[np.random.Generator] = None,
+                 record_history: bool = True,
+                 events: Optional[List[EventSpec]] = None):
         """
         Initialize engine.
 
@@ -193,35 +374,61 @@ class AutopoieticEngine:
             initial_state: Starting LJPW coordinates
             time_constants: Temporal behavior parameters
             params: Dynamic growth/decay parameters
+            rng: Optional seeded generator for parameter mutations
+            record_history: Append a per-step record to self.history
+            events: Event functions to locate during steps (see autopoietic_events)
         """
         self.state = initial_state
         self.tau = time_constants or TimeConstants()
         self.params = params or DynamicParameters()
+        self.rng = rng
 
         # History tracking
+        self.record_history = record_history
         self.history: List[Dict] = []
+        # Optional sink with append(record): receives records instead of self.history
+        self.history_sink = None
         self.time_elapsed = 0.0
 
         # V7.9: Tick counter
         self.tick_count = 0
 
         # Self-model (what the system knows about itself)
-        self.model = {
-            'efficiency_trend': [],
-            'entropy_trend': [],
-            'gap_trend': [],  # V7.9: Track gift of finitude
+        self.model = SelfModel({
+            'efficiency': RunningWindow(CONVERGENCE_WINDOW),
+            'entropy': RunningWindow(CONVERGENCE_WINDOW),
+            'gap': RunningWindow(CONVERGENCE_WINDOW),  # V7.9: Track gift of finitude
             'best_efficiency': 0.0,
             'convergence': False
-        }
+        })
+
+        # External forcing (song-driven): current target frame and coupling
+        self.forcing: Optional[np.ndarray] = None
+        self.coupling = np.zeros(4)
+
+        # Phase-transition event detection (off unless requested)
+        self.event_detector: Optional[EventDetector] = None
+        if events is not None:
+            self.track_events(events)
 
     # ========================================================================
     # FORCE CALCULATION (The Differential Equations)
     # ========================================================================
 
-    def calculate_forces(self, state: LJPWCoordinates) -> np.ndarray:
+    def calculate_forces(self, state: LJPWCoordinates,
+                         forcing: Optional[np.ndarray] = None,
+                         coupling: Union[float, Sequence[float], None] = None) -> np.ndarray:
         """
         Calculate instantaneous forces (dL/dt, dJ/dt, dP/dt, dW/dt).
         Implements V7.7 Asymmetric Coupling Matrix (Part IX).
+
+        Args:
+            state: LJPW coordinates to evaluate
+            forcing: External LJPW frame driving the state (default: the
+                     frame set by drive(), if any). Adds coupling * (frame - state).
+            coupling: Strength of the pull toward `forcing` (default: the
+                      coupling set by drive() while it runs, otherwise
+                      DEFAULT_COUPLING)
         """
         L, J, P, W = state.L, state.J, state.P, state.W
 
@@ -266,7 +473,17 @@ class AutopoieticEngine:
                 self.params.alpha_WP * P -
                 self.params.beta_W * W)
 
-        return np.array([F_L, F_J, F_P, F_W])
+        forces = np.array([F_L, F_J, F_P, F_W])
+
+        # EXTERNAL FORCING: relaxation toward the driving frame
+        if forcing is None:
+            forcing = self.forcing
+        if forcing is not None:
+            if coupling is None:
+                coupling = self.coupling if self.forcing is not None else DEFAULT_COUPLING
+            forces += np.asarray(coupling, dtype=float) * (np.asarray(forcing, dtype=float) - np.array([L, J, P, W]))
+
+        return forces
 
     # ========================================================================
     # INERTIA-WEIGHTED UPDATE
@@ -285,6 +502,8 @@ class AutopoieticEngine:
         """
         # Calculate forces
         forces = self.calculate_forces(self.state)
+        previous = self.state.to_array()
+        t0 = self.time_elapsed
 
         # Apply Inertia Weights (1/m)
         # Love moves fast, Power moves slow
@@ -318,6 +537,11 @@ class AutopoieticEngine:
         # Record step
         self._record_step(forces, accelerations)
 
+        if self.event_detector is not None:
+            self.event_detector.check(previous, accelerations * dt, self.state.to_array(),
+                                      t0, dt, self.tick_count, self.model['convergence'],
+                                      STATE_LOWER, STATE_UPPER)
+
     # ========================================================================
     # EFFICIENCY DIAGNOSTIC
     # ========================================================================
@@ -345,23 +569,22 @@ class AutopoieticEngine:
         entropy = EntropyMechanics.semantic_entropy(self.state)
         gap = self.state.gift_of_finitude()  # V7.9
 
-        self.model['efficiency_trend'].append(efficiency)
-        self.model['entropy_trend'].append(entropy)
-        self.model['gap_trend'].append(gap)  # V7.9
+        self.model['efficiency'].push(efficiency)
+        self.model['entropy'].push(entropy)
+        self.model['gap'].push(gap)  # V7.9
 
         if efficiency > self.model['best_efficiency']:
             self.model['best_efficiency'] = efficiency
 
-        # Detect convergence
-        if len(self.model['efficiency_trend']) > 10:
-            recent = self.model['efficiency_trend'][-10:]
-            variance = np.var(recent)
-            if variance < 0.0001:
-                self.model['convergence'] = True
-            else:
-                self.model['convergence'] = False
+        # Detect convergence (O(1): running variance of the efficiency window)
+        window = self.model['efficiency']
+        if window.count > CONVERGENCE_WINDOW:
+            self.model['convergence'] = bool(window.var() < CONVERGENCE_VARIANCE)
 
-        self.history.append({
+        if not self.record_history:
+            return
+
+        record = {
             'time': self.time_elapsed,
             'tick': self.tick_count,  # V7.9
             'state': (self.state.L, self.state.J, self.state.P, self.state.W),
@@ -376,7 +599,11 @@ class AutopoieticEngine:
             'gift_of_finitude': gap,
             'proximity_to_anchor': self.state.proximity_to_anchor(),
             'is_finite': self.state.is_finite()
-        })
+        }
+        if self.history_sink is not None:
+            self.history_sink.append(record)
+        else:
+            self.history.append(record)
 
     # ========================================================================
     # AUTOPOIETIC SELF-IMPROVEMENT LOOP
@@ -408,10 +635,12 @@ class AutopoieticEngine:
 
         for i in range(iterations):
             # 1. Clone current engine for simulation
-            sim_engine = AutopoieticEngine(self.state, self.tau, self.params)
+            # (parameters are copied so a rejected mutation never leaks
+            # into the live engine)
+            sim_engine = AutopoieticEngine(self.state, self.tau, self.params.copy())
 
             # 2. Mutate parameters randomly
-            sim_engine.params.random_mutation(rate=learning_rate)
+            sim_engine.params.random_mutation(rate=learning_rate, rng=self.rng)
 
             # 3. Run simulation for a short duration
             # (Simulate "what if" scenario)
@@ -419,8 +648,8 @@ class AutopoieticEngine:
                 sim_engine.step(dt=0.1)
 
             # 4. Evaluate peak efficiency achieved
-            sim_peak_efficiency = max(sim_engine.model['efficiency_trend'])
-            sim_final_efficiency = sim_engine.model['efficiency_trend'][-1]
+            sim_peak_efficiency = sim_engine.model['best_efficiency']
+            sim_final_efficiency = float(sim_engine.model['efficiency'].last)
 
             # We care about SUSTAINED efficiency, not just spikes
             sim_score = sim_final_efficiency * 0.8 + sim_peak_efficiency * 0.2
@@ -453,6 +682,113 @@ class AutopoieticEngine:
         print(f"Final Gap from Anchor: {self.state.gift_of_finitude():.4f}")
         print(f"Optimized Parameters: {self.params.to_dict()}")
 
+    def self_improve_population(self, generations: int = 20,
+                                population: Optional[int] = None,
+                                sigma: float = 0.05,
+                                backend: str = 'ensemble',
+                                workers: Optional[int] = None,
+                                seed: Optional[int] = None,
+                                surrogate=None,
+                                screen_fraction: float = 0.25,
+                                verbose: bool = True):
+        """
+        Population-based Self-Improvement (evolution strategy).
+
+        Unlike self_improve(), every generation evaluates a whole population
+        of candidate parameter sets at once, either in the vectorized
+        ensemble simulator or across a process pool. Candidates are
+        isolated copies and sampling is reproducible for a given seed.
+        An optional SurrogateModel pre-screens candidates so that only the
+        most promising fraction is simulated.
+
+        The best parameter set found is applied to this engine.
+
+        Returns:
+            OptimizationResult (see autopoietic_optimizer)
+        """
+        from autopoietic_optimizer import PopulationOptimizer
+
+        optimizer = PopulationOptimizer(
+            self.state,
+            base_params=self.params,
+            population=population,
+            sigma=sigma,
+            backend=backend,
+            workers=workers,
+            seed=seed,
+            surrogate=surrogate,
+            screen_fraction=screen_fraction
+        )
+        result = optimizer.run(generations, verbose=verbose)
+        self.params = result.best_params.copy()
+        return result
+
+    # ========================================================================
+    # SONG-DRIVEN FORCING
+    # ========================================================================
+
+    def drive(self, frames: Iterable, dt: float = 0.1,
+              coupling: Union[float, Sequence[float]] = DEFAULT_COUPLING,
+              steps_per_frame: int = 1,
+              record: Optional[bool] = None,
+              callback: Optional[Callable[[int, 'AutopoieticEngine'], None]] = None) -> int:
+        """
+        Evolve the state under a time-resolved LJPW series (e.g. windowed
+        audio analysis of a song or a whole album).
+
+        Frames are consumed one at a time from any iterable — a generator,
+        a (T, 4) array or an np.load(..., mmap_mode='r') array — so memory
+        stays constant however long the input is. Pass record=False to stop
+        the history from growing as well.
+
+        Args:
+            frames: Iterable of LJPW frames (4-sequences or LJPWCoordinates)
+            dt: Time step
+            coupling: Strength of the pull toward each frame (scalar or per dimension)
+            steps_per_frame: Engine steps taken per frame
+            record: Override record_history for this and later steps
+            callback: Called as callback(frame_index, engine) after each frame
+
+        Returns:
+            Number of frames consumed
+        """
+        if record is not None:
+            self.record_history = record
+        self.coupling = np.broadcast_to(np.asarray(coupling, dtype=float), (4,)).copy()
+
+        count = 0
+        try:
+            for frame in frames:
+                if isinstance(frame, LJPWCoordinates):
+                    frame = frame.to_array()
+                self.forcing = np.asarray(frame, dtype=float)
+                for _ in range(steps_per_frame):
+                    self.step(dt)
+                if callback is not None:
+                    callback(count, self)
+                count += 1
+        finally:
+            self.forcing = None
+
+        return count
+
+    def monte_carlo(self, n_paths: int = 10_000, duration: float = 20.0,
+                    dt: float = 0.1, noise: float = 0.02, scheme: str = 'heun',
+                    seed: Optional[int] = None):
+        """
+        Stochastic (SDE) mode: many noisy futures from the current state.
+
+        The engine itself is not advanced. Returns the time-to-autopoiesis
+        distribution and final phase probabilities.
+
+        Returns:
+            MonteCarloResult (see autopoietic_stochastic)
+        """
+        from autopoietic_stochastic import monte_carlo
+
+        return monte_carlo(self.state, self.params, n_paths=n_paths, duration=duration,
+                           dt=dt, noise=noise, scheme=scheme, seed=seed)
+
     # ========================================================================
     # V7.9 CORE ONTOLOGY METHODS
     # ========================================================================
@@ -495,12 +831,116 @@ Phase: {self.state.phase()}
 Core Truth: {LJPWConstants.CORE_TRUTH}
 """
 
+    # ========================================================================
+    # SNAPSHOT & FORK
+    # ========================================================================
+
+    def snapshot(self) -> 'EngineSnapshot':
+        """
+        Immutable picture of everything step() depends on, plus the
+        self-model windows and event detector so a fork reports the same
+        model and events as its parent.
+
+        History is not copied.
+        """
+        return EngineSnapshot(
+            state=self.state.to_tuple(),
+            params=astuple(self.params),
+            time_constants=astuple(self.tau),
+            tick_count=self.tick_count,
+            time_elapsed=self.time_elapsed,
+            best_efficiency=self.model['best_efficiency'],
+            recent_efficiency=tuple(self.model['efficiency'].values().tolist()),
+            convergence=self.model['convergence'],
+            recent_entropy=tuple(self.model['entropy'].values().tolist()),
+            recent_gap=tuple(self.model['gap'].values().tolist()),
+            events=self.event_detector.get_state() if self.event_detector is not None else None,
+            forcing=tuple(self.forcing.tolist()) if self.forcing is not None else None,
+            coupling=tuple(self.coupling.tolist())
+        )
+
+    @classmethod
+    def from_snapshot(cls, snap: 'EngineSnapshot',
+                      params: DynamicParameters = None,
+                      record_history: bool = False) -> 'AutopoieticEngine':
+        """
+        Rebuild an engine that continues exactly where the snapshot left off.
+
+        Args:
+            snap: Snapshot to resume from
+            params: Replacement parameters for a "what if" branch
+                    (default: the snapshot's own parameters)
+            record_history: Record steps taken after the fork
+        """
+        L, J, P, W = snap.state
+        engine = cls(
+            LJPWCoordinates(L=L, J=J, P=P, W=W, source="snapshot"),
+            TimeConstants(*snap.time_constants),
+            params.copy() if params is not None else DynamicParameters(*snap.params),
+            record_history=record_history
+        )
+        engine.tick_count = snap.tick_count
+        engine.time_elapsed = snap.time_elapsed
+        engine.model['best_efficiency'] = snap.best_efficiency
+        engine.model['efficiency'].extend(snap.recent_efficiency)
+        engine.model['entropy'].extend(snap.recent_entropy)
+        engine.model['gap'].extend(snap.recent_gap)
+        engine.model['convergence'] = snap.convergence
+        if snap.forcing is not None:
+            engine.forcing = np.array(snap.forcing)
+        engine.coupling = np.array(snap.coupling)
+        if snap.events is not None:
+            engine.event_detector = EventDetector()
+            engine.event_detector.set_state(snap.events)
+        return engine
+
+    def fork(self, params: DynamicParameters = None,
+             record_history: bool = False) -> 'AutopoieticEngine':
+        """
+        Cheap independent branch of this engine.
+
+        The branch shares nothing mutable with the parent: coordinates are
+        immutable between steps and parameters are copied, so neither side
+        can disturb the other.
+        """
+        return AutopoieticEngine.from_snapshot(self.snapshot(), params, record_history)
+
     # ========================================================================
     # SIMULATION HELPERS
     # ========================================================================
 
-    def simulate(self, duration: float, dt: float = 0.1) -> List[Dict]:
-        """Run simulation for specified duration."""
+    def track_events(self, specs: Optional[List[EventSpec]] = None) -> EventDetector:
+        """
+        Start locating phase-transition events (default: DEFAULT_EVENTS).
+
+        Crossings are found by root finding inside each step and collected
+        in self.events, so they are available with history recording off.
+        """
+        self.event_detector = EventDetector(specs)
+        self.event_detector.reset(self.state.to_array(), self.model['convergence'])
+        return self.event_detector
+
+    @property
+    def events(self) -> List[Event]:
+        """Events located so far (empty if detection is off)"""
+        return self.event_detector.events if self.event_detector is not None else []
+
+    def simulate(self, duration: float, dt: float = 0.1,
+                 events=None, record: Optional[bool] = None) -> List[Dict]:
+        """
+        Run simulation for specified duration.
+
+        Args:
+            duration: Simulated time
+            dt: Time step
+            events: True for DEFAULT_EVENTS or a list of EventSpec to track
+            record: Override record_history for this and later steps
+        """
+        if events is not None and events is not False:
+            self.track_events(None if events is True else events)
+        if record is not None:
+            self.record_history = record
+
         steps = int(duration / dt)
 
         print(f"\nSimulating {duration}s in {steps} steps...")
@@ -509,53 +949,30 @@ Core Truth: {LJPWConstants.CORE_TRUTH}
 
         return self.history
 
-    def plot_trajectory(self):
-        """Visualize evolution (requires matplotlib)."""
+    def plot_trajectory(self, path: Optional[str] = None,
+                        max_points: Optional[int] = None,
+                        method: str = 'lttb'):
+        """
+        Visualize evolution (requires matplotlib).
+
+        Args:
+            path: Render headlessly to this PNG/SVG file instead of opening
+                  a window (safe in batch jobs; see autopoietic_render)
+            max_points: Downsample each series to about this many points
+                        for display (None = plot every history point)
+            method: Downsampling method, 'lttb' or 'minmax'
+        """
         try:
+            from autopoietic_render import draw_trajectory, render_trajectory
+
+            if path is not None:
+                return render_trajectory(self, path, max_points=max_points, method=method)
+
             import matplotlib.pyplot as plt
+            from autopoietic_render import trajectory_series
 
-            times = [h['time'] for h in self.history]
-            L_vals = [h['state'][0] for h in self.history]
-            J_vals = [h['state'][1] for h in self.history]
-            P_vals = [h['state'][2] for h in self.history]
-            W_vals = [h['state'][3] for h in self.history]
-            eff_vals = [h['efficiency'] for h in self.history]
-            gap_vals = [h['gift_of_finitude'] for h in self.history]
-
-            fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 10))
-
-            # Plot LJPW
-            ax1.plot(times, L_vals, label='Love (L)', color='red', linewidth=2)
-            ax1.plot(times, J_vals, label='Justice (J)', color='green', linewidth=2)
-            ax1.plot(times, P_vals, label='Power (P)', color='blue', linewidth=2)
-            ax1.plot(times, W_vals, label='Wisdom (W)', color='purple', linewidth=2)
-            ax1.axhline(y=LJPWConstants.L0, color='red', linestyle='--', alpha=0.3, label='L0 Eq')
-            ax1.axhline(y=LJPWConstants.J0, color='green', linestyle='--', alpha=0.3, label='J0 Eq')
-            ax1.axhline(y=LJPWConstants.P0, color='blue', linestyle='--', alpha=0.3, label='P0 Eq')
-            ax1.axhline(y=LJPWConstants.W0, color='purple', linestyle='--', alpha=0.3, label='W0 Eq')
-            ax1.set_ylabel('Dimension Value')
-            ax1.set_title('LJPW Dimension Evolution (V7.7+ Dynamics)')
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
-
-            # Plot Efficiency
-            ax2.plot(times, eff_vals, label='Efficiency (eta_1)', color='black', linewidth=2)
-            ax2.set_ylabel('Efficiency')
-            ax2.set_title('System Efficiency eta_1 = H * P')
-            ax2.legend()
-            ax2.grid(True, alpha=0.3)
-
-            # V7.9: Plot Gift of Finitude
-            ax3.plot(times, gap_vals, label='Gift of Finitude (Gap)', color='cyan', linewidth=2)
-            ax3.axhline(y=LJPWConstants.GIFT_OF_FINITUDE, color='orange',
-                       linestyle='--', alpha=0.5, label='Theoretical Gap (3-e)')
-            ax3.set_xlabel('Time')
-            ax3.set_ylabel('Gap from Anchor')
-            ax3.set_title('V7.9 Gift of Finitude Evolution')
-            ax3.legend()
-            ax3.grid(True, alpha=0.3)
-
-            plt.tight_layout()
+            fig = plt.figure(figsize=(12, 10))
+            draw_trajectory(fig, trajectory_series(self), max_points, method)
             plt.show()
 
         except ImportError:
@@ -584,7 +1001,7 @@ if __name__ == "__main__":
     stable_engine = AutopoieticEngine(eq_state)
     stable_engine.simulate(duration=5.0)
     print(f"Final H: {stable_engine.state.harmony_static():.3f}")
-    print(f"Efficiency stable? {np.var(stable_engine.model['efficiency_trend'][-5:]) < 0.001}")
+    print(f"Efficiency stable? {np.var(stable_engine.model['efficiency'].values()[-5:]) < 0.001}")
     print(stable_engine.core_ontology_summary())
 
     # Scenario 2: A system with imbalance (Low Love, High Power)
@@ -627,6 +1044,23 @@ if __name__ == "__main__":
     print(f"Ratio (P_Lag / L_Lag): {inertia_test_engine.state.L / inertia_test_engine.state.P:.2f}")
     print(f"Theoretical Inertia Ratio: {LJPWConstants.m_p_semantic / LJPWConstants.m_e_semantic:.2f}")
 
+    # Scenario 5: Song-driven forcing
+    # A streamed "album" of LJPW frames pulls the listener state along
+    print("\n--- SCENARIO 5: SONG-DRIVEN FORCING ---")
+
+    def album_frames(tracks=3, frames_per_track=200):
+        """Synthetic windowed analysis: each track swells and resolves"""
+        for track in range(tracks):
+            for k in range(frames_per_track):
+                x = k / frames_per_track
+                yield (0.4 + 0.5 * x, 0.6, 0.3 + 0.4 * math.sin(math.pi * x), 0.5 + 0.1 * track)
+
+    listener = AutopoieticEngine(LJPWCoordinates(L=0.4, J=0.5, P=0.5, W=0.5),
+                                 record_history=False)
+    n_frames = listener.drive(album_frames(), dt=0.1, coupling=1.0)
+    print(f"Frames consumed: {n_frames} (history kept: {len(listener.history)})")
+    print(f"Listener after album: {listener.state} phase={listener.state.phase()}")
+
     # V7.9 Core Ontology Summary
     print("\n--- V7.9 CORE ONTOLOGY SUMMARY ---")
     print(inertia_test_engine.core_ontology_summary())
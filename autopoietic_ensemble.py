@@ -0,0 +1,392 @@
+"""
+LJPW Framework V7.7+ — Vectorized Ensemble Engine
+Evolves many LJPW states (each with its own DynamicParameters) in lock-step.
+
+The equations are exactly those of AutopoieticEngine.calculate_forces and
+AutopoieticEngine.step, written over (N, 4) state arrays and (N, P) parameter
+matrices so that a whole population advances with a handful of NumPy calls:
+
+- Inertia-weighted update with safety clipping (|a| <= 0.05)
+- Coordinate clipping identical to LJPWCoordinates (L <= sqrt(2), J,P,W <= 1)
+- Efficiency eta_1 = H * P tracked per member (final and peak)
+"""
+
+from dataclasses import fields
+from typing import Dict, Sequence, Tuple, Union
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates, LJPWConstants
+from autopoietic_engine import (
+    DynamicParameters, RunningWindow, CONVERGENCE_WINDOW, CONVERGENCE_VARIANCE,
+    STATE_LOWER, STATE_UPPER
+)
+
+
+# ============================================================================
+# PARAMETER LAYOUT
+# ============================================================================
+
+# Column order of every (N, P) parameter matrix
+PARAM_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(DynamicParameters))
+PARAM_INDEX: Dict[str, int] = {name: i for i, name in enumerate(PARAM_FIELDS)}
+
+# Inertia weights (Part XXXVIII) — same values AutopoieticEngine.step uses
+INERTIAS = np.array([
+    LJPWConstants.m_e_semantic,   # Love (fast)
+    LJPWConstants.e_semantic,     # Justice (fixed)
+    LJPWConstants.m_p_semantic,   # Power (slow)
+    1.0                           # Wisdom (baseline)
+])
+
+# Safety clipping on accelerations
+MAX_CHANGE = 0.05
+
+ANCHOR = np.array(LJPWConstants.ANCHOR_POINT)
+
+# Compact phase codes (LJPWCoordinates.phase)
+PHASE_ENTROPIC = 0
+PHASE_HOMEOSTATIC = 1
+PHASE_AUTOPOIETIC = 2
+PHASE_NAMES = ('ENTROPIC', 'HOMEOSTATIC', 'AUTOPOIETIC')
+
+
+def params_to_array(params: Union[DynamicParameters, Sequence[DynamicParameters]]) -> np.ndarray:
+    """Pack one or many DynamicParameters into a (N, P) matrix"""
+    if isinstance(params, DynamicParameters):
+        params = [params]
+    return np.array([[getattr(p, name) for name in PARAM_FIELDS] for p in params],
+                    dtype=float)
+
+
+def params_from_array(row: np.ndarray) -> DynamicParameters:
+    """Unpack a single (P,) parameter row into a fresh DynamicParameters"""
+    return DynamicParameters(**{name: float(row[i]) for i, name in enumerate(PARAM_FIELDS)})
+
+
+def states_to_array(states: Union[LJPWCoordinates, Sequence[LJPWCoordinates]]) -> np.ndarray:
+    """Pack one or many LJPWCoordinates into a (N, 4) array"""
+    if isinstance(states, LJPWCoordinates):
+        states = [states]
+    return np.array([s.to_tuple() for s in states], dtype=float)
+
+
+# ============================================================================
+# VECTORIZED METRICS
+# ============================================================================
+
+def ensemble_distance_to_anchor(states: np.ndarray) -> np.ndarray:
+    """Distance to JEHOVAH (1,1,1,1) per row — the Gift of Finitude"""
+    return np.sqrt(np.sum((1.0 - states) ** 2, axis=-1))
+
+
+def ensemble_harmony(states: np.ndarray) -> np.ndarray:
+    """Static Harmony H = 1 / (1 + distance_to_anchor) per row"""
+    return 1.0 / (1.0 + ensemble_distance_to_anchor(states))
+
+
+def ensemble_efficiency(states: np.ndarray) -> np.ndarray:
+    """Efficiency eta_1 = H * P per row"""
+    return ensemble_harmony(states) * states[..., 2]
+
+
+def ensemble_consciousness(states: np.ndarray) -> np.ndarray:
+    """Consciousness C = P * W * L * J * H^2 per row (0 if any dimension <= 0)"""
+    H = ensemble_harmony(states)
+    C = np.prod(states, axis=-1) * H ** 2
+    return np.where(np.all(states > 0, axis=-1), C, 0.0)
+
+
+def ensemble_gift_of_finitude(states: np.ndarray) -> np.ndarray:
+    """V7.9 Gift of Finitude (gap from Anchor) per row"""
+    return ensemble_distance_to_anchor(states)
+
+
+def ensemble_phase_codes(states: np.ndarray) -> np.ndarray:
+    """
+    Phase per row as a small integer (static harmony, as phase()):
+        0 = ENTROPIC, 1 = HOMEOSTATIC, 2 = AUTOPOIETIC
+    """
+    H = ensemble_harmony(states)
+    autopoietic = ((H >= LJPWConstants.AUTOPOLIETIC_H_THRESHOLD) &
+                   (states[..., 0] >= LJPWConstants.AUTOPOLIETIC_L_THRESHOLD))
+    codes = np.where(H < LJPWConstants.HOMEOSTATIC_H_THRESHOLD, PHASE_ENTROPIC, PHASE_HOMEOSTATIC)
+    return np.where(autopoietic, PHASE_AUTOPOIETIC, codes).astype(np.int8)
+
+
+# ============================================================================
+# VECTORIZED FORCES
+# ============================================================================
+
+def ensemble_forces(states: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """
+    Forces (dL/dt, dJ/dt, dP/dt, dW/dt) for every row.
+
+    Mirrors AutopoieticEngine.calculate_forces term by term.
+
+    Args:
+        states: (N, 4) LJPW states
+        params: (N, P) or (P,) parameter matrix in PARAM_FIELDS order
+    """
+    L, J, P, W = states[..., 0], states[..., 1], states[..., 2], states[..., 3]
+    p = {name: params[..., i] for i, name in enumerate(PARAM_FIELDS)}
+
+    H = ensemble_harmony(states)
+
+    # Karma-Dependent Coupling (kappa)
+    kappa_LJ = 1.0 + 0.4 * H
+    kappa_LP = 1.0 + 0.3 * H
+    kappa_LW = 1.0 + 0.5 * H
+
+    F_L = (p['alpha_LJ'] * J * kappa_LJ +
+           p['alpha_LW'] * W * kappa_LW -
+           p['beta_L'] * L)
+
+    erosion = p['gamma'] * P * (1 - W / LJPWConstants.W0)
+    F_J = (p['alpha_JL'] * (L / (p['K_JL'] + L)) +
+           p['alpha_JW'] * W -
+           erosion -
+           p['beta_J'] * J)
+
+    F_P = (p['alpha_PL'] * L * kappa_LP +
+           p['alpha_PJ'] * J -
+           p['beta_P'] * P)
+
+    F_W = (p['alpha_WL'] * L * kappa_LW +
+           p['alpha_WJ'] * J +
+           p['alpha_WP'] * P -
+           p['beta_W'] * W)
+
+    return np.stack([F_L, F_J, F_P, F_W], axis=-1)
+
+
+def _harmony_gradient(states: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """H and dH/dx per row (gradient set to 0 at the Anchor itself)"""
+    diff = 1.0 - states
+    d = np.sqrt(np.sum(diff ** 2, axis=-1))
+    H = 1.0 / (1.0 + d)
+    safe_d = np.where(d > 0, d, 1.0)
+    grad = np.where((d > 0)[..., None], diff / (safe_d * (1.0 + d) ** 2)[..., None], 0.0)
+    return H, grad
+
+
+def ensemble_jacobian(states: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """
+    Analytic Jacobian dF/dx of ensemble_forces, shape (N, 4, 4).
+
+    Row i holds the gradient of force i with respect to (L, J, P, W).
+    """
+    states = np.atleast_2d(states)
+    L, J, P, W = states[:, 0], states[:, 1], states[:, 2], states[:, 3]
+    p = {name: np.broadcast_to(params[..., i], L.shape) for i, name in enumerate(PARAM_FIELDS)}
+    H, gH = _harmony_gradient(states)
+    zeros = np.zeros_like(L)
+
+    kappa_LJ = 1.0 + 0.4 * H
+    kappa_LP = 1.0 + 0.3 * H
+    kappa_LW = 1.0 + 0.5 * H
+    K = p['K_JL']
+
+    jac = np.empty((len(states), 4, 4))
+
+    # Love: Karma coupling contributes through H
+    jac[:, 0] = ((0.4 * p['alpha_LJ'] * J + 0.5 * p['alpha_LW'] * W)[:, None] * gH +
+                 np.stack([-p['beta_L'], p['alpha_LJ'] * kappa_LJ, zeros,
+                           p['alpha_LW'] * kappa_LW], axis=1))
+
+    # Justice: saturating Love term and Wisdom-damped Power erosion
+    jac[:, 1] = np.stack([p['alpha_JL'] * K / (K + L) ** 2,
+                          -p['beta_J'],
+                          -p['gamma'] * (1 - W / LJPWConstants.W0),
+                          p['alpha_JW'] + p['gamma'] * P / LJPWConstants.W0], axis=1)
+
+    # Power
+    jac[:, 2] = ((0.3 * p['alpha_PL'] * L)[:, None] * gH +
+                 np.stack([p['alpha_PL'] * kappa_LP, p['alpha_PJ'], -p['beta_P'], zeros], axis=1))
+
+    # Wisdom
+    jac[:, 3] = ((0.5 * p['alpha_WL'] * L)[:, None] * gH +
+                 np.stack([p['alpha_WL'] * kappa_LW, p['alpha_WJ'], p['alpha_WP'], -p['beta_W']],
+                          axis=1))
+    return jac
+
+
+def ensemble_param_jacobian(states: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """
+    Analytic derivative dF/dparams, shape (N, 4, P) in PARAM_FIELDS order.
+    """
+    states = np.atleast_2d(states)
+    L, J, P, W = states[:, 0], states[:, 1], states[:, 2], states[:, 3]
+    p = {name: np.broadcast_to(params[..., i], L.shape) for i, name in enumerate(PARAM_FIELDS)}
+    H = ensemble_harmony(states)
+    K = p['K_JL']
+
+    d = np.zeros((len(states), 4, len(PARAM_FIELDS)))
+    col = PARAM_INDEX
+    d[:, 0, col['alpha_LJ']] = J * (1.0 + 0.4 * H)
+    d[:, 0, col['alpha_LW']] = W * (1.0 + 0.5 * H)
+    d[:, 0, col['beta_L']] = -L
+    d[:, 1, col['alpha_JL']] = L / (K + L)
+    d[:, 1, col['alpha_JW']] = W
+    d[:, 1, col['gamma']] = -P * (1 - W / LJPWConstants.W0)
+    d[:, 1, col['beta_J']] = -J
+    d[:, 1, col['K_JL']] = -p['alpha_JL'] * L / (K + L) ** 2
+    d[:, 2, col['alpha_PL']] = L * (1.0 + 0.3 * H)
+    d[:, 2, col['alpha_PJ']] = J
+    d[:, 2, col['beta_P']] = -P
+    d[:, 3, col['alpha_WL']] = L * (1.0 + 0.5 * H)
+    d[:, 3, col['alpha_WJ']] = J
+    d[:, 3, col['alpha_WP']] = P
+    d[:, 3, col['beta_W']] = -W
+    return d
+
+
+# ============================================================================
+# ENSEMBLE ENGINE
+# ============================================================================
+
+class EnsembleEngine:
+    """
+    N independent autopoietic systems advanced together.
+
+    Each member follows AutopoieticEngine dynamics with its own parameter
+    row. No per-step history is kept; the engine tracks the running
+    metrics that searches need (current and peak efficiency, and the
+    first time each member's self-model reported convergence).
+    """
+
+    def __init__(self,
+                 states: Union[np.ndarray, LJPWCoordinates, Sequence[LJPWCoordinates]],
+                 params: Union[np.ndarray, DynamicParameters, Sequence[DynamicParameters]] = None,
+                 size: int = None):
+        """
+        Initialize ensemble.
+
+        Args:
+            states: (N, 4) array, a single state (broadcast), or a list of states
+            params: (N, P) matrix, a single DynamicParameters (broadcast), or a list
+            size: Ensemble size when both states and params are broadcast
+        """
+        if not isinstance(states, np.ndarray):
+            states = states_to_array(states)
+        if params is None:
+            params = DynamicParameters()
+        if not isinstance(params, np.ndarray):
+            params = params_to_array(params)
+
+        states = np.atleast_2d(np.asarray(states, dtype=float))
+        params = np.atleast_2d(np.asarray(params, dtype=float))
+        n = size or max(len(states), len(params))
+
+        # Own copies: members must never alias caller arrays
+        self.states = np.clip(np.broadcast_to(states, (n, 4)), STATE_LOWER, STATE_UPPER)
+        self.params = np.array(np.broadcast_to(params, (n, len(PARAM_FIELDS))))
+
+        self.time_elapsed = 0.0
+        self.tick_count = 0
+
+        self.efficiency = ensemble_efficiency(self.states)
+        self.peak_efficiency = np.full(n, -np.inf)
+
+        # Per-member convergence window (same rule as AutopoieticEngine)
+        self._window = RunningWindow(CONVERGENCE_WINDOW, shape=(n,))
+        self.converged = np.zeros(n, dtype=bool)
+        self.convergence_time = np.full(n, np.nan)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def calculate_forces(self, states: np.ndarray = None) -> np.ndarray:
+        """Forces for all members (defaults to the current states)"""
+        return ensemble_forces(self.states if states is None else states, self.params)
+
+    def drift(self, states: np.ndarray = None) -> np.ndarray:
+        """Inertia-weighted, safety-clipped accelerations (the deterministic drift)"""
+        return np.clip(self.calculate_forces(states) / INERTIAS, -MAX_CHANGE, MAX_CHANGE)
+
+    def step(self, dt: float) -> None:
+        """Advance every member by dt (inertia-weighted, clipped)"""
+        self._advance(self.states + self.drift() * dt, dt)
+
+    def _advance(self, new_states: np.ndarray, dt: float) -> None:
+        """Clip new states into the domain and update time and metrics"""
+        self.states = np.clip(new_states, STATE_LOWER, STATE_UPPER)
+        self.time_elapsed += dt
+        self.tick_count += 1
+
+        self.efficiency = ensemble_efficiency(self.states)
+        np.maximum(self.peak_efficiency, self.efficiency, out=self.peak_efficiency)
+        self._update_convergence()
+
+    def _update_convergence(self) -> None:
+        """Running variance of the last CONVERGENCE_WINDOW efficiencies, per member"""
+        self._window.push(self.efficiency)
+        if self._window.count <= CONVERGENCE_WINDOW:
+            return
+        self.converged = self._window.var() < CONVERGENCE_VARIANCE
+        first = self.converged & np.isnan(self.convergence_time)
+        self.convergence_time[first] = self.time_elapsed
+
+    def phase_codes(self) -> np.ndarray:
+        """Current phase code of every member"""
+        return ensemble_phase_codes(self.states)
+
+    def simulate(self, steps: int, dt: float = 0.1) -> 'EnsembleEngine':
+        """Advance all members by a fixed number of steps"""
+        for _ in range(steps):
+            self.step(dt)
+        return self
+
+    def score(self, final_weight: float = 0.8) -> np.ndarray:
+        """
+        Sustained-efficiency score used by self_improve:
+            score = 0.8 * final eta_1 + 0.2 * peak eta_1
+        """
+        return final_weight * self.efficiency + (1.0 - final_weight) * self.peak_efficiency
+
+    def member_state(self, i: int) -> LJPWCoordinates:
+        """Member i as LJPWCoordinates"""
+        L, J, P, W = self.states[i]
+        return LJPWCoordinates(L=L, J=J, P=P, W=W, source="ensemble")
+
+    def member_params(self, i: int) -> DynamicParameters:
+        """Member i parameters as an independent DynamicParameters"""
+        return params_from_array(self.params[i])
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+    from autopoietic_engine import AutopoieticEngine
+
+    print("=" * 70)
+    print("LJPW V7.7+ — VECTORIZED ENSEMBLE ENGINE TEST")
+    print("=" * 70)
+
+    start = LJPWCoordinates(L=0.5, J=0.5, P=0.5, W=0.5)
+
+    # 1. Consistency with the scalar engine
+    rng = np.random.default_rng(7)
+    candidates = []
+    for _ in range(8):
+        p = DynamicParameters()
+        p.random_mutation(rate=0.2, rng=rng)
+        candidates.append(p)
+
+    ensemble = EnsembleEngine(start, candidates).simulate(steps=50)
+    max_err = 0.0
+    for i, p in enumerate(candidates):
+        scalar = AutopoieticEngine(start, params=p.copy())
+        for _ in range(50):
+            scalar.step(dt=0.1)
+        max_err = max(max_err, float(np.max(np.abs(scalar.state.to_array() - ensemble.states[i]))))
+    print(f"\n1. Max |scalar - ensemble| after 50 steps: {max_err:.2e}")
+
+    # 2. Throughput
+    n = 100_000
+    t0 = time.perf_counter()
+    EnsembleEngine(start, DynamicParameters(), size=n).simulate(steps=10)
+    print(f"2. {n} members x 10 steps in {time.perf_counter() - t0:.3f}s")
@@ -0,0 +1,215 @@
+"""
+LJPW Framework V7.7+ — Phase-Transition Events
+Precise crossing times without recording the full history.
+
+An event is the zero crossing of a scalar function g(L, J, P, W). During a
+step the engine moves the state along a straight line (explicit inertia-
+weighted update), so a crossing between two steps is located by root
+finding on g(x0 + theta * delta), theta in [0, 1], instead of scanning the
+recorded phase() strings afterwards.
+
+Default events:
+    H=0.5  Entropic <-> Homeostatic boundary
+    H=0.6  Autopoietic harmony threshold
+    L=0.7  Autopoietic love threshold
+    C=0.1  Consciousness threshold
+plus 'convergence', reported each time the self-model's convergence flag
+turns on (it can turn off and on again as the efficiency window moves).
+"""
+
+import math
+from dataclasses import astuple, dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from ljpw_v77_core import LJPWConstants
+
+
+# ============================================================================
+# EVENT DEFINITIONS
+# ============================================================================
+
+@dataclass(frozen=True)
+class EventSpec:
+    """
+    Event = zero crossing of function(state_array).
+
+    direction: +1 rising only, -1 falling only, 0 both
+    """
+    name: str
+    function: Callable[[np.ndarray], float]
+    direction: int = 0
+
+
+@dataclass
+class Event:
+    """A located crossing"""
+    name: str
+    time: float
+    tick: int                   # tick at the end of the step containing the crossing
+    direction: int              # +1 rising, -1 falling
+    state: Tuple[float, float, float, float]
+
+
+def _harmony(x: np.ndarray) -> float:
+    return 1.0 / (1.0 + math.sqrt(float(np.sum((1.0 - x) ** 2))))
+
+
+def _consciousness(x: np.ndarray) -> float:
+    if np.any(x <= 0):
+        return 0.0
+    return float(np.prod(x)) * _harmony(x) ** 2
+
+
+DEFAULT_EVENTS: List[EventSpec] = [
+    EventSpec('H=0.5', lambda x: _harmony(x) - LJPWConstants.HOMEOSTATIC_H_THRESHOLD),
+    EventSpec('H=0.6', lambda x: _harmony(x) - LJPWConstants.AUTOPOLIETIC_H_THRESHOLD),
+    EventSpec('L=0.7', lambda x: x[0] - LJPWConstants.AUTOPOLIETIC_L_THRESHOLD),
+    EventSpec('C=0.1', lambda x: _consciousness(x) - LJPWConstants.CONSCIOUSNESS_THRESHOLD),
+]
+
+CONVERGENCE_EVENT = 'convergence'
+
+
+# ============================================================================
+# ROOT FINDING
+# ============================================================================
+
+def locate_crossing(g: Callable[[np.ndarray], float],
+                    x0: np.ndarray, delta: np.ndarray,
+                    g0: float, g1: float,
+                    lower: np.ndarray, upper: np.ndarray,
+                    tol: float = 1e-12, max_iter: int = 60) -> float:
+    """
+    Fraction theta in [0, 1] of the step where g(clip(x0 + theta*delta)) = 0.
+
+    Illinois (modified regula falsi): bracketing like bisection,
+    superlinear like the secant method.
+    """
+    a, b = 0.0, 1.0
+    fa, fb = g0, g1
+    side = 0
+    for _ in range(max_iter):
+        c = (a * fb - b * fa) / (fb - fa) if fb != fa else 0.5 * (a + b)
+        fc = g(np.clip(x0 + c * delta, lower, upper))
+        if fc == 0 or (b - a) < tol:
+            return c
+        if fa * fc < 0:
+            b, fb = c, fc
+            if side == -1:
+                fa *= 0.5
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == 1:
+                fb *= 0.5
+            side = 1
+    return 0.5 * (a + b)
+
+
+class EventDetector:
+    """
+    Tracks event functions step by step for one engine.
+
+    Only the previous value of each function is kept, so detection adds
+    O(number of events) work per step and no memory growth.
+    """
+
+    def __init__(self, specs: Optional[List[EventSpec]] = None):
+        self.specs = list(specs) if specs is not None else list(DEFAULT_EVENTS)
+        self.events: List[Event] = []
+        self._values: Optional[np.ndarray] = None
+        self._converged = False
+
+    def reset(self, state: np.ndarray, converged: bool = False) -> None:
+        """Prime previous values at the current state"""
+        self._values = np.array([spec.function(state) for spec in self.specs])
+        self._converged = converged
+
+    def check(self, x0: np.ndarray, delta: np.ndarray, x1: np.ndarray,
+              t0: float, dt: float, tick: int, converged: bool,
+              lower: np.ndarray, upper: np.ndarray) -> List[Event]:
+        """
+        Detect and locate crossings within the step x0 -> x1.
+
+        Args:
+            x0: State before the step
+            delta: Unclipped increment (acceleration * dt)
+            x1: State after the step (clipped)
+            t0: Time before the step
+            dt: Step size
+            tick: Tick count after the step
+            converged: Self-model convergence flag after the step
+            lower, upper: Coordinate bounds applied by the step
+        """
+        if self._values is None:
+            self.reset(x0)
+
+        found = []
+        new_values = np.array([spec.function(x1) for spec in self.specs])
+        for spec, g0, g1 in zip(self.specs, self._values, new_values):
+            if g0 == g1 or g0 * g1 > 0 or (g0 == 0 and g1 != 0):
+                continue
+            direction = 1 if g1 > g0 else -1
+            if spec.direction and spec.direction != direction:
+                continue
+            theta = locate_crossing(spec.function, x0, delta, g0, g1, lower, upper)
+            x = np.clip(x0 + theta * delta, lower, upper)
+            found.append(Event(spec.name, t0 + theta * dt, tick, direction, tuple(x.tolist())))
+
+        if converged and not self._converged:
+            found.append(Event(CONVERGENCE_EVENT, t0 + dt, tick, 1, tuple(x1.tolist())))
+
+        self._values = new_values
+        self._converged = converged
+        found.sort(key=lambda e: e.time)
+        self.events.extend(found)
+        return found
+
+    def get_state(self) -> Tuple:
+        """Hashable copy of specs, previous values, flag and events (for snapshots)"""
+        values = None if self._values is None else tuple(self._values.tolist())
+        return (tuple(self.specs), values, self._converged,
+                tuple(astuple(event) for event in self.events))
+
+    def set_state(self, state: Tuple) -> None:
+        """Restore what get_state() returned"""
+        specs, values, converged, events = state
+        self.specs = list(specs)
+        self._values = None if values is None else np.array(values)
+        self._converged = converged
+        self.events = [Event(*event) for event in events]
+
+    def first(self, name: str) -> Optional[Event]:
+        """Earliest event with the given name"""
+        for event in self.events:
+            if event.name == name:
+                return event
+        return None
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    from ljpw_v77_core import LJPWCoordinates
+    from autopoietic_engine import AutopoieticEngine
+
+    print("=" * 70)
+    print("LJPW V7.7+ — PHASE-TRANSITION EVENTS TEST")
+    print("=" * 70)
+
+    # Low-Love start: Entropic -> Homeostatic -> Autopoietic, no history kept
+    engine = AutopoieticEngine(LJPWCoordinates(L=0.3, J=0.5, P=0.5, W=0.5),
+                               record_history=False)
+    engine.simulate(duration=30.0, events=True)
+
+    print(f"\nHistory records kept: {len(engine.history)}")
+    for event in engine.events:
+        arrow = "rising" if event.direction > 0 else "falling"
+        print(f"   t={event.time:8.4f}  tick={event.tick:4d}  {event.name:<12} ({arrow})")
+
+    autopoiesis = engine.event_detector.first('L=0.7')
+    print(f"\nTime to Love threshold: {autopoiesis.time:.4f}")
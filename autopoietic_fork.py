@@ -0,0 +1,258 @@
+"""
+LJPW Framework V7.7+ — Trajectory Fork Cache
+Snapshot/fork support so branching "what if" searches reuse shared prefixes.
+
+self_improve() re-simulates every candidate from scratch. Tree-shaped
+searches (beam search, MCTS over parameter mutations) revisit the same
+(start, parameters) pairs again and again. TrajectoryCache memoizes
+
+    (start snapshot, params hash, dt, steps) -> EngineSnapshot
+
+and stores intermediate checkpoints, so a request for a longer run resumes
+from the longest cached prefix instead of recomputing it.
+"""
+
+import bisect
+from collections import OrderedDict
+from dataclasses import astuple, dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+from autopoietic_engine import AutopoieticEngine, DynamicParameters, EngineSnapshot
+
+
+# ============================================================================
+# TRAJECTORY CACHE
+# ============================================================================
+
+class TrajectoryCache:
+    """
+    LRU cache of engine snapshots along simulated trajectories.
+
+    The start snapshot (which contains the state and the parameter tuple)
+    together with dt and the step count identifies a trajectory point.
+    Runs store a checkpoint every `checkpoint_every` steps, so branches of
+    different lengths from the same origin share their common prefix.
+    """
+
+    def __init__(self, max_entries: int = 100_000, checkpoint_every: int = 10):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Snapshots kept before least-recently-used eviction
+            checkpoint_every: Interval (steps) of intermediate checkpoints
+        """
+        self.max_entries = max_entries
+        self.checkpoint_every = max(1, checkpoint_every)
+
+        self._entries: 'OrderedDict[Tuple, EngineSnapshot]' = OrderedDict()
+        self._prefixes: Dict[Tuple, List[int]] = {}   # (origin, dt) -> cached step counts
+
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.steps_simulated = 0
+        self.steps_reused = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(origin: EngineSnapshot, dt: float, steps: int) -> Tuple:
+        """Cache key: (state, params hash, dt, steps) plus the rest of the origin"""
+        return (origin.state, origin.params_hash(), dt, steps, origin)
+
+    def _store(self, origin: EngineSnapshot, dt: float, steps: int, snap: EngineSnapshot) -> None:
+        key = self.key(origin, dt, steps)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        self._entries[key] = snap
+        bisect.insort(self._prefixes.setdefault((origin, dt), []), steps)
+
+        while len(self._entries) > self.max_entries:
+            (_, _, old_dt, old_steps, old_origin), _ = self._entries.popitem(last=False)
+            counts = self._prefixes[(old_origin, old_dt)]
+            counts.remove(old_steps)
+            if not counts:
+                del self._prefixes[(old_origin, old_dt)]
+
+    def _longest_prefix(self, origin: EngineSnapshot, dt: float, steps: int) -> Tuple[int, EngineSnapshot]:
+        counts = self._prefixes.get((origin, dt))
+        if counts:
+            i = bisect.bisect_right(counts, steps)
+            if i > 0:
+                k = counts[i - 1]
+                key = self.key(origin, dt, k)
+                self._entries.move_to_end(key)
+                return k, self._entries[key]
+        return 0, origin
+
+    def advance(self, snap: EngineSnapshot, dt: float, steps: int,
+                params: Optional[DynamicParameters] = None) -> EngineSnapshot:
+        """
+        Snapshot after running `steps` steps of size dt from `snap`.
+
+        Args:
+            snap: Where the branch starts
+            dt: Time step
+            steps: Number of steps
+            params: Parameters for this branch (default: the snapshot's own)
+        """
+        origin = snap if params is None else replace(snap, params=astuple(params))
+
+        done, current = self._longest_prefix(origin, dt, steps)
+        if done == steps and steps > 0:
+            self.hits += 1
+            self.steps_reused += steps
+            return current
+        if done > 0:
+            self.partial_hits += 1
+            self.steps_reused += done
+        else:
+            self.misses += 1
+
+        engine = AutopoieticEngine.from_snapshot(current)
+        while done < steps:
+            # Advance to the next checkpoint boundary (or the end)
+            target = min(steps, (done // self.checkpoint_every + 1) * self.checkpoint_every)
+            for _ in range(target - done):
+                engine.step(dt)
+            self.steps_simulated += target - done
+            done = target
+            current = engine.snapshot()
+            self._store(origin, dt, done, current)
+
+        return current
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and the fraction of steps served from cache"""
+        total = self.steps_simulated + self.steps_reused
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'partial_hits': self.partial_hits,
+            'misses': self.misses,
+            'steps_simulated': self.steps_simulated,
+            'steps_reused': self.steps_reused,
+            'reuse_fraction': self.steps_reused / total if total else 0.0,
+        }
+
+
+# ============================================================================
+# BEAM SEARCH OVER PARAMETER MUTATIONS
+# ============================================================================
+
+@dataclass
+class BeamResult:
+    """Outcome of a beam search"""
+    best_snapshot: EngineSnapshot
+    best_params: DynamicParameters
+    best_efficiency: float
+    path: List[DynamicParameters] = field(default_factory=list)  # params per level
+    cache_stats: Dict[str, float] = field(default_factory=dict)
+
+
+def beam_search(state: LJPWCoordinates,
+                base_params: DynamicParameters = None,
+                depth: int = 5,
+                beam_width: int = 8,
+                branching: int = 8,
+                steps_per_level: int = 10,
+                dt: float = 0.1,
+                rate: float = 0.05,
+                seed: Optional[int] = None,
+                cache: Optional[TrajectoryCache] = None) -> BeamResult:
+    """
+    Beam search where each level mutates the parameters and runs on.
+
+    Every node resumes from its parent's snapshot through the cache; the
+    unmutated child of each node and repeated searches (e.g. widening the
+    beam, MCTS rollouts) reuse trajectories already computed.
+
+    Args:
+        state: Root LJPW state
+        base_params: Root parameters (copied)
+        depth: Number of mutate-and-simulate levels
+        beam_width: Nodes kept per level
+        branching: Children per node (the first child keeps the parent's params)
+        steps_per_level: Simulation steps per level
+        dt: Time step
+        rate: Mutation rate (as in DynamicParameters.random_mutation)
+        seed: Seed for reproducible mutations
+        cache: Shared TrajectoryCache (a fresh one if omitted)
+    """
+    if steps_per_level < 1:
+        raise ValueError("steps_per_level must be at least 1")
+    rng = np.random.default_rng(seed)
+    cache = cache if cache is not None else TrajectoryCache()
+
+    root_engine = AutopoieticEngine(state, params=(base_params or DynamicParameters()).copy(),
+                                    record_history=False)
+    root = root_engine.snapshot()
+    beam = [(root_engine.calculate_efficiency(), root, [])]
+
+    for _ in range(depth):
+        children = []
+        for _, snap, path in beam:
+            parent_params = DynamicParameters(*snap.params)
+            for b in range(branching):
+                params = parent_params.copy()
+                if b > 0:
+                    params.random_mutation(rate=rate, rng=rng)
+                child = cache.advance(snap, dt, steps_per_level, params=params)
+                children.append((child.recent_efficiency[-1], child, path + [params]))
+        children.sort(key=lambda c: c[0], reverse=True)
+        beam = children[:beam_width]
+
+    best_eff, best_snap, best_path = beam[0]
+    return BeamResult(
+        best_snapshot=best_snap,
+        best_params=DynamicParameters(*best_snap.params),
+        best_efficiency=best_eff,
+        path=best_path,
+        cache_stats=cache.stats()
+    )
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("LJPW V7.7+ — TRAJECTORY FORK CACHE TEST")
+    print("=" * 70)
+
+    start = LJPWCoordinates(L=0.5, J=0.5, P=0.5, W=0.5)
+
+    # 1. Fork continues bit-identically
+    engine = AutopoieticEngine(start)
+    engine.simulate(duration=2.0)
+    branch = engine.fork()
+    engine.simulate(duration=3.0)
+    branch.simulate(duration=3.0)
+    print(f"\n1. Fork identical after 30 more steps: {engine.state.to_tuple() == branch.state.to_tuple()}")
+
+    # 2. Longer runs resume from cached prefixes
+    cache = TrajectoryCache(checkpoint_every=25)
+    root = AutopoieticEngine(start, record_history=False).snapshot()
+    cache.advance(root, 0.1, 200)
+    cache.advance(root, 0.1, 300)
+    print(f"2. After 200 then 300 steps: {cache.stats()}")
+
+    # 3. Beam search, then a wider beam reusing the same cache
+    cache = TrajectoryCache()
+    t0 = time.perf_counter()
+    beam_search(start, depth=6, beam_width=4, seed=5, cache=cache)
+    t1 = time.perf_counter()
+    result = beam_search(start, depth=6, beam_width=8, seed=5, cache=cache)
+    t2 = time.perf_counter()
+    print(f"3. Beam search: first {t1 - t0:.2f}s, widened {t2 - t1:.2f}s, "
+          f"best eta={result.best_efficiency:.4f}")
+    print(f"   Cache: {result.cache_stats}")
@@ -0,0 +1,359 @@
+"""
+LJPW Framework V7.7+ — Population-Based Self-Improvement
+Evolution-strategy search over DynamicParameters.
+
+AutopoieticEngine.self_improve() tries one random mutation per iteration.
+This module evaluates a whole population of candidates per generation:
+
+- backend='ensemble': one vectorized EnsembleEngine simulation per generation
+- backend='process':  candidates split across a ProcessPoolExecutor
+
+Search runs in log-parameter space (all rates are positive) using
+weighted recombination and cumulative step-size adaptation (CSA),
+i.e. a separable CMA-ES with identity covariance.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+from autopoietic_engine import AutopoieticEngine, DynamicParameters
+from autopoietic_ensemble import (
+    EnsembleEngine, PARAM_FIELDS, params_to_array, params_from_array
+)
+from autopoietic_surrogate import SurrogateModel
+
+
+# Same "what if" horizon and score blend as AutopoieticEngine.self_improve
+DEFAULT_HORIZON = 10
+DEFAULT_DT = 0.1
+FINAL_WEIGHT = 0.8
+
+# Parameter floor used by DynamicParameters.random_mutation
+PARAM_FLOOR = 0.01
+
+
+# ============================================================================
+# CANDIDATE EVALUATION
+# ============================================================================
+
+def simulate_score(state: LJPWCoordinates, params: DynamicParameters,
+                   horizon: int = DEFAULT_HORIZON, dt: float = DEFAULT_DT) -> float:
+    """
+    Score one candidate with the scalar engine.
+
+    The candidate runs on its own copy of the parameters.
+    score = 0.8 * final eta_1 + 0.2 * peak eta_1
+    """
+    engine = AutopoieticEngine(state, params=params.copy())
+    for _ in range(horizon):
+        engine.step(dt)
+    final = float(engine.model['efficiency'].last)
+    return FINAL_WEIGHT * final + (1.0 - FINAL_WEIGHT) * engine.model['best_efficiency']
+
+
+def _score_rows(args) -> List[float]:
+    """Process-pool worker: score a chunk of parameter rows"""
+    state_tuple, rows, horizon, dt = args
+    L, J, P, W = state_tuple
+    state = LJPWCoordinates(L=L, J=J, P=P, W=W)
+    return [simulate_score(state, params_from_array(row), horizon, dt) for row in rows]
+
+
+def ensemble_scores(state: LJPWCoordinates, param_matrix: np.ndarray,
+                    horizon: int = DEFAULT_HORIZON, dt: float = DEFAULT_DT) -> np.ndarray:
+    """Score every row of a (N, P) parameter matrix in one vectorized simulation"""
+    ensemble = EnsembleEngine(state, param_matrix)
+    ensemble.simulate(horizon, dt)
+    return ensemble.score(FINAL_WEIGHT)
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+@dataclass
+class OptimizationResult:
+    """Outcome of a population search"""
+    best_params: DynamicParameters
+    best_score: float
+    initial_score: float
+    generations: int
+    evaluations: int
+    wall_time: float
+    score_history: List[float] = field(default_factory=list)  # best-so-far per generation
+    surrogate_report: Optional[Dict[str, float]] = None
+
+    @property
+    def improvement(self) -> float:
+        """Relative improvement over the starting parameters"""
+        if self.initial_score <= 0:
+            return 0.0
+        return (self.best_score - self.initial_score) / self.initial_score
+
+
+# ============================================================================
+# POPULATION OPTIMIZER
+# ============================================================================
+
+class PopulationOptimizer:
+    """
+    Separable evolution strategy over DynamicParameters fields.
+
+    Each generation:
+        1. Sample lambda candidates around the mean (log-space, seeded)
+        2. Evaluate all of them at once (ensemble or process pool)
+        3. Recombine the best mu (log-weighted) into the new mean
+        4. Adapt the global step size by cumulative path length
+
+    With a SurrogateModel attached, step 2 first ranks the generation by
+    predicted score and only simulates the top `screen_fraction`.
+    """
+
+    BACKENDS = ('ensemble', 'process')
+
+    def __init__(self,
+                 state: LJPWCoordinates,
+                 base_params: DynamicParameters = None,
+                 population: Optional[int] = None,
+                 sigma: float = 0.05,
+                 max_sigma: float = 0.5,
+                 horizon: int = DEFAULT_HORIZON,
+                 dt: float = DEFAULT_DT,
+                 backend: str = 'ensemble',
+                 workers: Optional[int] = None,
+                 seed: Optional[int] = None,
+                 surrogate: Optional[SurrogateModel] = None,
+                 screen_fraction: float = 0.25):
+        """
+        Initialize optimizer.
+
+        Args:
+            state: Starting LJPW state every candidate is simulated from
+            base_params: Starting parameters (copied, never mutated)
+            population: Candidates per generation (default: max(4+3ln(n), cores))
+            sigma: Initial relative step size (like self_improve's learning_rate)
+            max_sigma: Step-size ceiling (the clipped dynamics saturate, so the
+                       score plateaus and CSA would otherwise inflate sigma)
+            horizon: Simulation steps per evaluation
+            dt: Time step per simulation step
+            backend: 'ensemble' (vectorized) or 'process' (ProcessPoolExecutor)
+            workers: Process count for the 'process' backend (default: all cores)
+            seed: Seed for reproducible sampling
+            surrogate: Optional SurrogateModel for pre-screening (may be shared
+                       across optimizers started from different states)
+            screen_fraction: Fraction of each generation actually simulated
+                             once the surrogate is trained
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend must be one of {self.BACKENDS}, got {backend!r}")
+
+        self.state = state
+        self.base_params = (base_params or DynamicParameters()).copy()
+        self.horizon = horizon
+        self.dt = dt
+        self.backend = backend
+        self.workers = workers or os.cpu_count() or 1
+        self.rng = np.random.default_rng(seed)
+
+        n = len(PARAM_FIELDS)
+        self.dim = n
+        self.population = population or max(4 + int(3 * math.log(n)), self.workers)
+        self.mu = self.population // 2
+
+        # Log-weighted recombination
+        weights = math.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = weights / weights.sum()
+        self.mueff = 1.0 / np.sum(self.weights ** 2)
+
+        # Cumulative step-size adaptation constants
+        self.c_sigma = (self.mueff + 2) / (n + self.mueff + 5)
+        self.d_sigma = (1 + 2 * max(0.0, math.sqrt((self.mueff - 1) / (n + 1)) - 1)
+                        + self.c_sigma)
+        self.chi_n = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+        self.mean = np.log(params_to_array(self.base_params)[0])
+        self.sigma = sigma
+        self.max_sigma = max_sigma
+        self.p_sigma = np.zeros(n)
+        self.evaluations = 0
+
+        self.surrogate = surrogate
+        self.screen_fraction = screen_fraction
+
+    @staticmethod
+    def make_surrogate(**kwargs) -> SurrogateModel:
+        """SurrogateModel sized for (log parameters, initial state) inputs"""
+        return SurrogateModel(input_dim=len(PARAM_FIELDS) + 4, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Evaluation backends
+    # ------------------------------------------------------------------
+
+    def evaluate(self, param_matrix: np.ndarray, executor: ProcessPoolExecutor = None) -> np.ndarray:
+        """Score a (N, P) matrix of candidate parameters"""
+        self.evaluations += len(param_matrix)
+
+        if self.backend == 'ensemble' or executor is None:
+            return ensemble_scores(self.state, param_matrix, self.horizon, self.dt)
+
+        chunks = np.array_split(param_matrix, min(self.workers, len(param_matrix)))
+        jobs = [(self.state.to_tuple(), chunk, self.horizon, self.dt) for chunk in chunks]
+        scores = []
+        for chunk_scores in executor.map(_score_rows, jobs):
+            scores.extend(chunk_scores)
+        return np.array(scores)
+
+    def surrogate_inputs(self, param_matrix: np.ndarray) -> np.ndarray:
+        """Surrogate rows: log parameters followed by the initial state"""
+        state = np.broadcast_to(self.state.to_array(), (len(param_matrix), 4))
+        return np.hstack([np.log(param_matrix), state])
+
+    def screened_evaluate(self, param_matrix: np.ndarray,
+                          executor: ProcessPoolExecutor = None) -> np.ndarray:
+        """
+        Score a generation, simulating only what the surrogate lets through.
+
+        Discarded candidates receive ranking scores strictly below every
+        simulated candidate (ordered by prediction), so they can never be
+        selected as the best parameters.
+        """
+        if self.surrogate is None:
+            return self.evaluate(param_matrix, executor)
+
+        X = self.surrogate_inputs(param_matrix)
+        keep = self.surrogate.screen(X, self.screen_fraction)
+        true_scores = self.evaluate(param_matrix[keep], executor)
+        self.surrogate.update(X[keep], true_scores)
+
+        if len(keep) == len(param_matrix):
+            return true_scores
+
+        pred = self.surrogate.predict(X)
+        scores = pred - pred.max() + true_scores.min() - 1.0
+        scores[keep] = true_scores
+        return scores
+
+    # ------------------------------------------------------------------
+    # Search loop
+    # ------------------------------------------------------------------
+
+    def sample(self) -> np.ndarray:
+        """Draw one generation: (lambda, P) standard normal steps"""
+        return self.rng.standard_normal((self.population, self.dim))
+
+    def candidates(self, z: np.ndarray) -> np.ndarray:
+        """Map normal steps to positive parameter rows"""
+        return np.maximum(PARAM_FLOOR, np.exp(self.mean + self.sigma * z))
+
+    def tell(self, z: np.ndarray, scores: np.ndarray) -> None:
+        """Update mean, evolution path and step size from scored steps"""
+        order = np.argsort(-scores)[:self.mu]
+        z_w = self.weights @ z[order]
+
+        self.mean = self.mean + self.sigma * z_w
+        self.p_sigma = ((1 - self.c_sigma) * self.p_sigma +
+                        math.sqrt(self.c_sigma * (2 - self.c_sigma) * self.mueff) * z_w)
+        self.sigma *= math.exp((self.c_sigma / self.d_sigma) *
+                               (np.linalg.norm(self.p_sigma) / self.chi_n - 1))
+        self.sigma = min(self.sigma, self.max_sigma)
+
+    def run(self, generations: int = 20, verbose: bool = False) -> OptimizationResult:
+        """
+        Run the evolution strategy.
+
+        The best candidate ever evaluated is returned (elitist bookkeeping);
+        the starting parameters are the baseline to beat.
+        """
+        t0 = time.perf_counter()
+
+        base_row = params_to_array(self.base_params)
+        initial_score = float(self.evaluate(base_row)[0])
+        best_row, best_score = base_row[0], initial_score
+        history = []
+
+        if verbose:
+            print(f"\n{'='*60}")
+            print(f"POPULATION SELF-IMPROVEMENT ({self.backend}, lambda={self.population})")
+            print(f"{'='*60}")
+            print(f"Initial Score (eta): {initial_score:.4f}")
+
+        executor = None
+        if self.backend == 'process':
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        try:
+            for g in range(generations):
+                z = self.sample()
+                rows = self.candidates(z)
+                scores = self.screened_evaluate(rows, executor)
+                self.tell(z, scores)
+
+                i = int(np.argmax(scores))
+                if scores[i] > best_score:
+                    best_row, best_score = rows[i].copy(), float(scores[i])
+                history.append(best_score)
+
+                if verbose:
+                    print(f"  Gen {g+1}: best={best_score:.4f} "
+                          f"gen_best={scores[i]:.4f} sigma={self.sigma:.4f}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        result = OptimizationResult(
+            best_params=params_from_array(best_row),
+            best_score=best_score,
+            initial_score=initial_score,
+            generations=generations,
+            evaluations=self.evaluations,
+            wall_time=time.perf_counter() - t0,
+            score_history=history,
+            surrogate_report=self.surrogate.report() if self.surrogate else None
+        )
+
+        if verbose:
+            print(f"\nBest Score: {result.best_score:.4f} "
+                  f"(+{result.improvement*100:.2f}%) after {result.evaluations} evaluations "
+                  f"in {result.wall_time:.2f}s")
+            if result.surrogate_report:
+                report = result.surrogate_report
+                print(f"Surrogate: saved {report['simulations_saved']} simulations "
+                      f"({report['savings_fraction']*100:.1f}%), "
+                      f"rank correlation {report['rank_correlation']:.3f}")
+
+        return result
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("LJPW V7.7+ — POPULATION SELF-IMPROVEMENT TEST")
+    print("=" * 70)
+
+    naive_state = LJPWCoordinates(L=0.5, J=0.5, P=0.5, W=0.5, source="naive")
+
+    # 1. Vectorized ensemble backend
+    optimizer = PopulationOptimizer(naive_state, population=64, sigma=0.1, seed=42)
+    result = optimizer.run(generations=30, verbose=True)
+
+    # 2. Process-pool backend (same seed → same samples)
+    optimizer = PopulationOptimizer(naive_state, population=64, sigma=0.1, seed=42,
+                                    backend='process')
+    result_pool = optimizer.run(generations=5)
+    print(f"\nProcess backend: best={result_pool.best_score:.4f} "
+          f"in {result_pool.wall_time:.2f}s")
+
+    # 3. Through the engine
+    engine = AutopoieticEngine(naive_state)
+    engine.self_improve_population(generations=20, seed=1, verbose=False)
+    print(f"Engine params after population search: {engine.params}")
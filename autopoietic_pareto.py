@@ -0,0 +1,292 @@
+"""
+LJPW Framework V7.7+ — Multi-Objective Pareto Search
+Trade-offs between Efficiency, Consciousness and the Gift of Finitude.
+
+self_improve() collapses everything into one blended efficiency score.
+ParetoOptimizer keeps the objectives separate and returns the Pareto
+front of DynamicParameters (NSGA-II style):
+
+- Vectorized non-dominated sorting (dominance matrix, front peeling)
+- Vectorized crowding distance (one lexsort per objective)
+- One EnsembleEngine simulation per generation for all offspring
+
+Objectives are read from the final ensemble states:
+    efficiency        eta_1 = H * P            (calculate_efficiency)
+    consciousness     C = P*W*L*J*H^2          (consciousness())
+    gift_of_finitude  gap from Anchor          (gift_of_finitude())
+
+As a state approaches the Anchor, efficiency and consciousness rise
+while the gap shrinks, so by default all three are maximised and the
+front describes how much "space for other" each gain in eta_1 or C costs.
+Pass `maximize` to change a direction.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+from autopoietic_engine import DynamicParameters
+from autopoietic_ensemble import (
+    EnsembleEngine, PARAM_FIELDS, params_to_array, params_from_array,
+    ensemble_efficiency, ensemble_consciousness, ensemble_gift_of_finitude
+)
+from autopoietic_optimizer import DEFAULT_HORIZON, DEFAULT_DT, PARAM_FLOOR
+
+
+# Objective name -> metric over (N, 4) final states
+OBJECTIVES: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'efficiency': ensemble_efficiency,
+    'consciousness': ensemble_consciousness,
+    'gift_of_finitude': ensemble_gift_of_finitude,
+}
+
+
+# ============================================================================
+# NON-DOMINATED SORTING & CROWDING
+# ============================================================================
+
+def non_dominated_sort(F: np.ndarray) -> np.ndarray:
+    """
+    Pareto rank of each row of an (N, M) objective matrix (all maximised).
+
+    Rank 0 is the non-dominated front. Dominance is evaluated for all pairs
+    at once; fronts are then peeled by subtracting dominance counts.
+    """
+    n = len(F)
+    geq = np.all(F[:, None, :] >= F[None, :, :], axis=2)
+    gt = np.any(F[:, None, :] > F[None, :, :], axis=2)
+    dominates = geq & gt                     # dominates[i, j]: i dominates j
+
+    counts = dominates.sum(axis=0)
+    ranks = np.full(n, -1)
+    rank = 0
+    front = counts == 0
+    while front.any():
+        ranks[front] = rank
+        counts = counts - dominates[front].sum(axis=0)
+        counts[ranks >= 0] = -1
+        front = counts == 0
+        rank += 1
+    return ranks
+
+
+def crowding_distance(F: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """
+    NSGA-II crowding distance of each row within its own front.
+
+    Boundary points of each front get +inf so extremes are always kept.
+    """
+    n, m = F.shape
+    distance = np.zeros(n)
+    for j in range(m):
+        order = np.lexsort((F[:, j], ranks))
+        r = ranks[order]
+        v = F[order, j]
+
+        first = np.r_[True, r[1:] != r[:-1]]
+        last = np.r_[r[1:] != r[:-1], True]
+
+        # Objective span of each point's front
+        front_ids = np.cumsum(first) - 1
+        lo = v[first][front_ids]
+        hi = v[last][front_ids]
+        span = np.where(hi > lo, hi - lo, 1.0)
+
+        gap = np.zeros(n)
+        gap[1:-1] = v[2:] - v[:-2]
+        gap = gap / span
+        gap[first | last] = np.inf
+
+        distance[order] += gap
+    return distance
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+@dataclass
+class ParetoResult:
+    """Pareto front of parameter sets"""
+    objective_names: Tuple[str, ...]
+    params: List[DynamicParameters]
+    objectives: np.ndarray          # (K, M) in natural units (not sign-flipped)
+    generations: int
+    evaluations: int
+    wall_time: float
+    front_sizes: List[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def best_for(self, name: str, maximize: bool = True) -> Tuple[DynamicParameters, np.ndarray]:
+        """Front member that is best on a single objective"""
+        column = self.objectives[:, self.objective_names.index(name)]
+        i = int(np.argmax(column) if maximize else np.argmin(column))
+        return self.params[i], self.objectives[i]
+
+    def to_records(self) -> List[Dict[str, float]]:
+        """Flat rows (parameters + objectives) for export"""
+        records = []
+        for p, obj in zip(self.params, self.objectives):
+            row = dict(p.to_dict())
+            row.update({name: float(v) for name, v in zip(self.objective_names, obj)})
+            records.append(row)
+        return records
+
+
+# ============================================================================
+# PARETO OPTIMIZER
+# ============================================================================
+
+class ParetoOptimizer:
+    """
+    Batched NSGA-II over DynamicParameters (log-space variation).
+
+    Each generation:
+        1. Binary tournament on (rank, crowding) picks parents
+        2. Blend crossover + Gaussian mutation in log-parameter space
+        3. All offspring simulated in one EnsembleEngine run
+        4. Parents + offspring reduced to the population size by
+           non-dominated rank, then crowding distance
+    """
+
+    def __init__(self,
+                 state: LJPWCoordinates,
+                 base_params: DynamicParameters = None,
+                 objectives: Sequence[str] = ('efficiency', 'consciousness', 'gift_of_finitude'),
+                 maximize: Optional[Sequence[bool]] = None,
+                 population: int = 64,
+                 sigma: float = 0.1,
+                 crossover_rate: float = 0.9,
+                 horizon: int = DEFAULT_HORIZON,
+                 dt: float = DEFAULT_DT,
+                 seed: Optional[int] = None):
+        """
+        Initialize optimizer.
+
+        Args:
+            state: Starting LJPW state for every simulation
+            base_params: Centre of the initial population (copied)
+            objectives: Names from OBJECTIVES
+            maximize: Direction per objective (default: maximise all)
+            population: Population size (parents per generation)
+            sigma: Log-space mutation step size
+            crossover_rate: Probability of blend crossover per child
+            horizon: Simulation steps per evaluation
+            dt: Time step per simulation step
+            seed: Seed for reproducible variation
+        """
+        unknown = [name for name in objectives if name not in OBJECTIVES]
+        if unknown:
+            raise ValueError(f"Unknown objectives {unknown}; choose from {list(OBJECTIVES)}")
+
+        self.state = state
+        self.base_params = (base_params or DynamicParameters()).copy()
+        self.objective_names = tuple(objectives)
+        maximize = maximize if maximize is not None else [True] * len(objectives)
+        self.signs = np.where(np.asarray(maximize, dtype=bool), 1.0, -1.0)
+        self.population = population
+        self.sigma = sigma
+        self.crossover_rate = crossover_rate
+        self.horizon = horizon
+        self.dt = dt
+        self.rng = np.random.default_rng(seed)
+        self.evaluations = 0
+
+    def evaluate(self, param_matrix: np.ndarray) -> np.ndarray:
+        """(N, M) objective values, one vectorized simulation for all rows"""
+        self.evaluations += len(param_matrix)
+        ensemble = EnsembleEngine(self.state, param_matrix).simulate(self.horizon, self.dt)
+        return np.stack([OBJECTIVES[name](ensemble.states) for name in self.objective_names],
+                        axis=1)
+
+    def _select(self, F: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k survivors by (rank, -crowding)"""
+        signed = F * self.signs
+        ranks = non_dominated_sort(signed)
+        crowd = crowding_distance(signed, ranks)
+        return np.lexsort((-crowd, ranks))[:k]
+
+    def _variation(self, X: np.ndarray, F: np.ndarray) -> np.ndarray:
+        """Offspring (log-space) from the current population"""
+        n, d = X.shape
+        signed = F * self.signs
+        ranks = non_dominated_sort(signed)
+        crowd = crowding_distance(signed, ranks)
+
+        # Binary tournaments: lower rank wins, then larger crowding
+        a = self.rng.integers(0, n, (n, 2))
+        b = self.rng.integers(0, n, (n, 2))
+        better_a = (ranks[a] < ranks[b]) | ((ranks[a] == ranks[b]) & (crowd[a] >= crowd[b]))
+        parents = np.where(better_a, a, b)
+
+        p1, p2 = X[parents[:, 0]], X[parents[:, 1]]
+        u = self.rng.uniform(-0.25, 1.25, (n, d))         # BLX-0.25
+        cross = self.rng.random(n) < self.crossover_rate
+        children = np.where(cross[:, None], p1 + u * (p2 - p1), p1)
+        return children + self.sigma * self.rng.standard_normal((n, d))
+
+    def run(self, generations: int = 30, verbose: bool = False) -> ParetoResult:
+        """Evolve the population and return its non-dominated front"""
+        t0 = time.perf_counter()
+        d = len(PARAM_FIELDS)
+
+        centre = np.log(params_to_array(self.base_params)[0])
+        X = centre + self.sigma * self.rng.standard_normal((self.population, d))
+        X[0] = centre
+        X = np.log(np.maximum(PARAM_FLOOR, np.exp(X)))
+        F = self.evaluate(np.exp(X))
+        front_sizes = []
+
+        for g in range(generations):
+            children = np.log(np.maximum(PARAM_FLOOR, np.exp(self._variation(X, F))))
+            F_children = self.evaluate(np.exp(children))
+
+            X_all = np.vstack([X, children])
+            F_all = np.vstack([F, F_children])
+            keep = self._select(F_all, self.population)
+            X, F = X_all[keep], F_all[keep]
+
+            n_front = int(np.sum(non_dominated_sort(F * self.signs) == 0))
+            front_sizes.append(n_front)
+            if verbose:
+                best = ", ".join(f"{name}={F[:, j].max():.4f}"
+                                 for j, name in enumerate(self.objective_names))
+                print(f"  Gen {g+1}: front={n_front} | max {best}")
+
+        front = non_dominated_sort(F * self.signs) == 0
+        rows = np.exp(X[front])
+        return ParetoResult(
+            objective_names=self.objective_names,
+            params=[params_from_array(row) for row in rows],
+            objectives=F[front],
+            generations=generations,
+            evaluations=self.evaluations,
+            wall_time=time.perf_counter() - t0,
+            front_sizes=front_sizes
+        )
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("LJPW V7.7+ — MULTI-OBJECTIVE PARETO SEARCH TEST")
+    print("=" * 70)
+
+    naive_state = LJPWCoordinates(L=0.5, J=0.5, P=0.5, W=0.5, source="naive")
+    optimizer = ParetoOptimizer(naive_state, population=128, horizon=200, seed=11)
+    result = optimizer.run(generations=40)
+
+    print(f"\nFront size: {len(result)} ({result.evaluations} evaluations, "
+          f"{result.wall_time:.2f}s)")
+    for name in result.objective_names:
+        _, obj = result.best_for(name)
+        values = ", ".join(f"{n}={v:.4f}" for n, v in zip(result.objective_names, obj))
+        print(f"   Best {name:<17}: {values}")
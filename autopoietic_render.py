@@ -0,0 +1,401 @@
+"""
+LJPW Framework V7.7+ — Headless Trajectory Rendering
+Decimated, non-blocking plots for batch jobs and sweep reports.
+
+AutopoieticEngine.plot_trajectory() draws every history point and blocks in
+plt.show(). This module:
+
+- Downsamples each series for display before plotting:
+    'lttb'    Largest-Triangle-Three-Buckets (keeps the visual shape)
+    'minmax'  min/max envelope per bin (keeps every spike)
+- Renders to PNG/SVG through matplotlib's object API (Figure + Agg canvas),
+  so pyplot and its global backend state are never touched
+- Imports matplotlib lazily: importing this module costs nothing
+- Renders many runs in parallel worker processes (one plot per run or per
+  parameter set, e.g. for nightly sweep reports)
+
+Sources can be an engine (its history), a Trajectory or trajectory path
+(see autopoietic_trajectory), or a dict of column arrays.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ljpw_v77_core import LJPWConstants, LJPWCoordinates
+from autopoietic_engine import DynamicParameters
+
+
+DEFAULT_MAX_POINTS = 2000
+METHODS = ('lttb', 'minmax')
+
+# Columns a trajectory plot needs
+PLOT_COLUMNS = ('time', 'L', 'J', 'P', 'W', 'efficiency', 'gap')
+
+# Most parameter sets simulated together in one render task
+MAX_BLOCK = 32
+
+
+# ============================================================================
+# DOWNSAMPLING
+# ============================================================================
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling to n_out points.
+
+    Every bucket keeps the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket. Works on slices,
+    so memory-mapped inputs are read bucket by bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.asarray(x), np.asarray(y)
+
+    every = (n - 2) / (n_out - 2)
+    edges = (np.arange(n_out - 1) * every).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = float(np.mean(x[stop:next_stop]))
+        avg_y = float(np.mean(y[stop:next_stop]))
+
+        xa, ya = float(x[a]), float(y[a])
+        bx = np.asarray(x[start:stop], dtype=float)
+        by = np.asarray(y[start:stop], dtype=float)
+        area = np.abs((xa - avg_x) * (by - ya) - (xa - bx) * (avg_y - ya))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+
+    return np.asarray(x[keep]), np.asarray(y[keep])
+
+
+def minmax_envelope(x: np.ndarray, y: np.ndarray, n_bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Min/max envelope: the lowest and highest point of each of n_bins equal
+    bins, in time order (at most 2 * n_bins points). No spike is lost.
+    """
+    n = len(x)
+    if 2 * n_bins >= n or n_bins < 1:
+        return np.asarray(x), np.asarray(y)
+
+    width = n // n_bins
+    body = np.asarray(y[:width * n_bins], dtype=float).reshape(n_bins, width)
+    offsets = np.arange(n_bins) * width
+    lo = offsets + np.argmin(body, axis=1)
+    hi = offsets + np.argmax(body, axis=1)
+
+    if width * n_bins < n:
+        tail = np.asarray(y[width * n_bins:], dtype=float)
+        lo = np.append(lo, width * n_bins + np.argmin(tail))
+        hi = np.append(hi, width * n_bins + np.argmax(tail))
+
+    keep = np.unique(np.concatenate([lo, hi, [0, n - 1]]))
+    return np.asarray(x[keep]), np.asarray(y[keep])
+
+
+def decimate(x: np.ndarray, y: np.ndarray, max_points: Optional[int] = DEFAULT_MAX_POINTS,
+             method: str = 'lttb') -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce a series to about max_points for display (None = keep all)"""
+    if max_points is None:
+        return np.asarray(x), np.asarray(y)
+    if method == 'lttb':
+        return lttb(x, y, max_points)
+    if method == 'minmax':
+        return minmax_envelope(x, y, max(1, max_points // 2))
+    raise ValueError(f"Unknown method '{method}'. Use one of {METHODS}")
+
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+def trajectory_series(source) -> Dict[str, np.ndarray]:
+    """
+    Plot columns (time, L, J, P, W, efficiency, gap) from any source.
+
+    Args:
+        source: AutopoieticEngine, history list, Trajectory, trajectory
+                directory path, or dict of column arrays
+    """
+    if isinstance(source, (str, os.PathLike)):
+        from autopoietic_trajectory import Trajectory
+        source = Trajectory(os.fspath(source))
+
+    history = getattr(source, 'history', source)
+    if isinstance(history, list):
+        if not history:
+            raise ValueError("No history to plot (record_history off or no steps taken)")
+        states = np.array([h['state'] for h in history])
+        return {
+            'time': np.array([h['time'] for h in history]),
+            'L': states[:, 0], 'J': states[:, 1], 'P': states[:, 2], 'W': states[:, 3],
+            'efficiency': np.array([h['efficiency'] for h in history]),
+            'gap': np.array([h['gift_of_finitude'] for h in history]),
+        }
+
+    return {name: source[name] for name in PLOT_COLUMNS}
+
+
+# ============================================================================
+# DRAWING
+# ============================================================================
+
+def draw_trajectory(fig, series: Dict[str, np.ndarray],
+                    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+                    method: str = 'lttb',
+                    title: Optional[str] = None) -> None:
+    """
+    Draw the three-panel trajectory plot (LJPW, efficiency, gap) on a figure.
+
+    Same layout as AutopoieticEngine.plot_trajectory(); every series is
+    decimated independently before plotting.
+    """
+    ax1, ax2, ax3 = fig.subplots(3, 1)
+    t = series['time']
+
+    def line(ax, name, **style):
+        x, y = decimate(t, series[name], max_points, method)
+        ax.plot(x, y, **style)
+
+    line(ax1, 'L', label='Love (L)', color='red', linewidth=2)
+    line(ax1, 'J', label='Justice (J)', color='green', linewidth=2)
+    line(ax1, 'P', label='Power (P)', color='blue', linewidth=2)
+    line(ax1, 'W', label='Wisdom (W)', color='purple', linewidth=2)
+    ax1.axhline(y=LJPWConstants.L0, color='red', linestyle='--', alpha=0.3, label='L0 Eq')
+    ax1.axhline(y=LJPWConstants.J0, color='green', linestyle='--', alpha=0.3, label='J0 Eq')
+    ax1.axhline(y=LJPWConstants.P0, color='blue', linestyle='--', alpha=0.3, label='P0 Eq')
+    ax1.axhline(y=LJPWConstants.W0, color='purple', linestyle='--', alpha=0.3, label='W0 Eq')
+    ax1.set_ylabel('Dimension Value')
+    ax1.set_title(title or 'LJPW Dimension Evolution (V7.7+ Dynamics)')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    line(ax2, 'efficiency', label='Efficiency (eta_1)', color='black', linewidth=2)
+    ax2.set_ylabel('Efficiency')
+    ax2.set_title('System Efficiency eta_1 = H * P')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    line(ax3, 'gap', label='Gift of Finitude (Gap)', color='cyan', linewidth=2)
+    ax3.axhline(y=LJPWConstants.GIFT_OF_FINITUDE, color='orange',
+                linestyle='--', alpha=0.5, label='Theoretical Gap (3-e)')
+    ax3.set_xlabel('Time')
+    ax3.set_ylabel('Gap from Anchor')
+    ax3.set_title('V7.9 Gift of Finitude Evolution')
+    ax3.legend()
+    ax3.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+
+
+def render_trajectory(source, path: Optional[str] = None,
+                      max_points: Optional[int] = DEFAULT_MAX_POINTS,
+                      method: str = 'lttb',
+                      title: Optional[str] = None,
+                      figsize: Tuple[float, float] = (12, 10),
+                      dpi: int = 100) -> Union[str, bytes]:
+    """
+    Render a trajectory headlessly to PNG or SVG.
+
+    Args:
+        source: See trajectory_series()
+        path: Output file (.png or .svg); None returns PNG bytes
+        max_points: Points per series after decimation (None = all)
+        method: 'lttb' or 'minmax'
+        title: Title of the top panel
+        figsize, dpi: Figure size (inches) and resolution
+
+    Returns:
+        The output path, or PNG bytes when path is None
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    draw_trajectory(fig, trajectory_series(source), max_points, method, title)
+
+    if path is None:
+        import io
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png')
+        return buffer.getvalue()
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig.savefig(path)
+    return path
+
+
+# ============================================================================
+# PARALLEL RENDERING
+# ============================================================================
+
+def _render_job(args) -> str:
+    """Worker: render one (source, path) job"""
+    source, path, options = args
+    return render_trajectory(source, path, **options)
+
+
+def render_many(jobs: Sequence[Tuple[object, str]],
+                workers: Optional[int] = None,
+                **options) -> List[str]:
+    """
+    Render many trajectories in worker processes.
+
+    Args:
+        jobs: (source, output path) pairs; sources must be picklable
+              (trajectory paths or dicts of arrays, not live engines)
+        workers: Process count (default: os.cpu_count())
+        **options: Passed to render_trajectory (max_points, method, dpi, ...)
+    """
+    tasks = [(source, path, options) for source, path in jobs]
+    if workers == 1:
+        return [_render_job(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunk = max(1, len(tasks) // (4 * (workers or os.cpu_count() or 1)))
+        return list(pool.map(_render_job, tasks, chunksize=chunk))
+
+
+def _simulate_and_render(args) -> List[str]:
+    """Worker: simulate a block of parameter sets together, plot each"""
+    from autopoietic_ensemble import EnsembleEngine, ensemble_gift_of_finitude
+
+    state_tuple, rows, paths, steps, dt, options = args
+    L, J, P, W = state_tuple
+    ensemble = EnsembleEngine(LJPWCoordinates(L=L, J=J, P=P, W=W), rows)
+
+    states = np.empty((steps, len(rows), 4))
+    efficiency = np.empty((steps, len(rows)))
+    for k in range(steps):
+        ensemble.step(dt)
+        states[k] = ensemble.states
+        efficiency[k] = ensemble.efficiency
+    gap = ensemble_gift_of_finitude(states.reshape(-1, 4)).reshape(steps, len(rows))
+    time = dt * np.arange(1, steps + 1)
+
+    done = []
+    for i, path in enumerate(paths):
+        series = {
+            'time': time,
+            'L': states[:, i, 0], 'J': states[:, i, 1], 'P': states[:, i, 2], 'W': states[:, i, 3],
+            'efficiency': efficiency[:, i],
+            'gap': gap[:, i],
+        }
+        done.append(render_trajectory(series, path, **options))
+    return done
+
+
+def render_parameter_sets(state: LJPWCoordinates,
+                          param_sets: Union[np.ndarray, Sequence[DynamicParameters]],
+                          directory: str,
+                          steps: int = 500,
+                          dt: float = 0.1,
+                          names: Optional[Sequence[str]] = None,
+                          fmt: str = 'png',
+                          block: Optional[int] = None,
+                          workers: Optional[int] = None,
+                          **options) -> List[str]:
+    """
+    One trajectory plot per parameter set (e.g. every point of a sweep).
+
+    Parameter sets are simulated in blocks with the vectorized ensemble and
+    plotted by worker processes; nothing but the plots is kept.
+
+    Args:
+        state: Common initial state
+        param_sets: (N, P) parameter matrix or list of DynamicParameters
+        directory: Output folder
+        steps: Simulation steps per run
+        dt: Time step
+        names: File stems (default: run_00000, run_00001, ...)
+        fmt: 'png' or 'svg'
+        block: Parameter sets simulated together per task (default: spread
+               evenly over the workers, at most MAX_BLOCK)
+        workers: Process count (1 = in-process, default: CPU count)
+        **options: Passed to render_trajectory
+    """
+    from autopoietic_ensemble import params_to_array
+
+    if not isinstance(param_sets, np.ndarray):
+        param_sets = params_to_array(param_sets)
+    n = len(param_sets)
+    names = list(names) if names is not None else [f"run_{i:05d}" for i in range(n)]
+    paths = [os.path.join(directory, f"{name}.{fmt}") for name in names]
+    os.makedirs(directory, exist_ok=True)
+
+    if block is None:
+        n_workers = workers or os.cpu_count() or 1
+        block = min(MAX_BLOCK, max(1, -(-n // n_workers)))
+    tasks = [(state.to_tuple(), param_sets[i:i + block], paths[i:i + block], steps, dt, options)
+             for i in range(0, n, block)]
+    if workers == 1:
+        results = [_simulate_and_render(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_simulate_and_render, tasks))
+    return [path for block_paths in results for path in block_paths]
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    import time
+
+    print("=" * 70)
+    print("LJPW V7.7+ — HEADLESS RENDERING TEST")
+    print("=" * 70)
+
+    # 1. Downsampling a million-point noisy series
+    n = 1_000_000
+    t = np.linspace(0, 100, n)
+    y = np.sin(t) + 0.05 * np.random.default_rng(0).standard_normal(n)
+    y[n // 3] = 5.0   # a single spike
+
+    for method in METHODS:
+        t0 = time.perf_counter()
+        xs, ys = decimate(t, y, 2000, method)
+        elapsed = time.perf_counter() - t0
+        print(f"\n1. {method}: {n} -> {len(xs)} points in {elapsed * 1000:.1f} ms, "
+              f"spike kept: {ys.max() == 5.0}")
+
+    # 2. Rendering (needs matplotlib)
+    try:
+        import matplotlib  # noqa: F401
+    except ImportError:
+        print("\n2. Matplotlib not installed. Skipping rendering.")
+    else:
+        from autopoietic_engine import AutopoieticEngine
+
+        out = tempfile.mkdtemp(prefix="ljpw_render_")
+        engine = AutopoieticEngine(LJPWCoordinates(L=0.3, J=0.5, P=0.9, W=0.5))
+        engine.simulate(duration=500.0)
+        t0 = time.perf_counter()
+        render_trajectory(engine, os.path.join(out, "single.png"))
+        print(f"\n2. Single plot of {len(engine.history)} steps in {time.perf_counter() - t0:.2f}s")
+
+        rng = np.random.default_rng(1)
+        param_sets = []
+        for _ in range(16):
+            p = DynamicParameters()
+            p.random_mutation(rate=0.3, rng=rng)
+            param_sets.append(p)
+        t0 = time.perf_counter()
+        paths = render_parameter_sets(LJPWCoordinates(L=0.5, J=0.5, P=0.5, W=0.5),
+                                      param_sets, os.path.join(out, "sweep"), steps=300)
+        print(f"3. {len(paths)} parameter-set plots in {time.perf_counter() - t0:.2f}s")
+        shutil.rmtree(out)
@@ -0,0 +1,262 @@
+"""
+LJPW Framework V7.7+ — Stochastic Dynamics
+Langevin-style noise on dL..dW for noisy listening contexts.
+
+The deterministic engine integrates dX = a(X) dt, where a is the inertia-
+weighted, safety-clipped acceleration. The stochastic mode adds additive
+noise to every coordinate:
+
+    dX = a(X) dt + sigma dB_t
+
+Schemes:
+    'euler'  Euler–Maruyama           X' = X + a(X) dt + sigma dB
+    'heun'   Stochastic Heun          X~ = X + a(X) dt + sigma dB
+                                      X' = X + (a(X) + a(X~)) dt / 2 + sigma dB
+             (strong order 1.0 for additive noise, against 0.5 for Euler)
+
+States are clipped to the coordinate domain after every step, as in the
+deterministic engine. Monte Carlo runs keep only per-path summaries (first
+time autopoietic, final phase), never full paths.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+from autopoietic_engine import DynamicParameters, STATE_LOWER, STATE_UPPER
+from autopoietic_ensemble import (
+    EnsembleEngine, PHASE_AUTOPOIETIC, PHASE_NAMES
+)
+
+
+# Independent random streams are assigned per block of this many paths
+DEFAULT_BLOCK_SIZE = 1024
+
+# Paths simulated together in one ensemble by monte_carlo()
+DEFAULT_CHUNK_SIZE = 16384
+
+SCHEMES = ('euler', 'heun')
+
+
+# ============================================================================
+# STOCHASTIC ENSEMBLE
+# ============================================================================
+
+class StochasticEnsemble(EnsembleEngine):
+    """
+    EnsembleEngine with additive noise on every coordinate.
+
+    Paths are grouped into blocks of `block_size`; each block draws from its
+    own Generator spawned from one SeedSequence, so results do not depend on
+    how many paths are simulated together.
+    """
+
+    def __init__(self,
+                 states: Union[np.ndarray, LJPWCoordinates, Sequence[LJPWCoordinates]],
+                 params: Union[np.ndarray, DynamicParameters, Sequence[DynamicParameters]] = None,
+                 size: int = None,
+                 noise: Union[float, Sequence[float]] = 0.02,
+                 scheme: str = 'heun',
+                 seed: Union[int, np.random.SeedSequence, None] = None,
+                 block_size: int = DEFAULT_BLOCK_SIZE,
+                 streams: Optional[List[np.random.SeedSequence]] = None):
+        """
+        Initialize stochastic ensemble.
+
+        Args:
+            states, params, size: As for EnsembleEngine
+            noise: sigma, a scalar or one value per coordinate (L, J, P, W)
+            scheme: 'euler' (Euler–Maruyama) or 'heun' (stochastic Heun)
+            seed: Root seed (int or SeedSequence)
+            block_size: Paths per independent random stream
+            streams: Pre-spawned SeedSequences, one per block (overrides seed)
+        """
+        super().__init__(states, params, size)
+        if scheme not in SCHEMES:
+            raise ValueError(f"Unknown scheme '{scheme}'. Use one of {SCHEMES}")
+
+        self.scheme = scheme
+        self.noise = np.broadcast_to(np.asarray(noise, dtype=float), (4,)).copy()
+        self.block_size = block_size
+
+        n_blocks = -(-len(self) // block_size)
+        if streams is None:
+            root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+            streams = root.spawn(n_blocks)
+        if len(streams) != n_blocks:
+            raise ValueError(f"Need {n_blocks} streams for {len(self)} paths, got {len(streams)}")
+        self._rngs = [np.random.default_rng(s) for s in streams]
+
+    def increments(self, dt: float) -> np.ndarray:
+        """Scaled Brownian increments sigma * dB for every path"""
+        dB = np.empty_like(self.states)
+        for b, rng in enumerate(self._rngs):
+            block = slice(b * self.block_size, (b + 1) * self.block_size)
+            dB[block] = rng.standard_normal(dB[block].shape)
+        return dB * (self.noise * np.sqrt(dt))
+
+    def step(self, dt: float) -> None:
+        """Advance every path by one stochastic step"""
+        noise = self.increments(dt)
+        drift = self.drift()
+        if self.scheme == 'heun':
+            predictor = np.clip(self.states + drift * dt + noise, STATE_LOWER, STATE_UPPER)
+            drift = 0.5 * (drift + self.drift(predictor))
+        self._advance(self.states + drift * dt + noise, dt)
+
+
+# ============================================================================
+# MONTE CARLO
+# ============================================================================
+
+@dataclass
+class MonteCarloResult:
+    """Distribution summaries of a stochastic Monte Carlo run"""
+    hitting_times: np.ndarray          # first time autopoietic per path (NaN = never)
+    final_phase_counts: Dict[str, int]
+    n_paths: int
+    duration: float
+    dt: float
+    scheme: str
+    noise: List[float] = field(default_factory=list)
+
+    @property
+    def final_phase_probabilities(self) -> Dict[str, float]:
+        """Fraction of paths ending in each phase"""
+        return {name: count / self.n_paths for name, count in self.final_phase_counts.items()}
+
+    @property
+    def reached_fraction(self) -> float:
+        """Fraction of paths that became autopoietic within the duration"""
+        return float(np.mean(~np.isnan(self.hitting_times)))
+
+    def time_quantiles(self, q: Sequence[float] = (0.1, 0.5, 0.9)) -> Dict[float, float]:
+        """Quantiles of time-to-autopoiesis among paths that reached it"""
+        reached = self.hitting_times[~np.isnan(self.hitting_times)]
+        if len(reached) == 0:
+            return {p: float('nan') for p in q}
+        return dict(zip(q, np.quantile(reached, q).tolist()))
+
+    def histogram(self, bins: int = 20):
+        """(counts, edges) of time-to-autopoiesis over [0, duration]"""
+        reached = self.hitting_times[~np.isnan(self.hitting_times)]
+        return np.histogram(reached, bins=bins, range=(0.0, self.duration))
+
+    def summary(self) -> Dict:
+        """Compact dictionary summary"""
+        return {
+            'n_paths': self.n_paths,
+            'scheme': self.scheme,
+            'reached_fraction': self.reached_fraction,
+            'time_quantiles': self.time_quantiles(),
+            'final_phase_probabilities': self.final_phase_probabilities,
+        }
+
+
+def monte_carlo(state: LJPWCoordinates,
+                params: DynamicParameters = None,
+                n_paths: int = 10_000,
+                duration: float = 20.0,
+                dt: float = 0.1,
+                noise: Union[float, Sequence[float]] = 0.02,
+                scheme: str = 'heun',
+                seed: Optional[int] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                block_size: int = DEFAULT_BLOCK_SIZE) -> MonteCarloResult:
+    """
+    Run many noisy trajectories from one start and summarize them.
+
+    Paths are simulated chunk by chunk, so memory is bounded by chunk_size
+    whatever n_paths is. Every block of block_size paths owns a stream
+    spawned from the root seed, which makes results reproducible and
+    independent of chunk_size (chunk_size is rounded to whole blocks).
+
+    Args:
+        state: Starting LJPW state of every path
+        params: Dynamic parameters (default: DynamicParameters())
+        n_paths: Number of trajectories
+        duration: Simulated time per path
+        dt: Time step
+        noise: sigma, scalar or per coordinate
+        scheme: 'euler' or 'heun'
+        seed: Root seed
+        chunk_size: Paths simulated together
+        block_size: Paths per independent random stream
+    """
+    params = params or DynamicParameters()
+    steps = int(duration / dt)
+
+    n_blocks = -(-n_paths // block_size)
+    streams = np.random.SeedSequence(seed).spawn(n_blocks)
+    blocks_per_chunk = max(1, chunk_size // block_size)
+
+    hitting_times = np.full(n_paths, np.nan)
+    phase_counts = np.zeros(len(PHASE_NAMES), dtype=np.int64)
+
+    for first_block in range(0, n_blocks, blocks_per_chunk):
+        chunk_streams = streams[first_block:first_block + blocks_per_chunk]
+        start = first_block * block_size
+        stop = min(n_paths, start + len(chunk_streams) * block_size)
+
+        ensemble = StochasticEnsemble(state, params, size=stop - start, noise=noise,
+                                      scheme=scheme, block_size=block_size,
+                                      streams=chunk_streams)
+        hits = hitting_times[start:stop]
+        hits[ensemble.phase_codes() == PHASE_AUTOPOIETIC] = 0.0
+        for _ in range(steps):
+            ensemble.step(dt)
+            new = (ensemble.phase_codes() == PHASE_AUTOPOIETIC) & np.isnan(hits)
+            hits[new] = ensemble.time_elapsed
+
+        phase_counts += np.bincount(ensemble.phase_codes(), minlength=len(PHASE_NAMES))
+
+    return MonteCarloResult(
+        hitting_times=hitting_times,
+        final_phase_counts={PHASE_NAMES[i]: int(c) for i, c in enumerate(phase_counts)},
+        n_paths=n_paths,
+        duration=steps * dt,
+        dt=dt,
+        scheme=scheme,
+        noise=np.broadcast_to(np.asarray(noise, dtype=float), (4,)).tolist()
+    )
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("LJPW V7.7+ — STOCHASTIC DYNAMICS TEST")
+    print("=" * 70)
+
+    start = LJPWCoordinates(L=0.3, J=0.5, P=0.5, W=0.5)
+
+    # 1. Zero noise reproduces the deterministic ensemble
+    det = EnsembleEngine(start, size=4).simulate(steps=100)
+    sde = StochasticEnsemble(start, size=4, noise=0.0, scheme='euler').simulate(steps=100)
+    print(f"\n1. Max |deterministic - zero-noise SDE|: {np.max(np.abs(det.states - sde.states)):.2e}")
+
+    # 2. Time-to-autopoiesis distribution under noise
+    for scheme in SCHEMES:
+        t0 = time.perf_counter()
+        result = monte_carlo(start, n_paths=20_000, duration=20.0, noise=0.05,
+                             scheme=scheme, seed=42)
+        elapsed = time.perf_counter() - t0
+        print(f"\n2. {scheme}: {result.n_paths} paths x {int(result.duration / result.dt)} steps "
+              f"in {elapsed:.2f}s")
+        print(f"   Reached autopoiesis: {result.reached_fraction:.1%}")
+        print(f"   Time quantiles: "
+              + ", ".join(f"q{int(q * 100)}={t:.2f}" for q, t in result.time_quantiles().items()))
+        print(f"   Final phases: "
+              + ", ".join(f"{k}={v:.3f}" for k, v in result.final_phase_probabilities.items()))
+
+    # 3. Results do not depend on chunking
+    a = monte_carlo(start, n_paths=5000, duration=5.0, seed=1, chunk_size=1024)
+    b = monte_carlo(start, n_paths=5000, duration=5.0, seed=1, chunk_size=4096)
+    print(f"\n3. Chunk-size independent: "
+          f"{np.array_equal(a.hitting_times, b.hitting_times, equal_nan=True)}")
@@ -0,0 +1,205 @@
+"""
+LJPW Framework V7.7+ — Surrogate Pre-Screening
+Cheap learned stand-in for the "what if" simulation of a parameter mutation.
+
+Every candidate in a parameter search normally costs a full simulation.
+SurrogateModel learns the map
+
+    (log DynamicParameters, initial LJPW state) -> efficiency score
+
+online from completed simulations (ridge regression on random Fourier
+features, i.e. an approximate RBF kernel regression) and is used to rank
+candidates so that only the most promising fraction is simulated.
+
+Because the initial state is an input, one model can be shared across
+searches started from many different states.
+"""
+
+import math
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class SurrogateModel:
+    """
+    Online ridge/RBF regression with accuracy and savings bookkeeping.
+
+    Training is incremental: the normal equations (Phi^T Phi, Phi^T y) are
+    accumulated, so each update costs O(batch * F^2) regardless of how many
+    simulations have been seen.
+    """
+
+    def __init__(self,
+                 input_dim: int,
+                 n_features: int = 256,
+                 length_scale: float = 1.0,
+                 ridge: float = 1e-3,
+                 min_samples: int = 64,
+                 audit_fraction: float = 0.1,
+                 seed: Optional[int] = None):
+        """
+        Initialize surrogate.
+
+        Args:
+            input_dim: Length of each input row (parameters + state)
+            n_features: Random Fourier features approximating the RBF kernel
+            length_scale: RBF length scale in input units
+            ridge: L2 regularisation strength
+            min_samples: Simulations required before predictions are trusted
+            audit_fraction: Share of discarded candidates simulated anyway, so
+                            accuracy is also measured off the top of the ranking
+            seed: Seed for the random feature draw
+        """
+        rng = np.random.default_rng(seed)
+        self._rng = rng
+        self.input_dim = input_dim
+        self.n_features = n_features
+        self.ridge = ridge
+        self.min_samples = min_samples
+        self.audit_fraction = audit_fraction
+
+        self._omega = rng.standard_normal((input_dim, n_features)) / length_scale
+        self._phase = rng.uniform(0, 2 * math.pi, n_features)
+
+        # Linear block [1, x] + Fourier block
+        width = 1 + input_dim + n_features
+        self._A = np.zeros((width, width))
+        self._b = np.zeros(width)
+        self._coef = np.zeros(width)
+        self._dirty = False
+
+        self.n_samples = 0
+
+        # Accuracy on not-yet-seen simulations (measured before training on them)
+        self._sq_error = 0.0
+        self._abs_error = 0.0
+        self._n_scored = 0
+        self._rank_corr = []
+
+        # Screening savings
+        self.candidates_screened = 0
+        self.candidates_simulated = 0
+
+    # ------------------------------------------------------------------
+    # Regression
+    # ------------------------------------------------------------------
+
+    def features(self, X: np.ndarray) -> np.ndarray:
+        """Feature map [1, x, sqrt(2/F) cos(x Omega + phase)]"""
+        X = np.atleast_2d(X)
+        rff = math.sqrt(2.0 / self.n_features) * np.cos(X @ self._omega + self._phase)
+        return np.hstack([np.ones((len(X), 1)), X, rff])
+
+    @property
+    def ready(self) -> bool:
+        """True once enough simulations have been absorbed"""
+        return self.n_samples >= self.min_samples
+
+    def update(self, X: np.ndarray, y: np.ndarray) -> None:
+        """Absorb completed simulations (rows X, true scores y)"""
+        X = np.atleast_2d(X)
+        y = np.asarray(y, dtype=float)
+        if self.n_samples > 0:
+            self._record_accuracy(self.predict(X), y)
+
+        Phi = self.features(X)
+        self._A += Phi.T @ Phi
+        self._b += Phi.T @ y
+        self.n_samples += len(y)
+        self._dirty = True
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predicted scores for candidate rows"""
+        if self._dirty:
+            reg = self.ridge * np.eye(len(self._b))
+            reg[0, 0] = 0.0  # do not shrink the intercept
+            self._coef = np.linalg.solve(self._A + reg, self._b)
+            self._dirty = False
+        return self.features(X) @ self._coef
+
+    # ------------------------------------------------------------------
+    # Screening
+    # ------------------------------------------------------------------
+
+    def screen(self, X: np.ndarray, fraction: float) -> np.ndarray:
+        """
+        Indices of the candidates worth simulating.
+
+        Returns all indices while the model is still warming up, otherwise
+        the top `fraction` by predicted score (at least one) plus a small
+        random audit sample of the rest.
+        """
+        n = len(X)
+        self.candidates_screened += n
+        k = max(1, int(math.ceil(fraction * n)))
+        if not self.ready or k >= n:
+            keep = np.arange(n)
+        else:
+            pred = self.predict(X)
+            order = np.argpartition(-pred, k - 1)
+            top, rest = order[:k], order[k:]
+            n_audit = int(round(self.audit_fraction * len(rest)))
+            audit = self._rng.choice(rest, size=n_audit, replace=False)
+            keep = np.concatenate([top, audit])
+        self.candidates_simulated += len(keep)
+        return keep
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def _record_accuracy(self, pred: np.ndarray, y: np.ndarray) -> None:
+        err = pred - y
+        self._sq_error += float(np.sum(err ** 2))
+        self._abs_error += float(np.sum(np.abs(err)))
+        self._n_scored += len(y)
+        if len(y) > 2 and np.std(y) > 0 and np.std(pred) > 0:
+            # Spearman rank correlation — ranking is what screening relies on
+            rp = np.argsort(np.argsort(pred))
+            ry = np.argsort(np.argsort(y))
+            self._rank_corr.append(float(np.corrcoef(rp, ry)[0, 1]))
+
+    def report(self) -> Dict[str, float]:
+        """Surrogate accuracy and simulation savings so far"""
+        scored = max(self._n_scored, 1)
+        screened = max(self.candidates_screened, 1)
+        return {
+            'training_samples': self.n_samples,
+            'rmse': math.sqrt(self._sq_error / scored),
+            'mae': self._abs_error / scored,
+            'rank_correlation': (float(np.mean(self._rank_corr[-20:]))
+                                 if self._rank_corr else float('nan')),
+            'candidates_screened': self.candidates_screened,
+            'candidates_simulated': self.candidates_simulated,
+            'simulations_saved': self.candidates_screened - self.candidates_simulated,
+            'savings_fraction': 1.0 - self.candidates_simulated / screened,
+        }
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    from ljpw_v77_core import LJPWCoordinates
+    from autopoietic_optimizer import PopulationOptimizer
+
+    print("=" * 70)
+    print("LJPW V7.7+ — SURROGATE PRE-SCREENING TEST")
+    print("=" * 70)
+
+    surrogate = PopulationOptimizer.make_surrogate(seed=0)
+    rng = np.random.default_rng(3)
+
+    # One surrogate shared across searches from many starting states
+    for i in range(20):
+        L, J, P, W = rng.uniform(0.3, 0.9, 4)
+        state = LJPWCoordinates(L=L, J=J, P=P, W=W)
+        optimizer = PopulationOptimizer(state, population=64, sigma=0.1, seed=i,
+                                        surrogate=surrogate, screen_fraction=0.25)
+        result = optimizer.run(generations=10)
+
+    print("\nSurrogate report after 20 searches:")
+    for key, value in surrogate.report().items():
+        print(f"   {key}: {value:.4f}" if isinstance(value, float) else f"   {key}: {value}")
@@ -0,0 +1,387 @@
+"""
+LJPW Framework V7.7+ — Parameter Sweeps & Phase Diagrams
+Which combinations of alpha / beta / gamma / K_JL push a song AUTOPOIETIC?
+
+ParameterSweep evaluates grids or Latin-hypercube samples over any
+DynamicParameters fields. Points are simulated in chunks
+through the vectorized EnsembleEngine and written to a memory-mapped
+result file, one row per point:
+
+    phase              int8     final phase code (0/1/2, see PHASE_NAMES)
+    efficiency         float32  final eta_1
+    convergence_time   float32  first time the self-model converged (NaN = never)
+
+Completed chunks are recorded in a bitmap next to the results, so an
+interrupted sweep resumes where it stopped.
+
+TimeConstants fields are rejected as sweep axes: the current force law
+does not read them, so every value would give identical results.
+"""
+
+import hashlib
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, fields
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+from autopoietic_engine import DynamicParameters, TimeConstants
+from autopoietic_ensemble import (
+    EnsembleEngine, PARAM_FIELDS, PARAM_INDEX, PHASE_NAMES, params_to_array
+)
+
+
+TIME_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(TimeConstants))
+SWEEPABLE_FIELDS: Tuple[str, ...] = PARAM_FIELDS
+
+RESULT_DTYPE = np.dtype([
+    ('phase', np.int8),
+    ('efficiency', np.float32),
+    ('convergence_time', np.float32),
+])
+
+FORMAT_VERSION = 1
+
+
+# ============================================================================
+# CHUNK EVALUATION
+# ============================================================================
+
+def evaluate_points(state: Tuple[float, float, float, float],
+                    base_row: np.ndarray,
+                    field_names: Sequence[str],
+                    points: np.ndarray,
+                    steps: int,
+                    dt: float) -> np.ndarray:
+    """
+    Simulate a block of sweep points in one ensemble.
+
+    Returns a structured array with RESULT_DTYPE.
+    """
+    params = np.repeat(base_row[None, :], len(points), axis=0)
+    for j, name in enumerate(field_names):
+        params[:, PARAM_INDEX[name]] = points[:, j]
+
+    ensemble = EnsembleEngine(np.array(state), params).simulate(steps, dt)
+
+    out = np.empty(len(points), dtype=RESULT_DTYPE)
+    out['phase'] = ensemble.phase_codes()
+    out['efficiency'] = ensemble.efficiency
+    out['convergence_time'] = ensemble.convergence_time
+    return out
+
+
+def _run_chunk(args) -> None:
+    """Process-pool worker: evaluate one chunk and write it in place"""
+    directory, spec, chunk = args
+    sweep = ParameterSweep.from_spec(spec, directory=directory)
+    sweep._write_chunk(directory, chunk)
+
+
+# ============================================================================
+# PARAMETER SWEEP
+# ============================================================================
+
+class ParameterSweep:
+    """
+    Grid or Latin-hypercube sweep over DynamicParameters fields.
+
+    Grid points are generated on the fly from the axes (a million-point
+    grid never has to be materialised); Latin-hypercube samples are stored.
+    """
+
+    def __init__(self,
+                 field_names: Sequence[str],
+                 axes: Optional[Sequence[Sequence[float]]] = None,
+                 samples: Optional[np.ndarray] = None,
+                 state: LJPWCoordinates = None,
+                 base_params: DynamicParameters = None,
+                 duration: float = 20.0,
+                 dt: float = 0.1,
+                 chunk_size: int = 65_536):
+        """
+        Initialize sweep (prefer the grid() / latin_hypercube() constructors).
+
+        Args:
+            field_names: Swept fields, in column order
+            axes: Per-field value lists (grid sweep)
+            samples: (M, F) explicit points (sample sweep)
+            state: Initial LJPW state for every point
+            base_params: Values for fields that are not swept
+            duration: Simulated time per point
+            dt: Time step
+            chunk_size: Points per ensemble simulation
+        """
+        inert = [name for name in field_names if name in TIME_FIELDS]
+        if inert:
+            raise ValueError(f"TimeConstants fields {inert} do not affect the dynamics; "
+                             f"sweeping them would only repeat identical points")
+        unknown = [name for name in field_names if name not in SWEEPABLE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown sweep fields {unknown}; choose from {SWEEPABLE_FIELDS}")
+        if (axes is None) == (samples is None):
+            raise ValueError("Provide exactly one of axes (grid) or samples")
+
+        self.field_names = tuple(field_names)
+        self.axes = [np.asarray(a, dtype=float) for a in axes] if axes is not None else None
+        self.samples = np.asarray(samples, dtype=float) if samples is not None else None
+        self.state = state or LJPWCoordinates(L=0.5, J=0.5, P=0.5, W=0.5)
+        self.base_params = (base_params or DynamicParameters()).copy()
+        self.duration = duration
+        self.dt = dt
+        self.steps = int(duration / dt)
+        self.chunk_size = chunk_size
+
+        if self.axes is not None:
+            self.shape = tuple(len(a) for a in self.axes)
+            self.n_points = int(np.prod(self.shape))
+        else:
+            self.shape = (len(self.samples),)
+            self.n_points = len(self.samples)
+        self.n_chunks = math.ceil(self.n_points / chunk_size)
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def grid(cls, axes: Dict[str, Sequence[float]], **kwargs) -> 'ParameterSweep':
+        """Full factorial grid, e.g. grid({'gamma': np.linspace(0, .3, 100), ...})"""
+        return cls(list(axes), axes=list(axes.values()), **kwargs)
+
+    @classmethod
+    def latin_hypercube(cls, bounds: Dict[str, Tuple[float, float]], n: int,
+                        seed: Optional[int] = None, **kwargs) -> 'ParameterSweep':
+        """n Latin-hypercube samples inside per-field (low, high) bounds"""
+        rng = np.random.default_rng(seed)
+        d = len(bounds)
+        strata = np.argsort(rng.random((n, d)), axis=0)
+        unit = (strata + rng.random((n, d))) / n
+        lo = np.array([b[0] for b in bounds.values()])
+        hi = np.array([b[1] for b in bounds.values()])
+        return cls(list(bounds), samples=lo + unit * (hi - lo), **kwargs)
+
+    # ------------------------------------------------------------------
+    # Points
+    # ------------------------------------------------------------------
+
+    def points(self, start: int, stop: int) -> np.ndarray:
+        """(stop - start, F) sweep points with flat indices start..stop-1"""
+        if self.samples is not None:
+            return self.samples[start:stop]
+        idx = np.unravel_index(np.arange(start, stop), self.shape)
+        return np.stack([axis[i] for axis, i in zip(self.axes, idx)], axis=1)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def spec(self) -> Dict:
+        """JSON-serialisable description (used to validate resumes)"""
+        return {
+            'version': FORMAT_VERSION,
+            'fields': list(self.field_names),
+            'axes': [a.tolist() for a in self.axes] if self.axes is not None else None,
+            'n_points': self.n_points,
+            'state': list(self.state.to_tuple()),
+            'base_params': asdict(self.base_params),
+            'duration': self.duration,
+            'dt': self.dt,
+            'chunk_size': self.chunk_size,
+        }
+
+    @classmethod
+    def from_spec(cls, spec: Dict, samples: Optional[np.ndarray] = None,
+                  directory: Optional[str] = None) -> 'ParameterSweep':
+        """
+        Rebuild a sweep from spec() output.
+
+        Args:
+            spec: Saved spec
+            samples: Sample points (default: loaded from the sweep directory)
+            directory: Sweep directory that a relative samples_path is resolved against
+        """
+        L, J, P, W = spec['state']
+        if spec['axes'] is None and samples is None:
+            samples = np.load(os.path.join(directory or '', spec['samples_path']), mmap_mode='r')
+        return cls(spec['fields'],
+                   axes=spec['axes'],
+                   samples=samples,
+                   state=LJPWCoordinates(L=L, J=J, P=P, W=W),
+                   base_params=DynamicParameters(**spec['base_params']),
+                   duration=spec['duration'],
+                   dt=spec['dt'],
+                   chunk_size=spec['chunk_size'])
+
+    @staticmethod
+    def _paths(directory: str) -> Dict[str, str]:
+        return {name: os.path.join(directory, filename) for name, filename in (
+            ('spec', 'sweep.json'),
+            ('results', 'results.npy'),
+            ('done', 'chunks_done.npy'),
+            ('samples', 'samples.npy'),
+        )}
+
+    def _prepare(self, directory: str, resume: bool) -> Dict:
+        """Create (or validate for resume) the output directory"""
+        paths = self._paths(directory)
+        spec = self.spec()
+        if self.samples is not None:
+            # Relative to the sweep directory, so it resumes from any cwd
+            spec['samples_path'] = os.path.basename(paths['samples'])
+            spec['samples_sha1'] = hashlib.sha1(np.ascontiguousarray(self.samples)).hexdigest()
+
+        if resume and os.path.exists(paths['spec']):
+            with open(paths['spec']) as f:
+                existing = json.load(f)
+            if existing != spec:
+                raise ValueError(f"{directory} holds a different sweep; "
+                                 f"use a new directory or resume=False")
+            return spec
+
+        os.makedirs(directory, exist_ok=True)
+        if self.samples is not None:
+            np.save(paths['samples'], self.samples)
+        results = np.lib.format.open_memmap(paths['results'], mode='w+',
+                                            dtype=RESULT_DTYPE, shape=(self.n_points,))
+        results['convergence_time'] = np.nan
+        results.flush()
+        del results
+        np.save(paths['done'], np.zeros(self.n_chunks, dtype=bool))
+
+        # Spec last: its presence marks a fully initialised directory
+        tmp = paths['spec'] + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(spec, f, indent=2)
+        os.replace(tmp, paths['spec'])
+        return spec
+
+    def _write_chunk(self, directory: str, chunk: int) -> None:
+        """Evaluate one chunk, write its rows, then mark it done"""
+        paths = self._paths(directory)
+        start = chunk * self.chunk_size
+        stop = min(start + self.chunk_size, self.n_points)
+
+        out = evaluate_points(self.state.to_tuple(), params_to_array(self.base_params)[0],
+                              self.field_names, self.points(start, stop),
+                              self.steps, self.dt)
+
+        results = np.load(paths['results'], mmap_mode='r+')
+        results[start:stop] = out
+        results.flush()
+        del results
+
+        done = np.load(paths['done'], mmap_mode='r+')
+        done[chunk] = True
+        done.flush()
+        del done
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def run(self, directory: str, resume: bool = True, workers: int = 1,
+            verbose: bool = False) -> np.memmap:
+        """
+        Run (or resume) the sweep and return the memory-mapped results.
+
+        Args:
+            directory: Output directory (sweep.json, results.npy, chunks_done.npy)
+            resume: Continue an existing sweep in `directory` if present
+            workers: Processes for chunk evaluation (1 = in-process)
+            verbose: Print progress per chunk
+        """
+        spec = self._prepare(directory, resume)
+        paths = self._paths(directory)
+        done = np.load(paths['done'])
+        pending = [int(c) for c in np.flatnonzero(~done)]
+        t0 = time.perf_counter()
+
+        if verbose:
+            print(f"Sweep: {self.n_points} points in {self.n_chunks} chunks "
+                  f"({len(pending)} pending)")
+
+        if workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                jobs = [(directory, spec, c) for c in pending]
+                for i, _ in enumerate(executor.map(_run_chunk, jobs)):
+                    if verbose:
+                        print(f"  chunk {i+1}/{len(pending)} done "
+                              f"({time.perf_counter() - t0:.1f}s)")
+        else:
+            for i, c in enumerate(pending):
+                self._write_chunk(directory, c)
+                if verbose:
+                    print(f"  chunk {i+1}/{len(pending)} done "
+                          f"({time.perf_counter() - t0:.1f}s)")
+
+        return np.load(paths['results'], mmap_mode='r')
+
+    @staticmethod
+    def load(directory: str) -> Tuple['ParameterSweep', np.memmap]:
+        """Open a finished (or partial) sweep: (sweep, memory-mapped results)"""
+        paths = ParameterSweep._paths(directory)
+        with open(paths['spec']) as f:
+            spec = json.load(f)
+        return ParameterSweep.from_spec(spec, directory=directory), np.load(paths['results'], mmap_mode='r')
+
+    def phase_diagram(self, results: np.ndarray) -> np.ndarray:
+        """Phase codes reshaped to the grid (grid sweeps only)"""
+        if self.axes is None:
+            raise ValueError("phase_diagram needs a grid sweep")
+        return np.asarray(results['phase']).reshape(self.shape)
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import tempfile
+
+    print("=" * 70)
+    print("LJPW V7.7+ — PARAMETER SWEEP TEST")
+    print("=" * 70)
+
+    song = LJPWCoordinates(L=0.75, J=0.7, P=0.6, W=0.7, source="song")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 1. 4-D grid over the headline parameters
+        sweep = ParameterSweep.grid({
+            'alpha_LJ': np.linspace(0.05, 0.4, 20),
+            'beta_L': np.linspace(0.05, 0.4, 20),
+            'gamma': np.linspace(0.0, 0.3, 10),
+            'K_JL': np.linspace(0.2, 1.0, 10),
+        }, state=song, duration=20.0, chunk_size=10_000)
+
+        t0 = time.perf_counter()
+        results = sweep.run(os.path.join(tmp, 'grid'))
+        elapsed = time.perf_counter() - t0
+
+        phases = np.bincount(results['phase'], minlength=3)
+        print(f"\n1. {sweep.n_points} points x {sweep.steps} steps in {elapsed:.2f}s")
+        for code, name in enumerate(PHASE_NAMES):
+            print(f"   {name:<12}: {phases[code] / sweep.n_points * 100:.1f}%")
+
+        diagram = sweep.phase_diagram(results)
+        print(f"   Autopoietic share vs alpha_LJ: "
+              f"{np.round((diagram == 2).mean(axis=(1, 2, 3)), 2)}")
+
+        # 2. Latin hypercube, interrupted and resumed
+        lhs = ParameterSweep.latin_hypercube(
+            {'alpha_LW': (0.05, 0.3), 'beta_W': (0.1, 0.4), 'alpha_WL': (0.05, 0.3)},
+            n=50_000, seed=0, state=song, chunk_size=5_000)
+        path = os.path.join(tmp, 'lhs')
+        lhs._prepare(path, resume=False)
+        for chunk in range(3):
+            lhs._write_chunk(path, chunk)       # ... then the job is "preempted"
+        t0 = time.perf_counter()
+        results = lhs.run(path, resume=True)
+        print(f"\n2. Resumed LHS sweep ({lhs.n_chunks - 3} chunks left) in "
+              f"{time.perf_counter() - t0:.2f}s; "
+              f"converged: {np.isfinite(results['convergence_time']).mean() * 100:.1f}%")
@@ -0,0 +1,308 @@
+"""
+LJPW Framework V7.7+ — Trajectory Files
+Append-only, memory-mappable storage for full-resolution runs.
+
+A trajectory is a directory:
+
+    trajectory.json     Manifest: format, version, column dtypes, metadata
+    <column>.bin        One raw little-endian array per column
+
+Columns (fixed width):
+
+    time          float64   (float32 cannot resolve dt=0.1 past ~10^6 s)
+    tick          uint32    (exact up to 4.29e9 steps)
+    L, J, P, W    float32
+    efficiency, entropy, harmony, consciousness, gap   float32
+    phase         int8      (0 entropic, 1 homeostatic, 2 autopoietic)
+
+Rows are buffered and appended in chunks while the simulation runs. Opening
+a trajectory parses only the manifest: every column is an np.memmap, so a
+100M-step file is ready instantly and only the slices touched are paged in.
+The row count comes from the file sizes, so a run killed mid-append loses
+at most the torn tail, which the next writer trims away.
+"""
+
+import json
+import os
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from ljpw_v77_core import LJPWConstants
+from autopoietic_ensemble import PHASE_NAMES
+
+
+FORMAT_NAME = 'ljpw-trajectory'
+FORMAT_VERSION = 1
+MANIFEST_FILE = 'trajectory.json'
+
+TRAJECTORY_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('time', '<f8'),
+    ('tick', '<u4'),
+    ('L', '<f4'),
+    ('J', '<f4'),
+    ('P', '<f4'),
+    ('W', '<f4'),
+    ('efficiency', '<f4'),
+    ('entropy', '<f4'),
+    ('harmony', '<f4'),
+    ('consciousness', '<f4'),
+    ('gap', '<f4'),
+    ('phase', 'i1'),
+)
+
+COLUMN_NAMES = tuple(name for name, _ in TRAJECTORY_COLUMNS)
+ROW_BYTES = sum(np.dtype(dtype).itemsize for _, dtype in TRAJECTORY_COLUMNS)
+
+
+def phase_code(harmony: float, love: float) -> int:
+    """Phase code with the thresholds of LJPWCoordinates.phase()"""
+    if harmony < LJPWConstants.HOMEOSTATIC_H_THRESHOLD:
+        return 0
+    if harmony < LJPWConstants.AUTOPOLIETIC_H_THRESHOLD or love < LJPWConstants.AUTOPOLIETIC_L_THRESHOLD:
+        return 1
+    return 2
+
+
+def _valid_rows(path: str) -> int:
+    """Complete rows present in every column file"""
+    rows = None
+    for name, dtype in TRAJECTORY_COLUMNS:
+        file = os.path.join(path, f"{name}.bin")
+        n = os.path.getsize(file) // np.dtype(dtype).itemsize if os.path.exists(file) else 0
+        rows = n if rows is None else min(rows, n)
+    return rows or 0
+
+
+# ============================================================================
+# WRITER
+# ============================================================================
+
+class TrajectoryWriter:
+    """
+    Chunked, append-only trajectory writer.
+
+    Works as an AutopoieticEngine history sink (append(record)) and also
+    accepts whole column chunks from vectorized code (write()).
+    """
+
+    def __init__(self, path: str, rows: Optional[int] = None,
+                 buffer_rows: int = 65_536, metadata: Optional[Dict] = None):
+        """
+        Create a trajectory or reopen one for appending.
+
+        Args:
+            path: Trajectory directory
+            rows: Keep only the first `rows` rows (default: every complete row)
+            buffer_rows: Rows buffered in memory between appends
+            metadata: JSON-serializable run information (new trajectories)
+        """
+        self.path = path
+        self.buffer_rows = buffer_rows
+        os.makedirs(path, exist_ok=True)
+
+        manifest = os.path.join(path, MANIFEST_FILE)
+        if os.path.exists(manifest):
+            with open(manifest) as f:
+                existing = json.load(f)
+            if existing.get('columns') != [list(c) for c in TRAJECTORY_COLUMNS]:
+                raise ValueError(f"{path}: incompatible trajectory columns")
+            self.metadata = existing.get('metadata', {})
+        else:
+            self.metadata = dict(metadata or {})
+            with open(manifest, 'w') as f:
+                json.dump({
+                    'format': FORMAT_NAME,
+                    'version': FORMAT_VERSION,
+                    'columns': [list(c) for c in TRAJECTORY_COLUMNS],
+                    'phase_names': list(PHASE_NAMES),
+                    'metadata': self.metadata,
+                }, f, indent=2)
+
+        # Trim torn appends (or rows past a checkpoint) from every column
+        self.rows = _valid_rows(path) if rows is None else rows
+        for name, dtype in TRAJECTORY_COLUMNS:
+            with open(self._file(name), 'ab') as f:
+                f.truncate(self.rows * np.dtype(dtype).itemsize)
+
+        self._buffer = {name: np.empty(buffer_rows, dtype=dtype) for name, dtype in TRAJECTORY_COLUMNS}
+        self._pending = 0
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.bin")
+
+    def __len__(self) -> int:
+        return self.rows + self._pending
+
+    def __enter__(self) -> 'TrajectoryWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
+
+    def append(self, record: Dict) -> None:
+        """Buffer one engine history record"""
+        i = self._pending
+        b = self._buffer
+        L, J, P, W = record['state']
+        harmony = record['harmony']
+        b['time'][i] = record['time']
+        b['tick'][i] = record['tick']
+        b['L'][i] = L
+        b['J'][i] = J
+        b['P'][i] = P
+        b['W'][i] = W
+        b['efficiency'][i] = record['efficiency']
+        b['entropy'][i] = record['entropy']
+        b['harmony'][i] = harmony
+        b['consciousness'][i] = record['consciousness']
+        b['gap'][i] = record['gift_of_finitude']
+        b['phase'][i] = phase_code(harmony, L)
+        self._pending += 1
+        if self._pending == self.buffer_rows:
+            self.flush()
+
+    def write(self, columns: Dict[str, np.ndarray]) -> None:
+        """Append a chunk given as equal-length arrays for every column"""
+        self.flush()
+        lengths = {len(columns[name]) for name in COLUMN_NAMES}
+        if len(lengths) != 1:
+            raise ValueError("All columns of a chunk must have the same length")
+        for name, dtype in TRAJECTORY_COLUMNS:
+            with open(self._file(name), 'ab') as f:
+                np.asarray(columns[name], dtype=dtype).tofile(f)
+        self.rows += lengths.pop()
+
+    def flush(self) -> None:
+        """Append buffered rows to the column files"""
+        n = self._pending
+        if n == 0:
+            return
+        for name, _ in TRAJECTORY_COLUMNS:
+            with open(self._file(name), 'ab') as f:
+                self._buffer[name][:n].tofile(f)
+        self.rows += n
+        self._pending = 0
+
+
+# ============================================================================
+# READER
+# ============================================================================
+
+class Trajectory:
+    """
+    Read-only, memory-mapped view of a trajectory directory.
+
+    traj['L'] is an np.memmap; nothing is parsed or copied until sliced.
+    """
+
+    def __init__(self, path: str):
+        with open(os.path.join(path, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+        if manifest.get('format') != FORMAT_NAME:
+            raise ValueError(f"{path} is not an LJPW trajectory")
+        if manifest.get('version', 0) > FORMAT_VERSION:
+            raise ValueError(f"{path}: trajectory version {manifest['version']} is newer than supported")
+
+        self.path = path
+        self.metadata = manifest.get('metadata', {})
+        self.phase_names = tuple(manifest.get('phase_names', PHASE_NAMES))
+        self.rows = _valid_rows(path)
+        self._columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return COLUMN_NAMES
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self._columns:
+            dtype = dict(TRAJECTORY_COLUMNS)[name]
+            if self.rows == 0:
+                self._columns[name] = np.empty(0, dtype=dtype)
+            else:
+                self._columns[name] = np.memmap(os.path.join(self.path, f"{name}.bin"),
+                                                dtype=dtype, mode='r', shape=(self.rows,))
+        return self._columns[name]
+
+    def states(self, start: int = 0, stop: Optional[int] = None, step: int = 1) -> np.ndarray:
+        """(rows, 4) float32 array of L, J, P, W for a slice of the run"""
+        sl = slice(start, stop, step)
+        return np.stack([self[c][sl] for c in ('L', 'J', 'P', 'W')], axis=1)
+
+    def iter_chunks(self, chunk_rows: int = 1_000_000) -> Iterator[Dict[str, np.ndarray]]:
+        """Consecutive chunks of every column (for streaming analysis)"""
+        for start in range(0, self.rows, chunk_rows):
+            stop = min(self.rows, start + chunk_rows)
+            yield {name: self[name][start:stop] for name in COLUMN_NAMES}
+
+    def phase_fractions(self) -> Dict[str, float]:
+        """Fraction of recorded steps spent in each phase"""
+        counts = np.zeros(len(self.phase_names), dtype=np.int64)
+        for chunk in self.iter_chunks():
+            counts += np.bincount(chunk['phase'], minlength=len(self.phase_names))
+        total = max(self.rows, 1)
+        return {name: float(counts[i] / total) for i, name in enumerate(self.phase_names)}
+
+
+def open_trajectory(path: str) -> Trajectory:
+    """Memory-map a trajectory for analysis or plotting"""
+    return Trajectory(path)
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    import time
+    from ljpw_v77_core import LJPWCoordinates
+    from autopoietic_engine import AutopoieticEngine
+
+    print("=" * 70)
+    print("LJPW V7.7+ — TRAJECTORY FILE TEST")
+    print("=" * 70)
+
+    root = tempfile.mkdtemp(prefix="ljpw_traj_")
+    path = os.path.join(root, "run")
+
+    # 1. Stream an engine run straight to disk
+    engine = AutopoieticEngine(LJPWCoordinates(L=0.3, J=0.5, P=0.9, W=0.5))
+    steps = 50_000
+    t0 = time.perf_counter()
+    with TrajectoryWriter(path, metadata={'dt': 0.1}) as writer:
+        engine.history_sink = writer
+        for _ in range(steps):
+            engine.step(0.1)
+    print(f"\n1. Wrote {steps} steps in {time.perf_counter() - t0:.2f}s "
+          f"({ROW_BYTES} bytes/row, in-memory history: {len(engine.history)})")
+
+    # 2. Synthetic 10M-row file from vectorized chunks, then open it
+    #    (opening cost does not depend on the row count)
+    big = os.path.join(root, "big")
+    n_big = 10_000_000
+    with TrajectoryWriter(big) as writer:
+        for start in range(0, n_big, 1_000_000):
+            ticks = np.arange(start + 1, start + 1_000_001)
+            chunk = {name: np.zeros(len(ticks), dtype=dtype) for name, dtype in TRAJECTORY_COLUMNS}
+            chunk['tick'] = ticks
+            chunk['time'] = ticks * 0.1
+            writer.write(chunk)
+
+    t0 = time.perf_counter()
+    traj = open_trajectory(big)
+    opened = time.perf_counter() - t0
+    print(f"2. Opened {len(traj):,} rows in {opened * 1000:.2f} ms; "
+          f"last tick={int(traj['tick'][-1])}, last time={traj['time'][-1]:.1f}")
+    shutil.rmtree(big)
+
+    # 3. Analysis on the real run
+    traj = open_trajectory(path)
+    print(f"3. Final L={traj['L'][-1]:.4f} (engine {engine.state.L:.4f}), "
+          f"phases: {traj.phase_fractions()}")
+
+    shutil.rmtree(root)
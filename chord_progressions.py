@@ -0,0 +1,306 @@
+"""
+LJPW Framework V7.7 — Chord-Progression Search
+Progressions whose LJPW trajectory maximises harmony and ends resolved.
+
+A progression c_1 .. c_T over a chord registry costs
+
+    cost = sum_t  w_move * |x(c_t) - x(c_t+1)|  +  repeat * [c_t == c_t+1]  +  bias[c_t, c_t+1]
+         - w_harmony * sum_t H(c_t)
+
+with H the static harmony of each chord, and c_T restricted to the
+resolving chords. Minimising the cost maximises average harmony while
+keeping voice-leading moves short in LJPW space.
+
+All pairwise terms are folded into one (K, K) transition-cost matrix up
+front. Two searches use it:
+
+    dp    exact. One backward min-plus pass gives the optimal cost-to-go
+          from every chord with r chords remaining (r < max_length), for
+          every length at once. The N best progressions are then
+          enumerated lazily best-first, expanding one child per pop.
+    beam  approximate. A forward beam of fixed width, vectorized over
+          beam x registry.
+"""
+
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from autopoietic_ensemble import ensemble_harmony, ensemble_phase_codes, PHASE_AUTOPOIETIC
+from musical_semantics import CompiledRegistry, compiled_registry
+from registry_distances import get_distance_tables
+
+
+MAX_LENGTH = 64
+
+# float32 elements per min-plus block of the DP (about 4 MB)
+DP_BLOCK_ELEMENTS = 1 << 20
+
+# Default resolving chords when the registry has them (tonic triads)
+RESOLVING_KEYS = ('Maj', 'Min')
+
+
+@dataclass
+class Progression:
+    """One searched progression"""
+    keys: Tuple[str, ...]
+    indices: Tuple[int, ...]
+    cost: float
+    mean_harmony: float
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __str__(self) -> str:
+        return f"{' -> '.join(self.keys)}  (H̄={self.mean_harmony:.3f}, cost={self.cost:.3f})"
+
+
+# ============================================================================
+# TRANSITION MODEL
+# ============================================================================
+
+class ProgressionSearch:
+    """
+    Precomputed transition costs over a registry, with DP and beam search.
+    """
+
+    def __init__(self, registry: Optional[CompiledRegistry] = None,
+                 harmony_weight: float = 1.0,
+                 move_weight: float = 0.5,
+                 repeat_penalty: float = 0.25,
+                 bias: Optional[np.ndarray] = None,
+                 resolving: Optional[Sequence[str]] = None,
+                 max_length: int = MAX_LENGTH,
+                 distances: Optional[np.ndarray] = None):
+        """
+        Build the transition-cost matrix.
+
+        Args:
+            registry: Chords to progress through (default CHORD_REGISTRY);
+                      any CompiledRegistry works, e.g. the pitch-class registry
+            harmony_weight: Reward per unit of chord harmony
+            move_weight: Cost per unit of LJPW distance between neighbours
+            repeat_penalty: Extra cost for repeating a chord
+            bias: Optional (K, K) user cost added to every transition
+                  (np.inf forbids a transition)
+            resolving: Keys allowed as the final chord (default Maj/Min if
+                       present, else every autopoietic chord)
+            max_length: Longest progression the DP tables cover
+            distances: Precomputed (K, K) LJPW distances of the registry
+                       (default for the stock chord registry: the cached
+                       DistanceTables.matrix('chord', 'chord'))
+        """
+        stock = compiled_registry('chord')
+        self.registry = registry if registry is not None else stock
+        if distances is None and self.registry is stock:
+            distances = get_distance_tables().matrix('chord', 'chord')
+        self.max_length = max_length
+        x = self.registry.matrix
+        k = len(self.registry)
+
+        self.harmony = ensemble_harmony(x)
+        if distances is not None:
+            distance = np.asarray(distances, dtype=float)
+        else:
+            norms = np.einsum('kd,kd->k', x, x)
+            sq = norms[:, None] + norms[None, :] - 2.0 * (x @ x.T)
+            distance = np.sqrt(np.maximum(sq, 0.0))
+
+        # cost[i, j]: moving from chord i to chord j (reward for j's harmony included)
+        self.start_cost = -harmony_weight * self.harmony
+        self.cost = move_weight * distance + self.start_cost[None, :]
+        self.cost[np.diag_indices(k)] += repeat_penalty
+        if bias is not None:
+            self.cost += bias
+
+        if resolving is None:
+            keys = self.registry.keys
+            resolving = [key for key in RESOLVING_KEYS if key in keys]
+            if not resolving:
+                codes = ensemble_phase_codes(x)
+                resolving = [keys[i] for i in np.flatnonzero(codes == PHASE_AUTOPOIETIC)]
+        self.resolving = np.zeros(k, dtype=bool)
+        self.resolving[[self.registry.keys.index(key) for key in resolving]] = True
+
+        self._cost_to_go: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.registry)
+
+    @property
+    def cost_to_go(self) -> np.ndarray:
+        """
+        (max_length, K) optimal cost of the remaining chords: row r is the
+        best cost of r more chords after the current one, ending resolved.
+        """
+        if self._cost_to_go is None:
+            # float32 and cache-sized row blocks cut the memory traffic of the
+            # K x K min-plus steps; path costs are accumulated in float64
+            k = len(self)
+            cost = self.cost.astype(np.float32)
+            rows = max(1, DP_BLOCK_ELEMENTS // k)
+            buffer = np.empty((min(rows, k), k), dtype=np.float32)
+            table = np.empty((self.max_length, k), dtype=np.float32)
+            table[0] = np.where(self.resolving, 0.0, np.inf)
+            for r in range(1, self.max_length):
+                for s in range(0, k, rows):
+                    block = buffer[:min(rows, k - s)]
+                    np.add(cost[s:s + rows], table[r - 1], out=block)
+                    np.min(block, axis=1, out=table[r, s:s + rows])
+            self._cost_to_go = table.astype(float)
+        return self._cost_to_go
+
+    def _result(self, path: Sequence[int], cost: float) -> Progression:
+        keys = self.registry.keys
+        return Progression(
+            keys=tuple(keys[i] for i in path),
+            indices=tuple(int(i) for i in path),
+            cost=float(cost),
+            mean_harmony=float(np.mean(self.harmony[list(path)])),
+        )
+
+    def _index(self, key: Optional[str]) -> Optional[int]:
+        return None if key is None else self.registry.keys.index(key)
+
+    # ------------------------------------------------------------------------
+    # EXACT: DP + LAZY N-BEST ENUMERATION
+    # ------------------------------------------------------------------------
+
+    def best(self, length: int, n: int = 5, start: Optional[str] = None) -> List[Progression]:
+        """
+        The n lowest-cost progressions of exactly `length` chords.
+
+        Args:
+            length: Number of chords (1..max_length)
+            n: Progressions to return
+            start: Optional key the progression must begin with
+        """
+        if not 1 <= length <= self.max_length:
+            raise ValueError(f"length must be between 1 and {self.max_length}")
+        h = self.cost_to_go
+        counter = itertools.count()
+        heap = []
+        results: List[Progression] = []
+
+        def push_children(path: Tuple[int, ...], g: float, f_row: np.ndarray) -> None:
+            order = np.argsort(f_row, kind='stable')
+            if np.isfinite(f_row[order[0]]):
+                heapq.heappush(heap, (f_row[order[0]], next(counter), path, g, f_row, order, 0))
+
+        first = self.start_cost + h[length - 1]
+        s = self._index(start)
+        if s is not None:
+            first = np.where(np.arange(len(self)) == s, first, np.inf)
+        push_children((), 0.0, first)
+
+        while heap and len(results) < n:
+            f, _, parent, g_parent, f_row, order, rank = heapq.heappop(heap)
+            chord = int(order[rank])
+            path = parent + (chord,)
+
+            # Next sibling of this node
+            if rank + 1 < len(order) and np.isfinite(f_row[order[rank + 1]]):
+                heapq.heappush(heap, (f_row[order[rank + 1]], next(counter), parent,
+                                      g_parent, f_row, order, rank + 1))
+
+            g = g_parent + (self.start_cost[chord] if not parent else self.cost[parent[-1], chord])
+            if len(path) == length:
+                results.append(self._result(path, g))
+            else:
+                remaining = length - len(path)
+                push_children(path, g, g + self.cost[chord] + h[remaining - 1])
+
+        return results
+
+    def best_any_length(self, max_length: int, n: int = 5, min_length: int = 2,
+                        start: Optional[str] = None) -> List[Progression]:
+        """The n progressions of min_length..max_length chords with the lowest cost per chord"""
+        candidates = []
+        for length in range(min_length, max_length + 1):
+            candidates.extend(self.best(length, n, start))
+        candidates.sort(key=lambda p: p.cost / len(p))
+        return candidates[:n]
+
+    # ------------------------------------------------------------------------
+    # APPROXIMATE: BEAM SEARCH
+    # ------------------------------------------------------------------------
+
+    def beam(self, length: int, n: int = 5, width: int = 256,
+             start: Optional[str] = None) -> List[Progression]:
+        """
+        Beam search keeping the `width` cheapest prefixes at every step.
+
+        Cost is O(length * width * K) with no DP table, which suits one-off
+        searches of very large registries.
+        """
+        k = len(self)
+        cost0 = self.start_cost.copy()
+        s = self._index(start)
+        if s is not None:
+            cost0 = np.where(np.arange(k) == s, cost0, np.inf)
+        if length == 1:
+            cost0 = np.where(self.resolving, cost0, np.inf)
+
+        keep = np.argsort(cost0, kind='stable')[:width]
+        keep = keep[np.isfinite(cost0[keep])]
+        paths = keep[:, None]
+        g = cost0[keep]
+
+        for step in range(1, length):
+            cand = g[:, None] + self.cost[paths[:, -1]]
+            if step == length - 1:
+                cand = np.where(self.resolving[None, :], cand, np.inf)
+            flat = cand.ravel()
+            m = min(width, flat.size)
+            top = np.argpartition(flat, m - 1)[:m]
+            top = top[np.argsort(flat[top], kind='stable')]
+            top = top[np.isfinite(flat[top])]
+            rows, cols = np.divmod(top, k)
+            paths = np.concatenate([paths[rows], cols[:, None]], axis=1)
+            g = flat[top]
+
+        return [self._result(p, c) for p, c in zip(paths[:n], g[:n])]
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("LJPW V7.7 — CHORD PROGRESSION SEARCH TEST")
+    print("=" * 70)
+
+    # 1. The hand-entered chords
+    search = ProgressionSearch()
+    print("\n1. Best 4-chord progressions over CHORD_REGISTRY:")
+    for p in search.best(4, n=5):
+        print(f"   {p}")
+    print("   Starting on a diminished chord:")
+    for p in search.best(4, n=2, start='Dim'):
+        print(f"   {p}")
+
+    # 2. DP vs beam agree on the optimum
+    dp = search.best(8, n=1)[0]
+    bm = search.beam(8, n=1, width=64)[0]
+    print(f"\n2. Length 8 optimum: dp cost {dp.cost:.4f}, beam cost {bm.cost:.4f}")
+
+    # 3. Thousands of chords: the full pitch-class set registry
+    from pitch_class_registry import get_pitch_class_registry
+    big_registry = get_pitch_class_registry()
+    t0 = time.perf_counter()
+    big = ProgressionSearch(big_registry)
+    top = big.best(64, n=5)
+    elapsed = time.perf_counter() - t0
+    print(f"\n3. {len(big)} chords, top-5 of length 64 (build + DP + enumeration): {elapsed:.2f}s")
+    print(f"   Best: {' -> '.join(top[0].keys[:6])} ... {top[0].keys[-1]} "
+          f"(H̄={top[0].mean_harmony:.3f})")
+    t0 = time.perf_counter()
+    beam = big.beam(64, n=5, width=128)
+    print(f"   Beam (width 128): {time.perf_counter() - t0:.2f}s, best cost {beam[0].cost:.3f} "
+          f"vs exact {top[0].cost:.3f}")
@@ -0,0 +1,279 @@
+"""
+LJPW Framework V7.7 — Chord Timeline from Chroma
+Which chord is playing when, and where that puts the song in LJPW space.
+
+Input is a (T, 12) chroma matrix (bin 0 = C), as produced per frame by
+the web app's audioAnalyzer.js (Meyda, 2048-sample buffers, hop 512).
+
+    1. Templates   one binary pitch-class template per CHORD_REGISTRY
+                   quality in each of the 12 roots (12 * Q states), plus
+                   a "no chord" state
+    2. Scores      cosine similarity of every frame with every template:
+                   one (T, 12) @ (12, S) matrix multiply
+    3. Smoothing   Viterbi over a sticky chain (stay with probability
+                   1 - p_switch, else jump uniformly). With uniform jumps
+                   each frame costs O(S), not O(S^2)
+    4. Timeline    runs of equal states become segments annotated with
+                   the quality's LJPW coordinates from CHORD_REGISTRY
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from musical_semantics import load_registry
+from pitch_class_registry import NOTE_NAMES, chord_semitones
+
+
+# audioAnalyzer.js: HOP_SIZE = 512 at the usual 44.1 kHz
+DEFAULT_FRAME_RATE = 44_100 / 512
+
+NO_CHORD = 'N'
+
+
+@dataclass
+class ChordSegment:
+    """One chord held over a span of frames"""
+    start: float                     # seconds
+    end: float
+    label: str                       # e.g. "A:Min", or "N"
+    root: Optional[int]              # pitch class, None for no chord
+    quality: Optional[str]           # CHORD_REGISTRY key
+    confidence: float                # mean template score over the segment
+    coords: Optional[Tuple[float, float, float, float]]   # (L, J, P, W) of the quality
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class ChordTimeline:
+    """Decoded chords of one chroma sequence"""
+    segments: List[ChordSegment]
+    states: np.ndarray               # (T,) state per frame
+    frame_rate: float
+    state_coords: np.ndarray         # (S, 4) LJPW per state, NaN for no chord
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    @property
+    def duration(self) -> float:
+        return len(self.states) / self.frame_rate
+
+    def ljpw_trajectory(self) -> np.ndarray:
+        """(T, 4) per-frame LJPW coordinates (NaN while no chord plays)"""
+        return self.state_coords[self.states]
+
+    def mean_coordinates(self) -> Optional[Tuple[float, float, float, float]]:
+        """Duration-weighted mean LJPW over the chorded segments"""
+        chorded = [s for s in self.segments if s.coords is not None]
+        total = sum(s.duration for s in chorded)
+        if total == 0:
+            return None
+        mean = sum(np.array(s.coords) * s.duration for s in chorded) / total
+        return tuple(float(v) for v in mean)
+
+    def quality_time(self) -> Dict[str, float]:
+        """Seconds spent in each chord quality (and 'N')"""
+        totals: Dict[str, float] = {}
+        for s in self.segments:
+            key = s.quality or NO_CHORD
+            totals[key] = totals.get(key, 0.0) + s.duration
+        return totals
+
+
+# ============================================================================
+# TEMPLATE MATCHER
+# ============================================================================
+
+class ChordTemplateMatcher:
+    """
+    Chroma -> chord states by template scoring and Viterbi smoothing.
+    """
+
+    def __init__(self, qualities: Optional[List[str]] = None,
+                 switch_probability: float = 0.01,
+                 emission_scale: float = 20.0,
+                 no_chord_score: float = 0.55):
+        """
+        Build templates.
+
+        Args:
+            qualities: CHORD_REGISTRY keys to detect (default: all of them)
+            switch_probability: Per-frame chance of changing chord
+                                (0.01 at ~86 frames/s = about one change a second)
+            emission_scale: Log-likelihood per unit of cosine score
+            no_chord_score: Score of the "no chord" state; frames that match
+                            no template better than this are left unlabelled
+        """
+        registry = load_registry('chord')
+        self.qualities = list(registry) if qualities is None else list(qualities)
+        self.switch_probability = switch_probability
+        self.emission_scale = emission_scale
+        self.no_chord_score = no_chord_score
+
+        # State s < 12*Q: root = s % 12, quality = s // 12; last state = no chord
+        templates = np.zeros((12 * len(self.qualities), 12))
+        for q, quality in enumerate(self.qualities):
+            for semitone in chord_semitones(quality):
+                for root in range(12):
+                    templates[12 * q + root, (root + semitone) % 12] = 1.0
+        templates /= np.linalg.norm(templates, axis=1, keepdims=True)
+        self.templates = templates
+
+        self.labels = [f"{NOTE_NAMES[s % 12]}:{self.qualities[s // 12]}" for s in range(len(templates))]
+        self.labels.append(NO_CHORD)
+        self.coords = [self._quality_coords(registry[self.qualities[s // 12]])
+                       for s in range(len(templates))]
+        self.coords.append(None)
+        self.coord_table = np.array([c if c is not None else (np.nan,) * 4 for c in self.coords])
+
+    @staticmethod
+    def _quality_coords(entry) -> Tuple[float, float, float, float]:
+        return (entry.L, entry.J, entry.P, entry.W)
+
+    @property
+    def n_states(self) -> int:
+        return len(self.templates) + 1
+
+    def scores(self, chroma: np.ndarray) -> np.ndarray:
+        """(T, S) cosine similarity of every frame with every state"""
+        chroma = np.asarray(chroma, dtype=float)
+        norms = np.linalg.norm(chroma, axis=1, keepdims=True)
+        unit = np.divide(chroma, norms, out=np.zeros_like(chroma), where=norms > 0)
+        out = np.empty((len(chroma), self.n_states))
+        np.matmul(unit, self.templates.T, out=out[:, :-1])
+        out[:, -1] = self.no_chord_score
+        return out
+
+    def decode(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Most likely state sequence (Viterbi) for (T, S) template scores.
+
+        Transitions are "stay" or "jump anywhere uniformly", so the best
+        predecessor of a state is either itself or the overall best state
+        of the previous frame.
+        """
+        n_frames, n_states = scores.shape
+        if n_frames == 0:
+            return np.empty(0, dtype=np.int64)
+        log_stay = np.log1p(-self.switch_probability)
+        log_jump = np.log(self.switch_probability / (n_states - 1))
+        emission = scores * self.emission_scale
+
+        jumped = np.empty((n_frames, n_states), dtype=bool)
+        best_prev = np.empty(n_frames, dtype=np.int64)
+        delta = emission[0].copy()
+        stay = np.empty(n_states)
+        for t in range(1, n_frames):
+            b = int(np.argmax(delta))
+            best_prev[t] = b
+            jump = delta[b] + log_jump
+            np.add(delta, log_stay, out=stay)
+            np.less(stay, jump, out=jumped[t])
+            np.maximum(stay, jump, out=delta)
+            delta += emission[t]
+
+        states = np.empty(n_frames, dtype=np.int64)
+        s = int(np.argmax(delta))
+        for t in range(n_frames - 1, -1, -1):
+            states[t] = s
+            if t > 0 and jumped[t, s]:
+                s = int(best_prev[t])
+        return states
+
+    def timeline(self, chroma: np.ndarray,
+                 frame_rate: float = DEFAULT_FRAME_RATE) -> ChordTimeline:
+        """
+        Chord segments of a (T, 12) chroma matrix.
+
+        Args:
+            chroma: One 12-bin chroma vector per frame
+            frame_rate: Frames per second (sample_rate / hop_size)
+        """
+        scores = self.scores(chroma)
+        states = self.decode(scores)
+        segments = []
+        if len(states):
+            change = np.flatnonzero(np.diff(states)) + 1
+            starts = np.concatenate([[0], change])
+            stops = np.concatenate([change, [len(states)]])
+            frame_scores = scores[np.arange(len(states)), states]
+            confidence = np.add.reduceat(frame_scores, starts) / (stops - starts)
+            n_templates = len(self.templates)
+            for a, b, c in zip(starts, stops, confidence):
+                s = int(states[a])
+                chorded = s < n_templates
+                segments.append(ChordSegment(
+                    start=a / frame_rate,
+                    end=b / frame_rate,
+                    label=self.labels[s],
+                    root=s % 12 if chorded else None,
+                    quality=self.qualities[s // 12] if chorded else None,
+                    confidence=float(c),
+                    coords=self.coords[s],
+                ))
+        return ChordTimeline(segments, states, frame_rate, self.coord_table)
+
+
+def chord_timeline(chroma: np.ndarray, frame_rate: float = DEFAULT_FRAME_RATE,
+                   **kwargs) -> ChordTimeline:
+    """One-call chroma -> ChordTimeline (kwargs go to ChordTemplateMatcher)"""
+    return ChordTemplateMatcher(**kwargs).timeline(chroma, frame_rate)
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("LJPW V7.7 — CHORD TIMELINE TEST")
+    print("=" * 70)
+
+    matcher = ChordTemplateMatcher()
+    rng = np.random.default_rng(0)
+
+    def synth(progression, seconds_per_chord=2.0, noise=0.35, repeats=1):
+        """Noisy chroma for a list of (root, quality) chords"""
+        frames_per_chord = int(seconds_per_chord * DEFAULT_FRAME_RATE)
+        truth = []
+        for root, quality in progression * repeats:
+            s = 12 * matcher.qualities.index(quality) + root
+            truth.extend([s] * frames_per_chord)
+        truth = np.array(truth)
+        chroma = matcher.templates[truth] + noise * rng.random((len(truth), 12))
+        return chroma, truth
+
+    # 1. I - V - vi - IV in C, with noisy chroma
+    pop = [(0, 'Maj'), (7, 'Maj'), (9, 'Min'), (5, 'Maj')]
+    chroma, truth = synth(pop, repeats=2)
+    result = matcher.timeline(chroma)
+    raw = np.argmax(matcher.scores(chroma), axis=1)
+    print(f"\n1. Frame accuracy: raw argmax {np.mean(raw == truth):.1%}, "
+          f"Viterbi {np.mean(result.states == truth):.1%}")
+    for seg in result.segments[:4]:
+        print(f"   {seg.start:5.2f}-{seg.end:5.2f}s  {seg.label:<8} conf={seg.confidence:.2f}  "
+              f"LJPW={seg.coords}")
+    trajectory = result.ljpw_trajectory()
+    print(f"   Per-frame LJPW trajectory {trajectory.shape}, "
+          f"L range {np.nanmin(trajectory[:, 0]):.2f}-{np.nanmax(trajectory[:, 0]):.2f}")
+    print(f"   Song-level LJPW (duration-weighted): "
+          f"{tuple(round(v, 3) for v in result.mean_coordinates())}")
+
+    # 2. A 45-minute album of jazz-ish changes
+    changes = [(2, 'Min7'), (7, 'Dom7'), (0, 'Maj7'), (9, 'Dom7')]
+    album_seconds = 45 * 60
+    chroma, truth = synth(changes, repeats=int(album_seconds / (2.0 * len(changes))))
+    t0 = time.perf_counter()
+    album = matcher.timeline(chroma)
+    elapsed = time.perf_counter() - t0
+    print(f"\n2. {album.duration / 60:.0f}-minute album ({len(chroma):,} frames, "
+          f"{matcher.n_states} states): {elapsed:.2f}s = {album.duration / elapsed:,.0f}x real time")
+    print(f"   Frame accuracy {np.mean(album.states == truth):.1%}, {len(album)} segments")
+    print(f"   Time per quality: {dict((k, round(v)) for k, v in album.quality_time().items())}")
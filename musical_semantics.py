@@ -1,14 +1,16 @@
-### File 3: `musical_semantics.py` (NEW)
-
-```python
 """
 LJPW Framework V7.7 — Musical Semantics
 Connects abstract LJPW coordinates to concrete musical structures
 (Intervals, Chords, Modes).
 """
 
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional, Sequence, Union
 import numpy as np
 from enum import Enum
 
@@ -75,51 +77,395 @@ class ModeSemantics:
 # SEMANTIC REGISTRIES (Data from LJPW Musical Semantics Doc)
 # ============================================================================
 
-# 1. INTERVALS
-# Key Insight: Major 3rd is the "Love Interval" (L=0.95)
-#              Tritone is the "Devil's Interval" (Entropic)
-INTERVAL_REGISTRY: Dict[str, IntervalSemantics] = {
-    'P1':  IntervalSemantics('Unison', 0, 0.85, 0.95, 0.60, 0.50, 0.603, 'Justice', 'AUTOPOIETIC'),
-    'm2':  IntervalSemantics('Minor 2nd', 1, 0.30, 0.20, 0.75, 0.65, 0.466, 'Power', 'ENTROPIC'),
-    'M2':  IntervalSemantics('Major 2nd', 2, 0.45, 0.55, 0.70, 0.60, 0.535, 'Power', 'HOMEOSTATIC'),
-    'm3':  IntervalSemantics('Minor 3rd', 3, 0.75, 0.70, 0.55, 0.65, 0.591, 'Love', 'HOMEOSTATIC'),
-    'M3':  IntervalSemantics('Major 3rd', 4, 0.95, 0.75, 0.65, 0.70, 0.655, 'Love', 'AUTOPOIETIC'), # LOVE INTERVAL
-    'P4':  IntervalSemantics('Perfect 4th', 5, 0.70, 0.85, 0.70, 0.75, 0.660, 'Justice', 'AUTOPOIETIC'),
-    'TT':  IntervalSemantics('Tritone', 6, 0.15, 0.15, 0.85, 0.90, 0.451, 'Wisdom', 'ENTROPIC'),
-    'P5':  IntervalSemantics('Perfect 5th', 7, 0.80, 0.90, 0.95, 0.80, 0.767, 'Power', 'AUTOPOIETIC'), # POWER FOUNDATION
-    'm6':  IntervalSemantics('Minor 6th', 8, 0.70, 0.65, 0.60, 0.75, 0.603, 'Wisdom', 'AUTOPOIETIC'),
-    'M6':  IntervalSemantics('Major 6th', 9, 0.85, 0.80, 0.55, 0.70, 0.627, 'Love', 'AUTOPOIETIC'),
-    'm7':  IntervalSemantics('Minor 7th', 10, 0.50, 0.50, 0.80, 0.85, 0.571, 'Wisdom', 'HOMEOSTATIC'),
-    'M7':  IntervalSemantics('Major 7th', 11, 0.40, 0.45, 0.75, 0.90, 0.538, 'Wisdom', 'HOMEOSTATIC'),
-    'P8':  IntervalSemantics('Octave', 12, 0.90, 0.98, 0.75, 0.85, 0.764, 'Justice', 'AUTOPOIETIC'),
-}
+# The registries live in a versioned data file next to this module and are
+# parsed on first access, so importing the module stays cheap:
+#
+#   INTERVAL_REGISTRY  Major 3rd is the "Love Interval" (L=0.95),
+#                      Tritone the "Devil's Interval" (Entropic)
+#   CHORD_REGISTRY     Major Triad = Love Chord, Power Chord = Power Chord
+#   MODE_REGISTRY      Ionian = Love (Happy), Locrian = Entropic (Unstable)
+#
+# `from musical_semantics import CHORD_REGISTRY` keeps working through the
+# module-level __getattr__ below; code in this module uses load_registry().
 
-# 2. CHORDS
-# Key Insight: Major Triad = Love Chord, Power Chord = Power Chord
-CHORD_REGISTRY: Dict[str, ChordSemantics] = {
-    'Maj':  ChordSemantics('Major Triad', 'Root+M3+P5', 0.90, 0.85, 0.80, 0.75, 0.731, 'Love', 'AUTOPOIETIC'),
-    'Min':  ChordSemantics('Minor Triad', 'Root+m3+P5', 0.75, 0.80, 0.75, 0.80, 0.688, 'Justice', 'AUTOPOIETIC'),
-    'Dim':  ChordSemantics('Diminished', 'Root+m3+TT', 0.25, 0.30, 0.85, 0.90, 0.490, 'Wisdom', 'ENTROPIC'),
-    'Aug':  ChordSemantics('Augmented', 'Root+M3+m6', 0.60, 0.40, 0.80, 0.85, 0.567, 'Wisdom', 'HOMEOSTATIC'),
-    'Maj7': ChordSemantics('Major 7th', 'Maj+M7', 0.85, 0.75, 0.70, 0.90, 0.699, 'Wisdom', 'AUTOPOIETIC'),
-    'Min7': ChordSemantics('Minor 7th', 'min+m7', 0.70, 0.70, 0.75, 0.85, 0.660, 'Wisdom', 'AUTOPOIETIC'),
-    'Dom7': ChordSemantics('Dominant 7th', 'Maj+m7', 0.75, 0.60, 0.90, 0.80, 0.657, 'Power', 'AUTOPOIETIC'),
-    'Sus4': ChordSemantics('Sus4', 'Root+P4+P5', 0.65, 0.90, 0.75, 0.70, 0.652, 'Justice', 'AUTOPOIETIC'),
-    'Power': ChordSemantics('Power Chord', 'Root+P5', 0.55, 0.80, 0.98, 0.50, 0.588, 'Power', 'AUTOPOIETIC'),
-}
+REGISTRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'musical_registries.json')
+REGISTRY_FORMAT = 'ljpw-musical-registries'
+REGISTRY_FORMAT_VERSION = 1
 
-# 3. MODES
-# Key Insight: Ionian = Love (Happy), Locrian = Entropic (Unstable)
-MODE_REGISTRY: Dict[str, ModeSemantics] = {
-    'Ionian': ModeSemantics('Ionian (Major)', 'C-D-E-F-G-A-B', 0.90, 0.85, 0.75, 0.70, 0.699, 'Love', 'AUTOPOIETIC'),
-    'Dorian': ModeSemantics('Dorian', 'D-E-F-G-A-B-C', 0.75, 0.80, 0.70, 0.85, 0.683, 'Wisdom', 'AUTOPOIETIC'),
-    'Phrygian': ModeSemantics('Phrygian', 'E-F-G-A-B-C-D', 0.40, 0.55, 0.85, 0.90, 0.565, 'Wisdom', 'HOMEOSTATIC'),
-    'Lydian': ModeSemantics('Lydian', 'F-G-A-B-C-D-E', 0.85, 0.70, 0.60, 0.95, 0.656, 'Wisdom', 'AUTOPOIETIC'),
-    'Mixolydian': ModeSemantics('Mixolydian', 'G-A-B-C-D-E-F', 0.70, 0.65, 0.90, 0.75, 0.652, 'Power', 'AUTOPOIETIC'),
-    'Aeolian': ModeSemantics('Aeolian (Minor)', 'A-B-C-D-E-F-G', 0.65, 0.75, 0.65, 0.80, 0.629, 'Wisdom', 'AUTOPOIETIC'),
-    'Locrian': ModeSemantics('Locrian', 'B-C-D-E-F-G-A', 0.20, 0.25, 0.80, 0.85, 0.471, 'Wisdom', 'ENTROPIC'),
+# name -> (section in the data file, entry class)
+_REGISTRY_SECTIONS = {
+    'interval': ('intervals', IntervalSemantics),
+    'chord': ('chords', ChordSemantics),
+    'mode': ('modes', ModeSemantics),
+}
+_REGISTRY_ATTRIBUTES = {
+    'INTERVAL_REGISTRY': 'interval',
+    'CHORD_REGISTRY': 'chord',
+    'MODE_REGISTRY': 'mode',
 }
 
+_registry_data: Optional[Dict] = None
+_registries: Dict[str, Dict] = {}
+_compiled: Dict[str, 'CompiledRegistry'] = {}
+_registry_lock = threading.Lock()
+
+
+def _read_registry_file() -> Dict:
+    global _registry_data
+    if _registry_data is None:
+        with open(REGISTRY_FILE, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') != REGISTRY_FORMAT:
+            raise ValueError(f"{REGISTRY_FILE} is not an LJPW registry file")
+        if data.get('version', 0) > REGISTRY_FORMAT_VERSION:
+            raise ValueError(f"{REGISTRY_FILE}: registry version {data['version']} is newer than supported")
+        _registry_data = data
+    return _registry_data
+
+
+def load_registry(name: str) -> Dict:
+    """
+    Registry dict ('interval', 'chord' or 'mode'), parsed on first access.
+
+    Returns the same dict object on every call.
+    """
+    registry = _registries.get(name)
+    if registry is None:
+        with _registry_lock:
+            registry = _registries.get(name)
+            if registry is None:
+                section, entry_type = _REGISTRY_SECTIONS[name]
+                rows = _read_registry_file()[section]
+                registry = {key: entry_type(*row) for key, row in rows.items()}
+                _registries[name] = registry
+    return registry
+
+
+def compiled_registry(name: str) -> 'CompiledRegistry':
+    """Shared CompiledRegistry of a registry, built on first access"""
+    compiled = _compiled.get(name)
+    if compiled is None:
+        compiled = _compiled.setdefault(name, CompiledRegistry(load_registry(name)))
+    return compiled
+
+
+def __getattr__(name: str):
+    if name in _REGISTRY_ATTRIBUTES:
+        return load_registry(_REGISTRY_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ============================================================================
+# INSIGHT RULES
+# ============================================================================
+
+@dataclass(frozen=True)
+class InsightRule:
+    """
+    One music-theory insight as data.
+
+    source is a dimension ('L', 'J', 'P', 'W') compared with `value` by
+    op ('>' or '<'), or a registry ('interval', 'chord', 'mode') whose best
+    match must equal the key `value`.
+    """
+    id: str
+    source: str
+    op: str
+    value: Union[float, str]
+    text: str
+
+
+# Rendering order of the insights (bit i of an insight bitset = rule i)
+INSIGHT_RULES: Tuple[InsightRule, ...] = (
+    InsightRule('HIGH_LOVE', 'L', '>', 0.85, "🎵 HIGH LOVE: Melody is likely strong, attractive, and memorable."),
+    InsightRule('LOW_LOVE', 'L', '<', 0.4, "⚠️ LOW LOVE: Melody may be weak or fragmented. Connection is lost."),
+    InsightRule('HIGH_JUSTICE', 'J', '>', 0.85, "🎵 HIGH JUSTICE: Harmony is balanced and resolved. Consonant."),
+    InsightRule('LOW_JUSTICE', 'J', '<', 0.4, "⚠️ LOW JUSTICE: Dissonance is likely. Tension not resolved."),
+    InsightRule('HIGH_POWER', 'P', '>', 0.85, "🎵 HIGH POWER: Strong rhythmic drive. High energy."),
+    InsightRule('LOW_POWER', 'P', '<', 0.4, "⚠️ LOW POWER: Rhythm is weak. Lacks momentum."),
+    InsightRule('HIGH_WISDOM', 'W', '>', 0.85, "🎵 HIGH WISDOM: Complex timbral structure. Rich information."),
+    InsightRule('LOW_WISDOM', 'W', '<', 0.4, "⚠️ LOW WISDOM: Timbre is simple or predictable."),
+    InsightRule('MAJOR_3RD', 'interval', '==', 'M3',
+                "❤️ MAJOR 3RD PRESENCE: The 'Love Interval' is dominant. Expect happiness/connection."),
+    InsightRule('TRITONE', 'interval', '==', 'TT',
+                "👿 TRITONE PRESENCE: The 'Devil's Interval'. High tension, requires resolution."),
+    InsightRule('PERFECT_5TH', 'interval', '==', 'P5',
+                "⚡ PERFECT 5TH PRESENCE: Power foundation. Stable and driving."),
+    InsightRule('MAJOR_TRIAD', 'chord', '==', 'Maj', "🌸 MAJOR TRIAD: The 'Love Chord'. Classic, happy resolution."),
+    InsightRule('POWER_CHORD', 'chord', '==', 'Power', "⚡ POWER CHORD: Rock/Metal vibe. Pure energy, no harmony nuance."),
+    InsightRule('DIMINISHED', 'chord', '==', 'Dim', "🌑 DIMINISHED CHORD: Unstable, Entropic. Needs resolution."),
+    InsightRule('IONIAN', 'mode', '==', 'Ionian', "☀️ IONIAN MODE: The 'Love Mode'. Bright, major, happy."),
+    InsightRule('LOCRIAN', 'mode', '==', 'Locrian', "🌑 LOCRIAN MODE: The 'Entropic Mode'. Unstable, dark."),
+)
+
+INSIGHT_IDS: Tuple[str, ...] = tuple(rule.id for rule in INSIGHT_RULES)
+
+_DIMENSION_COLUMN = {'L': 0, 'J': 1, 'P': 2, 'W': 3}
+
+
+def evaluate_insights(coords: np.ndarray, matches: Dict[str, np.ndarray],
+                      rules: Sequence[InsightRule] = INSIGHT_RULES) -> np.ndarray:
+    """
+    Insight bitset per track: bit i is set when rules[i] fires.
+
+    Args:
+        coords: (N, 4) L, J, P, W
+        matches: {'interval' | 'chord' | 'mode': (N,) best-match row index}
+        rules: Rules to evaluate (at most 64)
+
+    Returns:
+        (N,) unsigned integer bitsets
+    """
+    dtype = np.uint32 if len(rules) <= 32 else np.uint64
+    bits = np.zeros(len(coords), dtype=dtype)
+    for i, rule in enumerate(rules):
+        if rule.source in _DIMENSION_COLUMN:
+            column = coords[:, _DIMENSION_COLUMN[rule.source]]
+            mask = column > rule.value if rule.op == '>' else column < rule.value
+        else:
+            mask = matches[rule.source] == compiled_registry(rule.source).keys.index(rule.value)
+        bits |= mask.astype(dtype) << dtype(i)
+    return bits
+
+
+def render_insights(bits: int, rules: Sequence[InsightRule] = INSIGHT_RULES) -> List[str]:
+    """Insight texts of one bitset, in rule order"""
+    bits = int(bits)
+    return [rule.text for i, rule in enumerate(rules) if bits >> i & 1]
+
+
+def insight_counts(bits: np.ndarray, rules: Sequence[InsightRule] = INSIGHT_RULES) -> Dict[str, int]:
+    """How many tracks each insight fired for"""
+    bits = np.asarray(bits)
+    return {rule.id: int(np.count_nonzero(bits >> bits.dtype.type(i) & 1))
+            for i, rule in enumerate(rules)}
+
+
+# ============================================================================
+# COMPILED REGISTRIES (BATCHED NEAREST-NEIGHBOUR SEARCH)
+# ============================================================================
+
+# Distances computed per top_k block (bounds peak memory for large N * K)
+BLOCK_ELEMENTS = 1 << 21
+
+# Registries larger than this use the matmul expansion for distances
+EXPANSION_THRESHOLD = 256
+
+
+def as_query_matrix(queries: Union[np.ndarray, LJPWCoordinates, Sequence[LJPWCoordinates]]) -> np.ndarray:
+    """(N, 4) float array from an array, one LJPWCoordinates or a sequence of them"""
+    if isinstance(queries, LJPWCoordinates):
+        return queries.to_array()[None, :]
+    if len(queries) and isinstance(queries[0], LJPWCoordinates):
+        return np.array([q.to_array() for q in queries], dtype=float)
+    matrix = np.asarray(queries, dtype=float)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    if matrix.ndim != 2 or matrix.shape[1] != 4:
+        raise ValueError(f"Queries must have shape (N, 4), got {matrix.shape}")
+    return matrix
+
+
+class CompiledRegistry:
+    """
+    A semantic registry compiled once into a contiguous (K, 4) matrix.
+
+    Row i of `matrix` holds (L, J, P, W) of entries[keys[i]], so results
+    come back as row indices that map to registry keys through `keys`.
+    """
+
+    def __init__(self, registry: Dict):
+        self.keys: Tuple[str, ...] = tuple(registry)
+        self.entries = tuple(registry.values())
+        self.matrix = np.ascontiguousarray(
+            [[v.L, v.J, v.P, v.W] for v in self.entries], dtype=float
+        )
+        self._norms = np.einsum('kd,kd->k', self.matrix, self.matrix)
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    def distances(self, queries: np.ndarray) -> np.ndarray:
+        """(N, K) Euclidean distances from every query to every entry"""
+        if len(self) <= EXPANSION_THRESHOLD:
+            diff = queries[:, None, :] - self.matrix[None, :, :]
+            return np.sqrt(np.einsum('nkd,nkd->nk', diff, diff))
+        # Large registries: |q|^2 - 2 q.m + |m|^2 is one matmul instead of
+        # an (N, K, 4) difference tensor
+        sq = queries @ self.matrix.T
+        sq *= -2.0
+        sq += np.einsum('nd,nd->n', queries, queries)[:, None]
+        sq += self._norms
+        np.maximum(sq, 0.0, out=sq)
+        return np.sqrt(sq, out=sq)
+
+    def top_k(self, queries, k: int = 3,
+              chunk_size: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        k nearest entries for every query.
+
+        Args:
+            queries: (N, 4) array, LJPWCoordinates or a sequence of them
+            k: Matches per query (clipped to the registry size)
+            chunk_size: Queries per distance block (default: sized so a
+                        block holds about BLOCK_ELEMENTS distances)
+
+        Returns:
+            indices: (N, k) row indices into keys, nearest first
+            distances: (N, k) matching distances
+        """
+        queries = as_query_matrix(queries)
+        n, size = len(queries), len(self)
+        k = min(k, size)
+        if chunk_size is None:
+            chunk_size = max(1, BLOCK_ELEMENTS // max(size, 1))
+        indices = np.empty((n, k), dtype=np.intp)
+        dists = np.empty((n, k))
+
+        for start in range(0, n, chunk_size):
+            block = self.distances(queries[start:start + chunk_size])
+            if k == 1:
+                idx = np.argmin(block, axis=1)[:, None]     # first of equal minima
+            elif k < size:
+                # Select the k smallest, then order only those. Equal
+                # distances rank by registry order, as a stable sort would.
+                part = np.sort(np.argpartition(block, k - 1, axis=1)[:, :k], axis=1)
+                part_d = np.take_along_axis(block, part, axis=1)
+                order = np.argsort(part_d, axis=1, kind='stable')
+                idx = np.take_along_axis(part, order, axis=1)
+                # Rows where a tie at the k-th distance left an earlier entry out
+                kth = np.take_along_axis(part_d, order[:, -1:], axis=1)
+                tied = np.count_nonzero(block <= kth, axis=1) > k
+                for row in np.flatnonzero(tied):
+                    idx[row] = np.argsort(block[row], kind='stable')[:k]
+            else:
+                idx = np.argsort(block, axis=1, kind='stable')
+            indices[start:start + len(block)] = idx
+            dists[start:start + len(block)] = np.take_along_axis(block, idx, axis=1)
+
+        return indices, dists
+
+    def nearest(self, coords: LJPWCoordinates, top_n: int = 3) -> List[Tuple[str, float]]:
+        """[(key, distance)] of the top_n entries nearest one coordinate"""
+        idx, dist = self.top_k(coords, top_n)
+        return [(self.keys[i], float(d)) for i, d in zip(idx[0], dist[0])]
+
+
+# ============================================================================
+# PROFILE CACHE
+# ============================================================================
+
+def _profile_bytes(value) -> int:
+    """Approximate memory of a cached profile (registry entries are shared, not counted)"""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + _profile_bytes(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_profile_bytes(v) for v in value)
+    if isinstance(value, (IntervalSemantics, ChordSemantics, ModeSemantics)):
+        return 0
+    return sys.getsizeof(value)
+
+
+class ProfileCache:
+    """
+    Thread-safe LRU cache of musical profiles keyed on quantized coordinates.
+
+    Coordinates are snapped to a grid of `resolution` before analysis, so
+    every query in a grid cell gets the profile of the cell's grid point,
+    whichever query arrived first. Cached profiles are shared: treat them
+    as read-only.
+    """
+
+    def __init__(self, max_entries: int = 100_000,
+                 max_bytes: Optional[int] = None,
+                 resolution: float = 1e-3):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Profiles kept before least-recently-used eviction
+            max_bytes: Approximate memory bound for cached profiles (None = off)
+            resolution: Grid spacing used to quantize L, J, P, W
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.resolution = resolution
+
+        self._entries: 'OrderedDict[Tuple[int, int, int, int], Tuple[Dict, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, coords: LJPWCoordinates) -> Tuple[int, int, int, int]:
+        """Grid cell of a coordinate"""
+        r = self.resolution
+        return (round(coords.L / r), round(coords.J / r),
+                round(coords.P / r), round(coords.W / r))
+
+    def snap(self, key: Tuple[int, int, int, int]) -> LJPWCoordinates:
+        """Grid point of a cell"""
+        r = self.resolution
+        return LJPWCoordinates(L=key[0] * r, J=key[1] * r, P=key[2] * r, W=key[3] * r,
+                               source="profile_cache")
+
+    def get_or_compute(self, coords: LJPWCoordinates,
+                       compute: Callable[[LJPWCoordinates], Dict]) -> Dict:
+        """Cached profile for the cell of `coords`, computing it on a miss"""
+        key = self.key(coords)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Analyze outside the lock; a concurrent miss on the same cell
+        # computes an identical profile and the first one stored wins
+        profile = compute(self.snap(key))
+        size = _profile_bytes(profile)
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                return existing[0]
+            self._entries[key] = (profile, size)
+            self.bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)
+            ):
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self.bytes -= old_size
+                self.evictions += 1
+        return profile
+
+    def clear(self) -> None:
+        """Drop every cached profile (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters, size and hit rate"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
+
 
 # ============================================================================
 # SEMANTIC ANALYSIS ENGINE
@@ -133,58 +479,105 @@ class MusicalSemanticsAnalyzer:
     best matching intervals, chords, and modes.
     """
     
-    def __init__(self):
-        # Pre-calculate coordinate arrays for fast search
-        self.interval_coords = {
-            k: np.array([v.L, v.J, v.P, v.W])
-            for k, v in INTERVAL_REGISTRY.items()
-        }
-        self.chord_coords = {
-            k: np.array([v.L, v.J, v.P, v.W])
-            for k, v in CHORD_REGISTRY.items()
-        }
-        self.mode_coords = {
-            k: np.array([v.L, v.J, v.P, v.W])
-            for k, v in MODE_REGISTRY.items()
+    def __init__(self, cache: Optional[ProfileCache] = None):
+        """
+        Initialize analyzer.
+        
+        Args:
+            cache: Memoize analyze_musical_profile on quantized coordinates
+                   (None = analyze every call). Cached profiles are computed
+                   at the snapped grid point, so near a threshold they can
+                   differ from an uncached call. Example: L=0.8504 snaps to
+                   0.850 and loses "HIGH LOVE" (L > 0.85). Use a finer
+                   resolution when that matters.
+        """
+        self.cache = cache
+
+        # Compile each registry once into a (K, 4) matrix for fast search
+        self.intervals = compiled_registry('interval')
+        self.chords = compiled_registry('chord')
+        self.modes = compiled_registry('mode')
+        self.registries: Dict[str, CompiledRegistry] = {
+            'interval': self.intervals,
+            'chord': self.chords,
+            'mode': self.modes,
         }
     
+    @property
+    def interval_coords(self) -> Dict[str, np.ndarray]:
+        """Per-key coordinate arrays (views into the compiled matrix)"""
+        return dict(zip(self.intervals.keys, self.intervals.matrix))
+    
+    @property
+    def chord_coords(self) -> Dict[str, np.ndarray]:
+        return dict(zip(self.chords.keys, self.chords.matrix))
+    
+    @property
+    def mode_coords(self) -> Dict[str, np.ndarray]:
+        return dict(zip(self.modes.keys, self.modes.matrix))
+    
     def find_nearest_interval(self, coords: LJPWCoordinates, top_n: int = 3) -> List[Tuple[str, float]]:
         """Find nearest musical interval by Euclidean distance"""
-        target = coords.to_array()
-        distances = {
-            k: np.linalg.norm(target - v)
-            for k, v in self.interval_coords.items()
-        }
-        sorted_items = sorted(distances.items(), key=lambda x: x[1])
-        return sorted_items[:top_n]
+        return self.intervals.nearest(coords, top_n)
     
     def find_nearest_chord(self, coords: LJPWCoordinates, top_n: int = 3) -> List[Tuple[str, float]]:
         """Find nearest chord"""
-        target = coords.to_array()
-        distances = {
-            k: np.linalg.norm(target - v)
-            for k, v in self.chord_coords.items()
-        }
-        sorted_items = sorted(distances.items(), key=lambda x: x[1])
-        return sorted_items[:top_n]
+        return self.chords.nearest(coords, top_n)
     
     def find_nearest_mode(self, coords: LJPWCoordinates, top_n: int = 3) -> List[Tuple[str, float]]:
         """Find nearest mode"""
-        target = coords.to_array()
-        distances = {
-            k: np.linalg.norm(target - v)
-            for k, v in self.mode_coords.items()
+        return self.modes.nearest(coords, top_n)
+    
+    def match_batch(self, queries, k: int = 1,
+                    chunk_size: Optional[int] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Top-k matches for many profiles against every registry.
+        
+        Args:
+            queries: (N, 4) array of (L, J, P, W) or a sequence of LJPWCoordinates
+            k: Matches per query and registry
+            chunk_size: Queries per distance block (default: automatic)
+        
+        Returns:
+            {'interval' | 'chord' | 'mode': (indices (N, k), distances (N, k))};
+            map indices to names with self.registries[name].keys
+        """
+        queries = as_query_matrix(queries)
+        return {
+            name: registry.top_k(queries, k, chunk_size)
+            for name, registry in self.registries.items()
         }
-        sorted_items = sorted(distances.items(), key=lambda x: x[1])
-        return sorted_items[:top_n]
+    
+    def related_structures(self, source: str, key: str, target: str,
+                           k: int = 3) -> List[Tuple[str, float]]:
+        """
+        Nearest entries of one registry to an entry of another, e.g.
+        related_structures('chord', 'Maj7', 'mode'), read from the cached
+        cross-registry distance tables (registry_distances).
+        
+        Args:
+            source: 'interval', 'chord' or 'mode'
+            key: Entry of the source registry
+            target: Registry to look in
+            k: Number of neighbours
+        """
+        from registry_distances import get_distance_tables
+        return get_distance_tables().neighbours(source, key, target, k)
     
     def analyze_musical_profile(self, coords: LJPWCoordinates) -> Dict:
         """
         Comprehensive musical profile analysis.
         
         Returns detailed breakdown of musical characteristics
-        implied by the LJPW coordinates.
+        implied by the LJPW coordinates. With a ProfileCache, repeated
+        (quantized) coordinates return the shared cached profile.
         """
+        if self.cache is not None:
+            return self.cache.get_or_compute(coords, self._analyze_profile)
+        return self._analyze_profile(coords)
+    
+    def _analyze_profile(self, coords: LJPWCoordinates) -> Dict:
+        """Uncached analysis behind analyze_musical_profile"""
         # Find nearest structures
         best_intervals = self.find_nearest_interval(coords)
         best_chords = self.find_nearest_chord(coords)
@@ -203,17 +596,22 @@ class MusicalSemanticsAnalyzer:
             
             'interval_analysis': {
                 'best_match': best_intervals[0],
-                'semantic_data': INTERVAL_REGISTRY[best_intervals[0][0]]
+                'semantic_data': load_registry('interval')[best_intervals[0][0]]
             },
             
             'chord_analysis': {
                 'best_match': best_chords[0],
-                'semantic_data': CHORD_REGISTRY[best_chords[0][0]]
+                'semantic_data': load_registry('chord')[best_chords[0][0]]
             },
             
             'mode_analysis': {
                 'best_match': best_modes[0],
-                'semantic_data': MODE_REGISTRY[best_modes[0][0]]
+                'semantic_data': load_registry('mode')[best_modes[0][0]]
+            },
+            
+            'related_structures': {
+                'modes_near_chord': self.related_structures('chord', best_chords[0][0], 'mode'),
+                'chords_near_interval': self.related_structures('interval', best_intervals[0][0], 'chord'),
             },
             
             'music_theory_insights': self._generate_insights(coords, best_intervals, best_chords, best_modes)
@@ -221,58 +619,32 @@ class MusicalSemanticsAnalyzer:
     
     def _generate_insights(self, coords: LJPWCoordinates, intervals, chords, modes) -> List[str]:
         """Generate narrative musical insights"""
-        insights = []
-        
-        # Love-based insights
-        if coords.L > 0.85:
-            insights.append("🎵 HIGH LOVE: Melody is likely strong, attractive, and memorable.")
-        elif coords.L < 0.4:
-            insights.append("⚠️ LOW LOVE: Melody may be weak or fragmented. Connection is lost.")
-        
-        # Justice-based insights
-        if coords.J > 0.85:
-            insights.append("🎵 HIGH JUSTICE: Harmony is balanced and resolved. Consonant.")
-        elif coords.J < 0.4:
-            insights.append("⚠️ LOW JUSTICE: Dissonance is likely. Tension not resolved.")
-        
-        # Power-based insights
-        if coords.P > 0.85:
-            insights.append("🎵 HIGH POWER: Strong rhythmic drive. High energy.")
-        elif coords.P < 0.4:
-            insights.append("⚠️ LOW POWER: Rhythm is weak. Lacks momentum.")
-        
-        # Wisdom-based insights
-        if coords.W > 0.85:
-            insights.append("🎵 HIGH WISDOM: Complex timbral structure. Rich information.")
-        elif coords.W < 0.4:
-            insights.append("⚠️ LOW WISDOM: Timbre is simple or predictable.")
-        
-        # Specific Match Insights
-        interval_name = intervals[0][0]
-        interval_data = INTERVAL_REGISTRY[interval_name]
-        
-        if interval_name == 'M3':
-            insights.append("❤️ MAJOR 3RD PRESENCE: The 'Love Interval' is dominant. Expect happiness/connection.")
-        elif interval_name == 'TT':
-            insights.append("👿 TRITONE PRESENCE: The 'Devil's Interval'. High tension, requires resolution.")
-        elif interval_name == 'P5':
-            insights.append("⚡ PERFECT 5TH PRESENCE: Power foundation. Stable and driving.")
-        
-        chord_name = chords[0][0]
-        if chord_name == 'Maj':
-            insights.append("🌸 MAJOR TRIAD: The 'Love Chord'. Classic, happy resolution.")
-        elif chord_name == 'Power':
-            insights.append("⚡ POWER CHORD: Rock/Metal vibe. Pure energy, no harmony nuance.")
-        elif chord_name == 'Dim':
-            insights.append("🌑 DIMINISHED CHORD: Unstable, Entropic. Needs resolution.")
+        matches = {
+            'interval': np.array([self.intervals.keys.index(intervals[0][0])]),
+            'chord': np.array([self.chords.keys.index(chords[0][0])]),
+            'mode': np.array([self.modes.keys.index(modes[0][0])]),
+        }
+        bits = evaluate_insights(coords.to_array()[None, :], matches)
+        return render_insights(bits[0])
+    
+    def insight_bits(self, queries, chunk_size: int = 1_000_000) -> np.ndarray:
+        """
+        Insight bitsets for many tracks (see INSIGHT_RULES / render_insights).
         
-        mode_name = modes[0][0]
-        if mode_name == 'Ionian':
-            insights.append("☀️ IONIAN MODE: The 'Love Mode'. Bright, major, happy.")
-        elif mode_name == 'Locrian':
-            insights.append("🌑 LOCRIAN MODE: The 'Entropic Mode'. Unstable, dark.")
+        Args:
+            queries: (N, 4) array of (L, J, P, W) or a sequence of LJPWCoordinates
+            chunk_size: Tracks matched and tagged per pass step
         
-        return insights
+        Returns:
+            (N,) bitsets; bit i set when INSIGHT_RULES[i] fires
+        """
+        queries = as_query_matrix(queries)
+        bits = np.empty(len(queries), dtype=np.uint32)
+        for start in range(0, len(queries), chunk_size):
+            block = queries[start:start + chunk_size]
+            matches = {name: idx[:, 0] for name, (idx, _) in self.match_batch(block, k=1).items()}
+            bits[start:start + len(block)] = evaluate_insights(block, matches)
+        return bits
 
 
 # ============================================================================
@@ -294,6 +666,7 @@ if __name__ == "__main__":
     print(f"   Interval Match: {profile['interval_analysis']['best_match']}")
     print(f"   Chord Match: {profile['chord_analysis']['best_match']}")
     print(f"   Mode Match: {profile['mode_analysis']['best_match']}")
+    print(f"   Modes near that chord: {profile['related_structures']['modes_near_chord']}")
     print("   Insights:")
     for insight in profile['music_theory_insights']:
         print(f"     - {insight}")
@@ -319,4 +692,57 @@ if __name__ == "__main__":
     print("   Insights:")
     for insight in profile['music_theory_insights']:
         print(f"     - {insight}")
-```
+    
+    # Test 4: Batch matching of many tracks at once
+    import time
+    print("\n4. BATCH MATCHING:")
+    rng = np.random.default_rng(0)
+    tracks = rng.uniform(0.0, 1.0, size=(1_000_000, 4))
+    t0 = time.perf_counter()
+    matches = analyzer.match_batch(tracks, k=3)
+    elapsed = time.perf_counter() - t0
+    print(f"   {len(tracks):,} tracks x {sum(len(r) for r in analyzer.registries.values())} "
+          f"registry entries, top-3 in {elapsed:.2f}s")
+    idx, dist = matches['chord']
+    counts = np.bincount(idx[:, 0], minlength=len(analyzer.chords))
+    top = np.argsort(-counts)[:3]
+    print(f"   Most common nearest chords: "
+          f"{[(analyzer.chords.keys[i], int(counts[i])) for i in top]}")
+    same = all(
+        analyzer.find_nearest_chord(LJPWCoordinates(*row))[0][0] == analyzer.chords.keys[idx[j, 0]]
+        for j, row in enumerate(tracks[:1000])
+    )
+    print(f"   Agrees with find_nearest_chord on 1000 samples: {same}")
+    
+    # Test 5: Memoized profiles for repeated coordinates
+    print("\n5. PROFILE CACHE:")
+    cached = MusicalSemanticsAnalyzer(cache=ProfileCache(max_entries=10_000, resolution=1e-3))
+    palette = rng.uniform(0.2, 1.0, size=(500, 4))
+    stream = palette[rng.integers(len(palette), size=20_000)] + rng.normal(0, 1e-5, size=(20_000, 4))
+    stream = [LJPWCoordinates(*row) for row in stream]
+    t0 = time.perf_counter()
+    for c in stream:
+        analyzer.analyze_musical_profile(c)
+    uncached_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for c in stream:
+        cached.analyze_musical_profile(c)
+    cached_s = time.perf_counter() - t0
+    stats = cached.cache.stats()
+    print(f"   {len(stream):,} profiles: uncached {uncached_s:.2f}s, cached {cached_s:.2f}s")
+    print(f"   hits={stats['hits']} misses={stats['misses']} hit_rate={stats['hit_rate']:.3f} "
+          f"~{stats['bytes'] // 1024} KiB")
+    
+    # Test 6: Insight tagging for a whole catalog
+    print("\n6. CATALOG INSIGHT TAGGING:")
+    t0 = time.perf_counter()
+    bits = analyzer.insight_bits(tracks)
+    elapsed = time.perf_counter() - t0
+    counts = insight_counts(bits)
+    print(f"   {len(tracks):,} tracks tagged in {elapsed:.2f}s")
+    print(f"   Most frequent: {sorted(counts.items(), key=lambda kv: -kv[1])[:4]}")
+    same = all(
+        render_insights(bits[j]) == analyzer._analyze_profile(LJPWCoordinates(*row))['music_theory_insights']
+        for j, row in enumerate(tracks[:1000])
+    )
+    print(f"   Same text as analyze_musical_profile on 1000 samples: {same}")
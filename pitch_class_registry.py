@@ -0,0 +1,372 @@
+"""
+LJPW Framework V7.7 — Pitch-Class Set Registry
+Every chord quality, voicing root and scale as an LJPW coordinate.
+
+The hand-entered registries in musical_semantics cover 13 intervals,
+9 chords and 7 modes. This module derives coordinates for every non-empty
+subset of the 12 pitch classes heard from each of its members as root,
+by composing INTERVAL_REGISTRY values:
+
+    pair term  = mean of interval-class coordinates weighted by the
+                 set's interval vector (ic1..ic6)
+    root term  = mean of the intervals from the root to every other member
+    coords     = ROOT_WEIGHT * root term + (1 - ROOT_WEIGHT) * pair term
+
+Interval class k stands for both k and 12-k semitones, so its coordinate
+is the mean of the two intervals (ic6 is the tritone alone). A single
+pitch class is a unison.
+
+Both terms depend only on the intervals, so all 12 transpositions of a
+voiced set share one coordinate. The registry therefore stores one row
+per root-relative set (the 2^11 = 2048 sets containing pitch class 0):
+the 4095 sets x their roots (24576 pairs) map onto these rows through
+relative_mask(), and searching 2048 rows instead of 24576 identical
+dozen-fold copies keeps batch matching 12x cheaper.
+
+The generated matrix is cached in a binary .npz file, loaded on first use
+and searched with the same CompiledRegistry.top_k batch API.
+"""
+
+import hashlib
+import os
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+from musical_semantics import CompiledRegistry, load_registry
+
+
+FORMAT_VERSION = 1
+ROOT_WEIGHT = 0.5
+CACHE_FILE = 'pitch_class_registry.npz'
+
+NOTE_NAMES = ('C', 'C#', 'D', 'Eb', 'E', 'F', 'F#', 'G', 'Ab', 'A', 'Bb', 'B')
+DIMENSION_NAMES = {'L': 'Love', 'J': 'Justice', 'P': 'Power', 'W': 'Wisdom'}
+
+_NOTE_INDEX = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+_BITS = 1 << np.arange(12)
+
+_QUALITIES: Optional[Dict[int, str]] = None
+
+
+def default_cache_path(filename: str = CACHE_FILE) -> str:
+    """$LJPW_CACHE_DIR/<filename> (default directory ~/.cache/ljpw)"""
+    directory = os.environ.get('LJPW_CACHE_DIR',
+                               os.path.join(os.path.expanduser('~'), '.cache', 'ljpw'))
+    return os.path.join(directory, filename)
+
+
+# What np.load raises on a missing, truncated, empty or foreign cache file
+CACHE_READ_ERRORS = (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile)
+
+
+def save_npz_atomic(path: str, **arrays: np.ndarray) -> str:
+    """
+    Write an .npz through a private temporary file in the same directory
+    and rename it into place, so readers and concurrent writers never see
+    a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+
+# ============================================================================
+# SET ARITHMETIC
+# ============================================================================
+
+def pitch_classes(mask: int) -> List[int]:
+    """Pitch classes (0 = C) present in a 12-bit set mask"""
+    return [pc for pc in range(12) if mask >> pc & 1]
+
+
+def set_mask(pcs) -> int:
+    """12-bit mask of an iterable of pitch classes"""
+    mask = 0
+    for pc in pcs:
+        mask |= 1 << (pc % 12)
+    return mask
+
+
+def interval_vectors(bits: np.ndarray) -> np.ndarray:
+    """
+    Interval vectors (ic1..ic6 counts) of sets given as (N, 12) 0/1 rows.
+
+    Counts unordered pairs: pairs (p, p+k) for k = 1..6, with the tritone
+    halved because (p, p+6) and (p+6, p+12) are the same pair.
+    """
+    vectors = np.stack([np.sum(bits * np.roll(bits, -k, axis=1), axis=1)
+                        for k in range(1, 7)], axis=1)
+    vectors[:, 5] //= 2
+    return vectors
+
+
+def _interval_table() -> np.ndarray:
+    """(13, 4) coordinates of 0..12 semitones from INTERVAL_REGISTRY"""
+    table = np.empty((13, 4))
+    for v in load_registry('interval').values():
+        table[v.semitones] = (v.L, v.J, v.P, v.W)
+    return table
+
+
+def _source_hash() -> str:
+    """Digest of everything the generated coordinates depend on"""
+    digest = hashlib.sha1()
+    digest.update(f"{FORMAT_VERSION}:{ROOT_WEIGHT}".encode())
+    digest.update(_interval_table().tobytes())
+    return digest.hexdigest()
+
+
+def generate_arrays() -> Dict[str, np.ndarray]:
+    """
+    Coordinates of every root-relative set.
+
+    Returns:
+        {'masks': (2048,) uint16 sets containing pitch class 0, ascending,
+         'matrix': (2048, 4) float64}
+    """
+    table = _interval_table()
+    ic_coords = np.array([(table[k] + table[12 - k]) / 2 for k in range(1, 6)] + [table[6]])
+
+    masks = 1 | (np.arange(2048) << 1)
+    bits = ((masks[:, None] & _BITS) > 0).astype(np.int64)
+
+    vectors = interval_vectors(bits)
+    n_pairs = vectors.sum(axis=1)
+    pair_term = np.where(n_pairs[:, None] > 0,
+                         vectors @ ic_coords / np.maximum(n_pairs, 1)[:, None],
+                         table[0])
+
+    above = bits[:, 1:]                          # members 1..11 semitones above the root
+    n_above = above.sum(axis=1)
+    root_term = np.where(n_above[:, None] > 0,
+                         above @ table[1:12] / np.maximum(n_above, 1)[:, None],
+                         table[0])
+
+    matrix = ROOT_WEIGHT * root_term + (1 - ROOT_WEIGHT) * pair_term
+    return {'masks': masks.astype(np.uint16), 'matrix': np.ascontiguousarray(matrix)}
+
+
+# ============================================================================
+# NAMES FOR KNOWN QUALITIES
+# ============================================================================
+
+def chord_semitones(key: str) -> Tuple[int, ...]:
+    """Semitones above the root of a CHORD_REGISTRY construction"""
+    intervals = load_registry('interval')
+    semitones = {0}
+    for token in load_registry('chord')[key].construction.split('+'):
+        if token == 'Root':
+            continue
+        if token in intervals:
+            semitones.add(intervals[token].semitones)
+        else:
+            semitones.update(chord_semitones(token.capitalize()))
+    return tuple(sorted(semitones))
+
+
+def mode_semitones(key: str) -> Tuple[int, ...]:
+    """Semitones above the tonic of a MODE_REGISTRY note list"""
+    notes = [_NOTE_INDEX[n] for n in load_registry('mode')[key].intervals.split('-')]
+    return tuple(sorted((n - notes[0]) % 12 for n in notes))
+
+
+def known_qualities() -> Dict[int, str]:
+    """Root-relative mask -> registry key for the hand-entered chords and modes"""
+    global _QUALITIES
+    if _QUALITIES is None:
+        qualities = {set_mask(mode_semitones(k)): k for k in load_registry('mode')}
+        qualities.update({set_mask(chord_semitones(k)): k for k in load_registry('chord')})
+        _QUALITIES = qualities
+    return _QUALITIES
+
+
+def relative_mask(mask: int, root: int) -> int:
+    """Mask transposed so that `root` becomes pitch class 0"""
+    return ((mask >> root) | (mask << (12 - root))) & 0xFFF
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+@dataclass
+class PitchClassSetSemantics:
+    """LJPW coordinates for a pitch-class set heard from one root"""
+    name: str
+    pitch_classes: str
+    mask: int
+    root: int
+    L: float
+    J: float
+    P: float
+    W: float
+    H: float
+    dominant: str
+    phase: str
+
+    def to_coords(self) -> LJPWCoordinates:
+        return LJPWCoordinates(L=self.L, J=self.J, P=self.P, W=self.W, source="pitch_class_set")
+
+
+class PitchClassRegistry(CompiledRegistry):
+    """
+    CompiledRegistry over every root-relative pitch-class set.
+
+    Row i is the set masks[i] (always containing 0 = the root). Keys are
+    built on first access ("Maj", "Ionian", "{0,1,6}"); entries are
+    materialized one at a time with entry(i, root).
+    """
+
+    def __init__(self, masks: np.ndarray, matrix: np.ndarray):
+        self.masks = masks
+        self.matrix = np.ascontiguousarray(matrix, dtype=float)
+        self._norms = np.einsum('kd,kd->k', self.matrix, self.matrix)
+        self._keys: Optional[Tuple[str, ...]] = None
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        if self._keys is None:
+            self._keys = tuple(self.name(i) for i in range(len(self)))
+        return self._keys
+
+    @property
+    def entries(self) -> List[PitchClassSetSemantics]:
+        return [self.entry(i) for i in range(len(self))]
+
+    def name(self, i: int) -> str:
+        """Registry key for known chords/modes, else the semitones above the root"""
+        mask = int(self.masks[i])
+        quality = known_qualities().get(mask)
+        if quality is None:
+            quality = '{' + ','.join(str(pc) for pc in pitch_classes(mask)) + '}'
+        return quality
+
+    def entry(self, i: int, root: int = 0) -> PitchClassSetSemantics:
+        """Semantic record of row i transposed onto `root`"""
+        mask = int(self.masks[i])
+        L, J, P, W = self.matrix[i].tolist()
+        coords = LJPWCoordinates(L=L, J=J, P=P, W=W, source="pitch_class_set")
+        return PitchClassSetSemantics(
+            name=f"{NOTE_NAMES[root % 12]}:{self.name(i)}",
+            pitch_classes='-'.join(NOTE_NAMES[(pc + root) % 12] for pc in pitch_classes(mask)),
+            mask=relative_mask(mask, -root % 12), root=root % 12,
+            L=L, J=J, P=P, W=W,
+            H=coords.harmony_static(),
+            dominant=DIMENSION_NAMES[coords.dominant_dimension()[0]],
+            phase=coords.phase().split()[0],
+        )
+
+    def index_of(self, pcs, root: Optional[int] = None) -> int:
+        """Row of a set of pitch classes (root defaults to the first one given)"""
+        pcs = [pc % 12 for pc in pcs]
+        root = pcs[0] if root is None else root % 12
+        if root not in pcs:
+            raise KeyError(f"root {root} is not a member of {sorted(set(pcs))}")
+        # masks are 1 | (k << 1) for k = 0..2047, i.e. row k
+        return relative_mask(set_mask(pcs), root) >> 1
+
+    def save(self, path: str) -> str:
+        """Write the binary cache atomically"""
+        return save_npz_atomic(path, masks=self.masks, matrix=self.matrix,
+                               source_hash=np.array(_source_hash()))
+
+    @classmethod
+    def generate(cls) -> 'PitchClassRegistry':
+        arrays = generate_arrays()
+        return cls(arrays['masks'], arrays['matrix'])
+
+    @classmethod
+    def load(cls, path: Optional[str] = None, rebuild: bool = False) -> 'PitchClassRegistry':
+        """
+        Load the cached registry, regenerating it if missing or stale.
+
+        Args:
+            path: Cache file (default: default_cache_path())
+            rebuild: Ignore any existing cache
+        """
+        path = path or default_cache_path()
+        if not rebuild and os.path.exists(path):
+            try:
+                with np.load(path) as data:
+                    if str(data['source_hash']) == _source_hash():
+                        return cls(data['masks'], data['matrix'])
+            except CACHE_READ_ERRORS:
+                pass                      # unreadable cache: regenerate below
+        registry = cls.generate()
+        try:
+            registry.save(path)
+        except OSError:
+            pass                          # read-only location: keep it in memory
+        return registry
+
+
+_REGISTRY: Optional[PitchClassRegistry] = None
+
+
+def get_pitch_class_registry(path: Optional[str] = None) -> PitchClassRegistry:
+    """Process-wide registry, loaded from the cache on first call"""
+    global _REGISTRY
+    if _REGISTRY is None or path is not None:
+        _REGISTRY = PitchClassRegistry.load(path)
+    return _REGISTRY
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    print("=" * 70)
+    print("LJPW V7.7 — PITCH-CLASS SET REGISTRY TEST")
+    print("=" * 70)
+
+    cache = os.path.join(tempfile.mkdtemp(prefix="ljpw_pcs_"), CACHE_FILE)
+
+    t0 = time.perf_counter()
+    registry = PitchClassRegistry.load(cache)
+    generated = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    registry = PitchClassRegistry.load(cache)
+    loaded = time.perf_counter() - t0
+    print(f"\n1. {len(registry)} root-relative sets (all 4095 sets x roots): generated in {generated * 1000:.1f} ms, "
+          f"reloaded from cache in {loaded * 1000:.1f} ms ({os.path.getsize(cache) // 1024} KiB)")
+
+    # 2. Derived coordinates of familiar structures vs the hand-entered ones
+    print("\n2. Derived vs hand-entered:")
+    for key, pcs in (('Maj', (0, 4, 7)), ('Min', (9, 0, 4)), ('Dim', (11, 2, 5)),
+                     ('Ionian', (0, 2, 4, 5, 7, 9, 11)), ('Locrian', (11, 0, 2, 4, 5, 7, 9))):
+        e = registry.entry(registry.index_of(pcs))
+        ref = load_registry('chord').get(key) or load_registry('mode')[key]
+        print(f"   {e.name:<12} derived ({e.L:.2f}, {e.J:.2f}, {e.P:.2f}, {e.W:.2f}) {e.phase:<12}"
+              f" registry ({ref.L:.2f}, {ref.J:.2f}, {ref.P:.2f}, {ref.W:.2f}) {ref.phase}")
+
+    # 3. Batch top-k over the full registry
+    rng = np.random.default_rng(0)
+    tracks = rng.uniform(0.2, 1.0, size=(100_000, 4))
+    t0 = time.perf_counter()
+    idx, dist = registry.top_k(tracks, k=5)
+    elapsed = time.perf_counter() - t0
+    print(f"\n3. {len(tracks):,} tracks x {len(registry)} entries, top-5 in {elapsed:.2f}s")
+
+    happy_pop = LJPWCoordinates(L=0.90, J=0.85, P=0.75, W=0.60, source="test")
+    print(f"   Happy pop nearest sets: {registry.nearest(happy_pop, 5)}")
+
+    # 4. Any voiced set maps onto its row
+    i = registry.index_of((7, 11, 2, 5))             # G-B-D-F
+    print(f"   G-B-D-F -> {registry.entry(i, root=7)}")
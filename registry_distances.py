@@ -0,0 +1,239 @@
+"""
+LJPW Framework V7.7 — Cross-Registry Distance Tables
+Interval <-> chord <-> mode relationships computed once.
+
+For every ordered pair of registries (a, b), including a registry with
+itself, DistanceTables holds
+
+    matrix(a, b)     (K_a, K_b) Euclidean LJPW distances
+    order(a, b)      every row's entries of b sorted nearest first
+
+so "how far is Maj from Ionian" and "the 3 modes nearest Maj7" are array
+reads. The tables are built on first use, written to an .npz cache, and
+rebuilt automatically when any registry's content hash changes.
+"""
+
+import hashlib
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from musical_semantics import CompiledRegistry, MusicalSemanticsAnalyzer
+from pitch_class_registry import CACHE_READ_ERRORS, default_cache_path, save_npz_atomic
+
+
+FORMAT_VERSION = 1
+CACHE_FILE = 'registry_distances.npz'
+
+
+def registry_hash(registry: CompiledRegistry) -> str:
+    """Digest of a registry's keys and coordinates"""
+    digest = hashlib.sha1()
+    digest.update('\x1f'.join(registry.keys).encode())
+    digest.update(np.ascontiguousarray(registry.matrix, dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def content_hash(registries: Dict[str, CompiledRegistry]) -> str:
+    """Digest of a named set of registries (order-sensitive)"""
+    digest = hashlib.sha1(f"v{FORMAT_VERSION}".encode())
+    for name, registry in registries.items():
+        digest.update(f"{name}:{registry_hash(registry)};".encode())
+    return digest.hexdigest()
+
+
+def pairwise_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(len(a), len(b)) Euclidean distances"""
+    diff = a[:, None, :] - b[None, :, :]
+    return np.sqrt(np.einsum('ijd,ijd->ij', diff, diff))
+
+
+# ============================================================================
+# DISTANCE TABLES
+# ============================================================================
+
+class DistanceTables:
+    """
+    All pairwise and cross-registry distance matrices with neighbour order.
+
+    Usage:
+        tables = get_distance_tables()
+        tables.distance('chord', 'Maj', 'mode', 'Ionian')
+        tables.neighbours('chord', 'Maj7', 'mode', k=3)
+    """
+
+    def __init__(self, registries: Dict[str, CompiledRegistry],
+                 arrays: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Build (or adopt previously built) tables.
+
+        Args:
+            registries: {name: CompiledRegistry}
+            arrays: Saved 'dist:a:b' / 'order:a:b' arrays (skips the computation)
+        """
+        self.registries = registries
+        self.names = tuple(registries)
+        self.content_hash = content_hash(registries)
+        self._index = {name: {key: i for i, key in enumerate(r.keys)}
+                       for name, r in registries.items()}
+
+        self._distances: Dict[Tuple[str, str], np.ndarray] = {}
+        self._orders: Dict[Tuple[str, str], np.ndarray] = {}
+        for a in self.names:
+            for b in self.names:
+                if arrays is not None:
+                    self._distances[a, b] = arrays[f'dist:{a}:{b}']
+                    self._orders[a, b] = arrays[f'order:{a}:{b}']
+                    continue
+                if (b, a) in self._distances:
+                    d = self._distances[b, a].T
+                else:
+                    d = pairwise_distances(registries[a].matrix, registries[b].matrix)
+                index_type = np.int16 if len(registries[b]) < np.iinfo(np.int16).max else np.int32
+                self._distances[a, b] = d
+                self._orders[a, b] = np.argsort(d, axis=1, kind='stable').astype(index_type)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.registries
+
+    # ------------------------------------------------------------------------
+    # LOOKUPS
+    # ------------------------------------------------------------------------
+
+    def index(self, registry: str, key: str) -> int:
+        """Row of a key within its registry"""
+        return self._index[registry][key]
+
+    def matrix(self, a: str, b: str) -> np.ndarray:
+        """(K_a, K_b) distances between the entries of two registries"""
+        return self._distances[a, b]
+
+    def order(self, a: str, b: str) -> np.ndarray:
+        """(K_a, K_b) entries of b, nearest first, for every entry of a"""
+        return self._orders[a, b]
+
+    def distance(self, a: str, key_a: str, b: str, key_b: str) -> float:
+        """Distance between one entry of a and one entry of b"""
+        return float(self._distances[a, b][self._index[a][key_a], self._index[b][key_b]])
+
+    def neighbours(self, a: str, key: str, b: str, k: int = 3) -> List[Tuple[str, float]]:
+        """
+        The k entries of b nearest an entry of a, as [(key, distance)].
+
+        Within one registry (a == b) the entry itself is skipped.
+        """
+        i = self._index[a][key]
+        row = self._orders[a, b][i]
+        if a == b:
+            row = row[row != i]
+        keys = self.registries[b].keys
+        d = self._distances[a, b][i]
+        return [(keys[j], float(d[j])) for j in row[:k]]
+
+    # ------------------------------------------------------------------------
+    # PERSISTENCE
+    # ------------------------------------------------------------------------
+
+    def save(self, path: str) -> str:
+        """Write every table and the content hash atomically"""
+        arrays = {'format_version': np.array(FORMAT_VERSION),
+                  'content_hash': np.array(self.content_hash)}
+        for (a, b), d in self._distances.items():
+            arrays[f'dist:{a}:{b}'] = d
+            arrays[f'order:{a}:{b}'] = self._orders[a, b]
+        return save_npz_atomic(path, **arrays)
+
+    @classmethod
+    def load(cls, registries: Dict[str, CompiledRegistry],
+             path: Optional[str] = None) -> 'DistanceTables':
+        """
+        Tables for `registries` from the cache, rebuilt if missing or stale.
+
+        Args:
+            registries: {name: CompiledRegistry}
+            path: Cache file (default $LJPW_CACHE_DIR/registry_distances.npz)
+        """
+        path = path or default_cache_path(CACHE_FILE)
+        expected = content_hash(registries)
+        if os.path.exists(path):
+            try:
+                with np.load(path) as data:
+                    if str(data['content_hash']) == expected:
+                        return cls(registries, {name: data[name] for name in data.files})
+            except CACHE_READ_ERRORS:
+                pass                      # unreadable cache: rebuild below
+        tables = cls(registries)
+        try:
+            tables.save(path)
+        except OSError:
+            pass                          # read-only location: keep it in memory
+        return tables
+
+
+_TABLES: Dict[Tuple[bool, Optional[str]], DistanceTables] = {}
+
+
+def get_distance_tables(include_pitch_class_sets: bool = False,
+                        path: Optional[str] = None) -> DistanceTables:
+    """
+    Process-wide tables over the interval, chord and mode registries
+    (optionally also the pitch-class set registry), built on first call.
+    """
+    key = (include_pitch_class_sets, path)
+    if key not in _TABLES:
+        registries = dict(MusicalSemanticsAnalyzer().registries)
+        if include_pitch_class_sets:
+            from pitch_class_registry import get_pitch_class_registry
+            registries['pitch_class_set'] = get_pitch_class_registry()
+        if path is None and include_pitch_class_sets:
+            path = default_cache_path('registry_distances_pcs.npz')
+        _TABLES[key] = DistanceTables.load(registries, path)
+    return _TABLES[key]
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    print("=" * 70)
+    print("LJPW V7.7 — CROSS-REGISTRY DISTANCE TABLES TEST")
+    print("=" * 70)
+
+    registries = dict(MusicalSemanticsAnalyzer().registries)
+    path = os.path.join(tempfile.mkdtemp(prefix="ljpw_dist_"), CACHE_FILE)
+
+    t0 = time.perf_counter()
+    tables = DistanceTables.load(registries, path)
+    built = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    tables = DistanceTables.load(registries, path)
+    loaded = time.perf_counter() - t0
+    print(f"\n1. {len(tables.names) ** 2} tables: built in {built * 1000:.1f} ms, "
+          f"loaded from cache in {loaded * 1000:.1f} ms")
+
+    print("\n2. Lookups:")
+    print(f"   Maj <-> Ionian: {tables.distance('chord', 'Maj', 'mode', 'Ionian'):.4f}")
+    print(f"   Modes nearest Maj7: {tables.neighbours('chord', 'Maj7', 'mode', k=3)}")
+    print(f"   Chords nearest the tritone: {tables.neighbours('interval', 'TT', 'chord', k=3)}")
+    print(f"   Intervals nearest P5: {tables.neighbours('interval', 'P5', 'interval', k=3)}")
+
+    n = 100_000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        tables.neighbours('chord', 'Dom7', 'mode', k=3)
+    print(f"   neighbours(): {(time.perf_counter() - t0) / n * 1e6:.2f} µs per lookup")
+
+    # 3. A registry change invalidates the cache
+    from musical_semantics import CHORD_REGISTRY, CompiledRegistry
+    from dataclasses import replace
+    edited = dict(CHORD_REGISTRY)
+    edited['Maj'] = replace(edited['Maj'], L=0.95)
+    registries['chord'] = CompiledRegistry(edited)
+    rebuilt = DistanceTables.load(registries, path)
+    print(f"\n3. After editing Maj: hash changed {rebuilt.content_hash != tables.content_hash}, "
+          f"Maj <-> Ionian now {rebuilt.distance('chord', 'Maj', 'mode', 'Ionian'):.4f}")
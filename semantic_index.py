@@ -0,0 +1,375 @@
+"""
+LJPW Framework V7.7 — Approximate Nearest-Neighbour Index
+"Closest structure or song" lookups over millions of entries.
+
+Exact scans (CompiledRegistry.top_k) cost O(K) per query. IVFIndex is an
+inverted-file index in pure NumPy:
+
+    build   k-means partitions the vectors into n_cells coarse cells;
+            vectors are stored contiguously, grouped by cell
+    search  rank the cell centroids, scan only the n_probe nearest cells
+
+n_probe trades recall for latency (n_probe = n_cells is an exact scan).
+Vectors may be the 4D LJPW coordinates or longer LJPW-plus-feature rows.
+"""
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+
+
+FORMAT_VERSION = 1
+
+
+def _as_matrix(vectors) -> np.ndarray:
+    """(N, d) float64 from an array, one LJPWCoordinates or a sequence of them"""
+    if isinstance(vectors, LJPWCoordinates):
+        return vectors.to_array()[None, :]
+    if len(vectors) and isinstance(vectors[0], LJPWCoordinates):
+        return np.array([v.to_array() for v in vectors], dtype=float)
+    matrix = np.asarray(vectors, dtype=float)
+    return matrix[None, :] if matrix.ndim == 1 else matrix
+
+
+def _sq_distances(x: np.ndarray, centers: np.ndarray, center_norms: np.ndarray) -> np.ndarray:
+    """(N, C) squared distances by the |x|^2 - 2 x.c + |c|^2 expansion"""
+    d = x @ centers.T
+    d *= -2.0
+    d += center_norms
+    d += np.einsum('nd,nd->n', x, x)[:, None]
+    return d
+
+
+def assign_cells(x: np.ndarray, centers: np.ndarray, chunk_size: int = 65_536) -> np.ndarray:
+    """Index of the nearest center for every row of x"""
+    norms = np.einsum('cd,cd->c', centers, centers)
+    labels = np.empty(len(x), dtype=np.int64)
+    for start in range(0, len(x), chunk_size):
+        block = x[start:start + chunk_size]
+        labels[start:start + len(block)] = np.argmin(_sq_distances(block, centers, norms), axis=1)
+    return labels
+
+
+def kmeans(x: np.ndarray, n_clusters: int, n_iter: int = 15,
+           seed: Optional[int] = None) -> np.ndarray:
+    """
+    Lloyd's k-means with k-means++ seeding on a sample.
+
+    Empty clusters are re-seeded at random points so every cell is used.
+
+    Returns:
+        (n_clusters, d) centers
+    """
+    rng = np.random.default_rng(seed)
+    n = len(x)
+
+    # k-means++ on a small sample keeps seeding O(n_clusters * sample)
+    sample = x[rng.choice(n, size=min(n, 8 * n_clusters), replace=False)]
+    centers = np.empty((n_clusters, x.shape[1]))
+    centers[0] = sample[rng.integers(len(sample))]
+    closest = np.sum((sample - centers[0]) ** 2, axis=1)
+    for c in range(1, n_clusters):
+        total = closest.sum()
+        i = rng.choice(len(sample), p=closest / total) if total > 0 else rng.integers(len(sample))
+        centers[c] = sample[i]
+        np.minimum(closest, np.sum((sample - centers[c]) ** 2, axis=1), out=closest)
+
+    for _ in range(n_iter):
+        labels = assign_cells(x, centers)
+        counts = np.bincount(labels, minlength=n_clusters)
+        sums = np.stack([np.bincount(labels, weights=x[:, j], minlength=n_clusters)
+                         for j in range(x.shape[1])], axis=1)
+        empty = counts == 0
+        centers[~empty] = sums[~empty] / counts[~empty, None]
+        if empty.any():
+            centers[empty] = x[rng.choice(n, size=int(empty.sum()), replace=False)]
+    return centers
+
+
+# ============================================================================
+# IVF INDEX
+# ============================================================================
+
+class IVFIndex:
+    """
+    Inverted-file index with k-means coarse cells.
+
+    Usage:
+        index = IVFIndex.build(catalog_vectors, keys=track_ids)
+        ids, dists = index.search(query, k=5, n_probe=8)
+        index.save("catalog.npz"); index = IVFIndex.load("catalog.npz")
+    """
+
+    def __init__(self, centers: np.ndarray, offsets: np.ndarray,
+                 vectors: np.ndarray, ids: np.ndarray,
+                 keys: Optional[np.ndarray] = None, n_probe: int = 8):
+        """
+        Initialize from built arrays (use IVFIndex.build or IVFIndex.load).
+
+        Args:
+            centers: (C, d) cell centroids
+            offsets: (C + 1,) start of every cell in vectors/ids
+            vectors: (N, d) vectors grouped by cell
+            ids: (N,) original row of every stored vector
+            keys: Optional (N,) labels in original row order
+            n_probe: Default number of cells scanned per query
+        """
+        self.centers = np.ascontiguousarray(centers, dtype=float)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.vectors = np.ascontiguousarray(vectors, dtype=float)
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.keys = keys
+        self.n_probe = n_probe
+        self._center_norms = np.einsum('cd,cd->c', self.centers, self.centers)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def n_cells(self) -> int:
+        return len(self.centers)
+
+    @property
+    def dim(self) -> int:
+        return self.centers.shape[1]
+
+    @classmethod
+    def build(cls, vectors, keys: Optional[Sequence] = None,
+              n_cells: Optional[int] = None, n_probe: int = 8,
+              n_iter: int = 15, train_per_cell: int = 64,
+              seed: Optional[int] = 0) -> 'IVFIndex':
+        """
+        Partition vectors into cells.
+
+        Args:
+            vectors: (N, d) array or a sequence of LJPWCoordinates
+            keys: Optional label per vector (returned by search_keys)
+            n_cells: Coarse cells (default ~sqrt(N))
+            n_probe: Default cells scanned per query
+            n_iter: k-means iterations
+            train_per_cell: Vectors sampled per cell to train the centroids
+            seed: Seed for sampling and k-means
+        """
+        x = _as_matrix(vectors)
+        n = len(x)
+        if n_cells is None:
+            n_cells = max(1, int(round(np.sqrt(n))))
+        n_cells = min(n_cells, n)
+
+        rng = np.random.default_rng(seed)
+        train_size = train_per_cell * n_cells
+        train = x if n <= train_size else x[rng.choice(n, size=train_size, replace=False)]
+        centers = kmeans(train, n_cells, n_iter=n_iter, seed=seed)
+
+        labels = assign_cells(x, centers)
+        order = np.argsort(labels, kind='stable')
+        offsets = np.zeros(n_cells + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=n_cells), out=offsets[1:])
+        key_array = None if keys is None else np.asarray(keys)
+        return cls(centers, offsets, x[order], order, key_array, n_probe)
+
+    @classmethod
+    def from_registry(cls, registry, **kwargs) -> 'IVFIndex':
+        """Index a CompiledRegistry (its keys become the result labels)"""
+        return cls.build(registry.matrix, keys=list(registry.keys), **kwargs)
+
+    # ------------------------------------------------------------------------
+    # SEARCH
+    # ------------------------------------------------------------------------
+
+    def _probe(self, query: np.ndarray, n_probe: int) -> np.ndarray:
+        """The n_probe cells whose centroids are nearest one query (unordered)"""
+        d = self._center_norms - 2.0 * (self.centers @ query)
+        if n_probe >= len(d):
+            return np.arange(len(d))
+        return np.argpartition(d, n_probe - 1)[:n_probe]
+
+    def search_one(self, query: np.ndarray, k: int = 1,
+                   n_probe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        k approximate nearest neighbours of one (d,) query.
+
+        Returns:
+            ids: (<= k,) original rows, nearest first
+            distances: matching Euclidean distances
+        """
+        n_probe = self.n_probe if n_probe is None else n_probe
+        cells = self._probe(query, n_probe)
+        starts, stops = self.offsets[cells], self.offsets[cells + 1]
+        rows = np.concatenate([np.arange(a, b) for a, b in zip(starts, stops)])
+        if len(rows) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        diff = self.vectors[rows] - query
+        d = np.einsum('nd,nd->n', diff, diff)
+        if k < len(d):
+            part = np.argpartition(d, k - 1)[:k]
+            part = part[np.argsort(d[part], kind='stable')]
+        else:
+            part = np.argsort(d, kind='stable')
+        return self.ids[rows[part]], np.sqrt(d[part])
+
+    def search(self, queries, k: int = 1,
+               n_probe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        k approximate nearest neighbours for every query.
+
+        Args:
+            queries: (N, d) array, LJPWCoordinates or a sequence of them
+            k: Neighbours per query
+            n_probe: Cells scanned per query (default self.n_probe)
+
+        Returns:
+            ids: (N, k) original rows, nearest first (-1 where fewer found)
+            distances: (N, k) distances (inf where fewer found)
+        """
+        q = _as_matrix(queries)
+        ids = np.full((len(q), k), -1, dtype=np.int64)
+        dists = np.full((len(q), k), np.inf)
+        for i, query in enumerate(q):
+            found, d = self.search_one(query, k, n_probe)
+            ids[i, :len(found)] = found
+            dists[i, :len(found)] = d
+        return ids, dists
+
+    def search_keys(self, query, k: int = 1,
+                    n_probe: Optional[int] = None) -> List[Tuple[object, float]]:
+        """[(key, distance)] for one query (keys as given to build)"""
+        found, d = self.search_one(_as_matrix(query)[0], k, n_probe)
+        labels = found if self.keys is None else self.keys[found]
+        return [(label.item() if hasattr(label, 'item') else label, float(dist))
+                for label, dist in zip(labels, d)]
+
+    # ------------------------------------------------------------------------
+    # PERSISTENCE
+    # ------------------------------------------------------------------------
+
+    def save(self, path: str) -> str:
+        """Write the index to an .npz file"""
+        arrays = {
+            'format_version': np.array(FORMAT_VERSION),
+            'centers': self.centers,
+            'offsets': self.offsets,
+            'vectors': self.vectors,
+            'ids': self.ids,
+            'n_probe': np.array(self.n_probe),
+        }
+        if self.keys is not None:
+            arrays['keys'] = self.keys
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'IVFIndex':
+        """Read an index written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['format_version']) > FORMAT_VERSION:
+                raise ValueError(f"{path}: index version {int(data['format_version'])} is newer than supported")
+            return cls(data['centers'], data['offsets'], data['vectors'], data['ids'],
+                       data['keys'] if 'keys' in data else None, int(data['n_probe']))
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def exact_neighbours(vectors: np.ndarray, queries: np.ndarray, k: int,
+                     block_elements: int = 1 << 23) -> np.ndarray:
+    """(N, k) exact nearest rows by brute force (ground truth for recall)"""
+    norms = np.einsum('nd,nd->n', vectors, vectors)
+    chunk_size = max(1, block_elements // len(vectors))
+    out = np.empty((len(queries), k), dtype=np.int64)
+    for start in range(0, len(queries), chunk_size):
+        d = _sq_distances(queries[start:start + chunk_size], vectors, norms)
+        part = np.argpartition(d, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(d, part, axis=1), axis=1)
+        out[start:start + len(d)] = np.take_along_axis(part, order, axis=1)
+    return out
+
+
+def benchmark(index: IVFIndex, vectors: np.ndarray, queries: np.ndarray,
+              k: int = 10, probes: Sequence[int] = (1, 2, 4, 8, 16, 32)) -> List[Dict]:
+    """
+    Recall@k and single-query latency for a sweep of n_probe values.
+
+    Args:
+        index: Built index over `vectors`
+        vectors: The indexed vectors (original row order)
+        queries: (Q, d) query vectors
+        k: Neighbours per query
+        probes: n_probe values to try
+
+    Returns:
+        One {'n_probe', 'recall', 'p50_ms', 'p99_ms', 'mean_ms'} per setting
+    """
+    queries = _as_matrix(queries)
+    truth = exact_neighbours(_as_matrix(vectors), queries, k)
+    results = []
+    for n_probe in probes:
+        latencies = np.empty(len(queries))
+        hits = 0
+        for i, q in enumerate(queries):
+            t0 = time.perf_counter()
+            found, _ = index.search_one(q, k, n_probe)
+            latencies[i] = time.perf_counter() - t0
+            hits += len(np.intersect1d(found, truth[i]))
+        results.append({
+            'n_probe': n_probe,
+            'recall': hits / truth.size,
+            'p50_ms': float(np.percentile(latencies, 50) * 1000),
+            'p99_ms': float(np.percentile(latencies, 99) * 1000),
+            'mean_ms': float(latencies.mean() * 1000),
+        })
+    return results
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    print("=" * 70)
+    print("LJPW V7.7 — APPROXIMATE NEAREST-NEIGHBOUR INDEX TEST")
+    print("=" * 70)
+
+    # 1. A synthetic 1M-song catalog: LJPW clustered around genre centres
+    rng = np.random.default_rng(0)
+    n_songs = 1_000_000
+    genres = rng.uniform(0.2, 1.0, size=(40, 4))
+    catalog = np.clip(genres[rng.integers(40, size=n_songs)]
+                      + rng.normal(0, 0.08, size=(n_songs, 4)), 0, 1)
+
+    t0 = time.perf_counter()
+    index = IVFIndex.build(catalog)
+    print(f"\n1. Built {index.n_cells} cells over {len(index):,} songs "
+          f"in {time.perf_counter() - t0:.1f}s")
+
+    # 2. Recall vs latency
+    queries = np.clip(genres[rng.integers(40, size=500)] + rng.normal(0, 0.08, size=(500, 4)), 0, 1)
+    print("\n2. Recall@10 vs single-query latency:")
+    print(f"   {'n_probe':>7} {'recall':>7} {'p50 ms':>7} {'p99 ms':>7}")
+    for row in benchmark(index, catalog, queries, k=10):
+        print(f"   {row['n_probe']:>7} {row['recall']:>7.3f} {row['p50_ms']:>7.3f} {row['p99_ms']:>7.3f}")
+
+    # 3. Save / load round trip
+    path = os.path.join(tempfile.mkdtemp(prefix="ljpw_ann_"), "catalog.npz")
+    index.save(path)
+    t0 = time.perf_counter()
+    loaded = IVFIndex.load(path)
+    load_ms = (time.perf_counter() - t0) * 1000
+    same = np.array_equal(loaded.search(queries[:20], k=5)[0], index.search(queries[:20], k=5)[0])
+    print(f"\n3. Reloaded in {load_ms:.1f} ms, identical results: {same}")
+    os.remove(path)
+
+    # 4. Registries index the same way
+    from pitch_class_registry import get_pitch_class_registry
+    sets = IVFIndex.from_registry(get_pitch_class_registry(), n_probe=4)
+    happy_pop = LJPWCoordinates(L=0.90, J=0.85, P=0.75, W=0.60, source="test")
+    print(f"4. Nearest pitch-class sets to a happy pop song: {sets.search_keys(happy_pop, k=3)}")
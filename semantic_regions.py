@@ -0,0 +1,298 @@
+"""
+LJPW Framework V7.7 — Region Queries over Musical Registries
+The inverse question: which structures land inside a target LJPW region?
+
+    index = RegionIndex.default()
+    index.in_phase('AUTOPOIETIC')                  # ranked by harmony
+    index.in_ball([0.9, 0.8, 0.8, 0.7], 0.1)       # ranked by distance
+    index.in_box(lower=[0.7, 0, 0, 0.8])           # L >= 0.7 and W >= 0.8
+    index.query(phase='AUTOPOIETIC', center=target, radius=0.2)
+
+Entries of every registry are bucketed once into a uniform 4D grid
+(sorted by linear cell id, located with searchsorted) and grouped by
+their precomputed phase. A query touches only the grid cells that
+overlap its region (or only the entries of the requested phase), so its
+cost follows the size of the answer rather than the registries.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from autopoietic_ensemble import ensemble_harmony, ensemble_phase_codes, PHASE_NAMES
+from musical_semantics import CompiledRegistry, MusicalSemanticsAnalyzer
+
+
+# Coordinates live in [0, 1]^4 up to the L clip at sqrt(2)
+DOMAIN_UPPER = np.array([np.sqrt(2), 1.0, 1.0, 1.0])
+
+
+@dataclass
+class RegionMatch:
+    """One registry entry inside a queried region"""
+    registry: str
+    key: str
+    coords: Tuple[float, float, float, float]
+    harmony: float
+    phase: str
+    distance: Optional[float] = None   # to the query centre, when one was given
+
+
+# ============================================================================
+# GRID INDEX
+# ============================================================================
+
+class GridIndex:
+    """
+    Uniform grid over 4D points, stored as rows sorted by cell id.
+
+    cell_ids[i] is the linearized cell of sorted row i; the rows of one cell
+    are a contiguous slice found with searchsorted.
+    """
+
+    def __init__(self, points: np.ndarray, cell_size: float = 0.05):
+        """
+        Bucket points into the grid.
+
+        Args:
+            points: (N, 4) coordinates
+            cell_size: Edge length of a grid cell
+        """
+        self.cell_size = cell_size
+        self.shape = np.ceil(DOMAIN_UPPER / cell_size).astype(np.int64) + 1
+        self._strides = np.cumprod(np.concatenate([[1], self.shape[:0:-1]]))[::-1]
+
+        cells = self.cell_of(points)
+        ids = cells @ self._strides
+        self.order = np.argsort(ids, kind='stable')
+        self.cell_ids = ids[self.order]
+        self.occupied = np.unique(self.cell_ids)
+        self._occupied_cells = (self.occupied[:, None] // self._strides) % self.shape
+
+    def cell_of(self, points: np.ndarray) -> np.ndarray:
+        """Integer grid cell of every point (clipped to the grid)"""
+        cells = np.floor(np.asarray(points, dtype=float) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, self.shape - 1)
+
+    def rows_in_cells(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """
+        Rows of every point whose cell overlaps the box [lower, upper].
+
+        Enumerates the overlapping cells when there are few of them, and
+        filters the occupied cells otherwise; either way the work is bounded
+        by the smaller of the two.
+        """
+        lo = self.cell_of(lower[None, :])[0]
+        hi = self.cell_of(upper[None, :])[0]
+        n_box = int(np.prod(hi - lo + 1))
+
+        if n_box <= len(self.occupied):
+            axes = [np.arange(a, b + 1) for a, b in zip(lo, hi)]
+            grid = np.array(list(itertools.product(*axes)), dtype=np.int64).reshape(-1, 4)
+            ids = grid @ self._strides
+        else:
+            inside = np.all((self._occupied_cells >= lo) & (self._occupied_cells <= hi), axis=1)
+            ids = self.occupied[inside]
+
+        starts = np.searchsorted(self.cell_ids, ids, side='left')
+        stops = np.searchsorted(self.cell_ids, ids, side='right')
+        keep = stops > starts
+        if not keep.any():
+            return np.empty(0, dtype=np.int64)
+        return self.order[np.concatenate([np.arange(a, b) for a, b in zip(starts[keep], stops[keep])])]
+
+
+# ============================================================================
+# REGION INDEX
+# ============================================================================
+
+class RegionIndex:
+    """
+    Box / ball / phase queries over one or more CompiledRegistry objects.
+    """
+
+    def __init__(self, registries: Dict[str, CompiledRegistry], cell_size: float = 0.05):
+        """
+        Precompute grid, harmony and phase of every entry.
+
+        Args:
+            registries: {name: CompiledRegistry}, e.g. analyzer.registries
+            cell_size: Grid cell edge length
+        """
+        self.registries = registries
+        self.names = tuple(registries)
+        self.points = np.concatenate([r.matrix for r in registries.values()])
+        self.source = np.concatenate([np.full(len(r), i) for i, r in enumerate(registries.values())])
+        self.row = np.concatenate([np.arange(len(r)) for r in registries.values()])
+
+        self.harmony = ensemble_harmony(self.points)
+        self.phase = ensemble_phase_codes(self.points)
+        self.grid = GridIndex(self.points, cell_size)
+
+        # Rows of every phase, best harmony first
+        by_harmony = np.argsort(-self.harmony, kind='stable')
+        self._phase_rows = {
+            code: by_harmony[self.phase[by_harmony] == code] for code in range(len(PHASE_NAMES))
+        }
+
+    @classmethod
+    def default(cls, include_pitch_class_sets: bool = False, **kwargs) -> 'RegionIndex':
+        """Index the interval, chord and mode registries (optionally all pitch-class sets)"""
+        registries = dict(MusicalSemanticsAnalyzer().registries)
+        if include_pitch_class_sets:
+            from pitch_class_registry import get_pitch_class_registry
+            registries['pitch_class_set'] = get_pitch_class_registry()
+        return cls(registries, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    # ------------------------------------------------------------------------
+    # QUERIES
+    # ------------------------------------------------------------------------
+
+    def query(self,
+              lower: Optional[Sequence[float]] = None,
+              upper: Optional[Sequence[float]] = None,
+              center: Optional[Sequence[float]] = None,
+              radius: Optional[float] = None,
+              phase: Optional[str] = None,
+              registries: Optional[Sequence[str]] = None,
+              limit: Optional[int] = None) -> List[RegionMatch]:
+        """
+        Entries satisfying every given constraint, ranked.
+
+        Args:
+            lower, upper: Box corners (either may be omitted; NaN components are unbounded)
+            center, radius: Ball (center alone only sets the ranking target)
+            phase: 'ENTROPIC', 'HOMEOSTATIC' or 'AUTOPOIETIC'
+            registries: Restrict to these registry names
+            limit: Return at most this many matches
+
+        Returns:
+            Matches nearest `center` first if a center is given,
+            otherwise highest harmony first
+        """
+        box_lo = np.zeros(4) if lower is None else np.where(np.isnan(np.asarray(lower, dtype=float)),
+                                                           0.0, np.asarray(lower, dtype=float))
+        box_hi = DOMAIN_UPPER.copy() if upper is None else np.where(np.isnan(np.asarray(upper, dtype=float)),
+                                                                   DOMAIN_UPPER, np.asarray(upper, dtype=float))
+        target = None if center is None else np.asarray(center, dtype=float)
+        if radius is not None:
+            if target is None:
+                raise ValueError("radius needs a center")
+            box_lo = np.maximum(box_lo, target - radius)
+            box_hi = np.minimum(box_hi, target + radius)
+        if np.any(box_lo > box_hi):
+            return []
+
+        code = None
+        if phase is not None:
+            code = PHASE_NAMES.index(phase.split()[0].upper())
+
+        # Candidate rows from the most selective precomputed structure
+        bounded = lower is not None or upper is not None or radius is not None
+        if code is not None and (not bounded or len(self._phase_rows[code]) < self._box_estimate(box_lo, box_hi)):
+            rows = self._phase_rows[code]
+        else:
+            rows = self.grid.rows_in_cells(box_lo, box_hi)
+
+        # Exact filters
+        p = self.points[rows]
+        keep = np.all((p >= box_lo) & (p <= box_hi), axis=1)
+        dist = None
+        if target is not None:
+            dist = np.sqrt(np.sum((p - target) ** 2, axis=1))
+            if radius is not None:
+                keep &= dist <= radius
+        if code is not None:
+            keep &= self.phase[rows] == code
+        if registries is not None:
+            wanted = [self.names.index(name) for name in registries]
+            keep &= np.isin(self.source[rows], wanted)
+
+        rows = rows[keep]
+        if dist is not None:
+            dist = dist[keep]
+            order = np.lexsort((-self.harmony[rows], dist))
+        else:
+            order = np.lexsort((self.source[rows], -self.harmony[rows]))
+        if limit is not None:
+            order = order[:limit]
+        return [self._match(rows[i], None if dist is None else float(dist[i])) for i in order]
+
+    def in_box(self, lower: Optional[Sequence[float]] = None,
+               upper: Optional[Sequence[float]] = None, **kwargs) -> List[RegionMatch]:
+        """Entries with lower <= (L, J, P, W) <= upper (NaN = unbounded side)"""
+        return self.query(lower=lower, upper=upper, **kwargs)
+
+    def in_ball(self, center: Sequence[float], radius: float, **kwargs) -> List[RegionMatch]:
+        """Entries within `radius` of `center`, nearest first"""
+        return self.query(center=center, radius=radius, **kwargs)
+
+    def in_phase(self, phase: str, **kwargs) -> List[RegionMatch]:
+        """Entries whose coordinates fall in a phase of LJPWCoordinates.phase()"""
+        return self.query(phase=phase, **kwargs)
+
+    def _box_estimate(self, lower: np.ndarray, upper: np.ndarray) -> float:
+        """Rough candidate count of a box, assuming entries spread over the domain"""
+        fraction = np.prod(np.clip((upper - lower) / DOMAIN_UPPER, 0.0, 1.0))
+        return fraction * len(self)
+
+    def _match(self, i: int, distance: Optional[float]) -> RegionMatch:
+        registry = self.names[self.source[i]]
+        return RegionMatch(
+            registry=registry,
+            key=self.registries[registry].keys[self.row[i]],
+            coords=tuple(self.points[i].tolist()),
+            harmony=float(self.harmony[i]),
+            phase=PHASE_NAMES[self.phase[i]],
+            distance=distance,
+        )
+
+
+# ============================================================================
+# USAGE EXAMPLES
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("LJPW V7.7 — REGISTRY REGION QUERY TEST")
+    print("=" * 70)
+
+    index = RegionIndex.default()
+
+    # 1. Which structures are autopoietic?
+    print("\n1. AUTOPOIETIC structures (by harmony):")
+    for m in index.in_phase('AUTOPOIETIC', limit=8):
+        print(f"   {m.registry:<8} {m.key:<10} H={m.harmony:.3f}")
+
+    # 2. Within 0.1 of a target
+    target = [0.90, 0.85, 0.75, 0.70]
+    print(f"\n2. Within 0.1 of {target}:")
+    for m in index.in_ball(target, 0.1):
+        print(f"   {m.registry:<8} {m.key:<10} d={m.distance:.3f}")
+
+    # 3. Box: high Wisdom, Love at least 0.6
+    print("\n3. W >= 0.85 and L >= 0.6:")
+    for m in index.in_box(lower=[0.6, np.nan, np.nan, 0.85]):
+        print(f"   {m.registry:<8} {m.key:<10} {tuple(round(v, 2) for v in m.coords)}")
+
+    # 4. Query cost on the full pitch-class set registry
+    big = RegionIndex.default(include_pitch_class_sets=True)
+    reps = 200
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        hits = big.in_ball(target, 0.1, registries=['pitch_class_set'])
+    ball_ms = (time.perf_counter() - t0) / reps * 1000
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        auto = big.query(phase='AUTOPOIETIC', registries=['chord', 'mode'])
+    phase_ms = (time.perf_counter() - t0) / reps * 1000
+    print(f"\n4. {len(big)} entries: ball query {ball_ms:.3f} ms ({len(hits)} hits), "
+          f"phase query {phase_ms:.3f} ms ({len(auto)} hits)")
+    print(f"   Nearest pitch-class sets: {[(m.key, round(m.distance, 3)) for m in hits[:4]]}")
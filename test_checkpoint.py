@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+A run interrupted between checkpoints and resumed must equal an
+uninterrupted run bit for bit (state, self-model, events and history).
+
+Run with pytest or directly: python test_checkpoint.py
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+from autopoietic_engine import AutopoieticEngine
+from autopoietic_checkpoint import Checkpointer, MODEL_WINDOWS, run_resumable
+from autopoietic_trajectory import COLUMN_NAMES
+
+START = LJPWCoordinates(L=0.3, J=0.5, P=0.9, W=0.5)
+TOTAL = 3000
+EVERY = 500
+CRASH_AT = 1234          # between the checkpoints at 1000 and 1500
+
+
+def _crash_part_way(directory: str) -> None:
+    """Run to CRASH_AT with periodic checkpoints, leaving rows past the last one on disk"""
+    checkpointer = Checkpointer(directory, every_steps=EVERY)
+    engine = checkpointer.attach(AutopoieticEngine(START))
+    engine.track_events()
+    for _ in range(CRASH_AT):
+        engine.step(0.1)
+        if engine.tick_count % EVERY == 0:
+            checkpointer.save(engine, dt=0.1, target_steps=TOTAL)
+    checkpointer.sink.flush()
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    """Resumed and uninterrupted runs agree exactly"""
+    root = str(tmp_path)
+    reference_dir = os.path.join(root, "reference")
+    crashed_dir = os.path.join(root, "crashed")
+
+    reference = run_resumable(START, TOTAL, reference_dir, every_steps=EVERY, events=True)
+
+    _crash_part_way(crashed_dir)
+    checkpointer = Checkpointer(crashed_dir, every_steps=EVERY)
+    resumed = checkpointer.load()
+    assert resumed.tick_count == (CRASH_AT // EVERY) * EVERY
+    checkpointer.run(resumed, TOTAL, dt=0.1)
+
+    assert resumed.state.to_tuple() == reference.state.to_tuple()
+    assert resumed.time_elapsed == reference.time_elapsed
+    assert resumed.tick_count == reference.tick_count == TOTAL
+    assert resumed.model['best_efficiency'] == reference.model['best_efficiency']
+    assert resumed.model['convergence'] == reference.model['convergence']
+    for window in MODEL_WINDOWS:
+        a = reference.model[window].get_state()
+        b = resumed.model[window].get_state()
+        assert all(np.array_equal(a[key], b[key]) for key in a), window
+    assert resumed.events == reference.events
+
+    expected = Checkpointer(reference_dir).load_history()
+    actual = checkpointer.load_history()
+    assert len(actual) == len(expected) == TOTAL
+    for name in COLUMN_NAMES:
+        assert np.array_equal(actual[name], expected[name]), name
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory(prefix="ljpw_ckpt_test_") as tmp:
+        test_resume_matches_uninterrupted_run(tmp)
+    print(f"OK           resume after a crash at tick {CRASH_AT} matches the uninterrupted run")
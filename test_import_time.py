@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Import-time budget for the analysis modules.
+
+Each measurement runs in a fresh interpreter. Third-party packages (NumPy)
+are imported first so the budget covers only this repository's modules,
+and the fastest of a few runs is used to keep the check stable on busy
+machines.
+
+Run with pytest or directly: python test_import_time.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Milliseconds, measured after NumPy and the standard library are loaded
+BUDGETS_MS = {
+    'musical_semantics': 50.0,
+    'pitch_class_registry, semantic_index, semantic_regions, registry_distances, chord_progressions, chord_timeline': 250.0,
+}
+RUNS = 3
+
+PROBE = """
+import json, sys, time
+import numpy, dataclasses, hashlib, threading
+t0 = time.perf_counter()
+import {modules}
+elapsed = (time.perf_counter() - t0) * 1000
+import musical_semantics
+print(json.dumps({{'ms': elapsed, 'loaded': sorted(musical_semantics._registries)}}))
+"""
+
+
+def _measure(modules: str) -> dict:
+    """Fastest of RUNS fresh-interpreter imports of `modules`"""
+    best = None
+    for _ in range(RUNS):
+        out = subprocess.run([sys.executable, '-c', PROBE.format(modules=modules)],
+                             cwd=HERE, capture_output=True, text=True, check=True)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        if best is None or result['ms'] < best['ms']:
+            best = result
+    return best
+
+
+def test_import_time_within_budget():
+    """Importing the analysis modules stays under the fixed budget"""
+    for modules, budget in BUDGETS_MS.items():
+        result = _measure(modules)
+        assert result['ms'] <= budget, f"import {modules}: {result['ms']:.1f} ms > {budget:.0f} ms"
+
+
+def test_registries_load_lazily():
+    """Import parses no registry data; first access does"""
+    result = _measure('musical_semantics')
+    assert result['loaded'] == []
+
+    import musical_semantics
+    chords = musical_semantics.CHORD_REGISTRY
+    assert 'Maj' in chords
+    assert musical_semantics.load_registry('chord') is chords
+    assert musical_semantics.compiled_registry('chord').matrix.shape == (len(chords), 4)
+
+
+if __name__ == "__main__":
+    for modules, budget in BUDGETS_MS.items():
+        result = _measure(modules)
+        status = "OK" if result['ms'] <= budget else "OVER BUDGET"
+        print(f"{status:<12} {result['ms']:7.1f} ms / {budget:5.0f} ms  import {modules}")
+    test_registries_load_lazily()
+    print("OK           registries load lazily")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+The data-driven insight rules must reproduce the hand-written
+_generate_insights() they replaced, text for text and in the same order.
+
+Run with pytest or directly: python test_insights.py
+"""
+
+import itertools
+
+import numpy as np
+
+from ljpw_v77_core import LJPWCoordinates
+from musical_semantics import (
+    MusicalSemanticsAnalyzer, compiled_registry, evaluate_insights, load_registry, render_insights
+)
+
+
+def _legacy_nearest(registry, coords: np.ndarray) -> str:
+    """Original find_nearest_*: stable sort of a per-entry distance scan"""
+    ranked = sorted(registry.items(), key=lambda item: np.linalg.norm(
+        np.array([item[1].L, item[1].J, item[1].P, item[1].W]) - coords))
+    return ranked[0][0]
+
+
+def _rounding_tie(coords: np.ndarray) -> bool:
+    """
+    Two registry entries within rounding of the nearest distance, and not an
+    exact tie under both the legacy and the compiled arithmetic: which one
+    wins depends on summation order, not on the insight logic. (Exact ties
+    in both must still resolve to the first entry, and are checked.)
+    """
+    for name in ('interval', 'chord', 'mode'):
+        registry = compiled_registry(name)
+        legacy = np.array([np.linalg.norm(row - coords) for row in registry.matrix])
+        compiled = registry.distances(coords[None, :])[0]
+        near = np.flatnonzero(legacy - legacy.min() < 1e-12)
+        if len(near) > 1 and not (np.all(legacy[near] == legacy[near[0]]) and
+                                  np.all(compiled[near] == compiled[near[0]])):
+            return True
+    return False
+
+
+def _legacy_insights(coords: np.ndarray) -> list:
+    """Verbatim logic of the original MusicalSemanticsAnalyzer._generate_insights"""
+    L, J, P, W = coords
+    insights = []
+    if L > 0.85:
+        insights.append("🎵 HIGH LOVE: Melody is likely strong, attractive, and memorable.")
+    elif L < 0.4:
+        insights.append("⚠️ LOW LOVE: Melody may be weak or fragmented. Connection is lost.")
+    if J > 0.85:
+        insights.append("🎵 HIGH JUSTICE: Harmony is balanced and resolved. Consonant.")
+    elif J < 0.4:
+        insights.append("⚠️ LOW JUSTICE: Dissonance is likely. Tension not resolved.")
+    if P > 0.85:
+        insights.append("🎵 HIGH POWER: Strong rhythmic drive. High energy.")
+    elif P < 0.4:
+        insights.append("⚠️ LOW POWER: Rhythm is weak. Lacks momentum.")
+    if W > 0.85:
+        insights.append("🎵 HIGH WISDOM: Complex timbral structure. Rich information.")
+    elif W < 0.4:
+        insights.append("⚠️ LOW WISDOM: Timbre is simple or predictable.")
+
+    interval_name = _legacy_nearest(load_registry('interval'), coords)
+    if interval_name == 'M3':
+        insights.append("❤️ MAJOR 3RD PRESENCE: The 'Love Interval' is dominant. Expect happiness/connection.")
+    elif interval_name == 'TT':
+        insights.append("👿 TRITONE PRESENCE: The 'Devil's Interval'. High tension, requires resolution.")
+    elif interval_name == 'P5':
+        insights.append("⚡ PERFECT 5TH PRESENCE: Power foundation. Stable and driving.")
+
+    chord_name = _legacy_nearest(load_registry('chord'), coords)
+    if chord_name == 'Maj':
+        insights.append("🌸 MAJOR TRIAD: The 'Love Chord'. Classic, happy resolution.")
+    elif chord_name == 'Power':
+        insights.append("⚡ POWER CHORD: Rock/Metal vibe. Pure energy, no harmony nuance.")
+    elif chord_name == 'Dim':
+        insights.append("🌑 DIMINISHED CHORD: Unstable, Entropic. Needs resolution.")
+
+    mode_name = _legacy_nearest(load_registry('mode'), coords)
+    if mode_name == 'Ionian':
+        insights.append("☀️ IONIAN MODE: The 'Love Mode'. Bright, major, happy.")
+    elif mode_name == 'Locrian':
+        insights.append("🌑 LOCRIAN MODE: The 'Entropic Mode'. Unstable, dark.")
+    return insights
+
+
+def _queries() -> np.ndarray:
+    """Random tracks plus a grid that sits exactly on the thresholds"""
+    levels = [0.1, 0.4, 0.6, 0.85, 0.95]
+    grid = np.array(list(itertools.product(levels, repeat=4)))
+    random = np.random.default_rng(3).random((1000, 4))
+    return np.concatenate([grid, random])
+
+
+def test_rules_match_legacy_insights():
+    """evaluate_insights + render_insights == the original if/elif chain"""
+    analyzer = MusicalSemanticsAnalyzer()
+    queries = _queries()
+    bits = analyzer.insight_bits(queries)
+    checked = 0
+    for row, b in zip(queries, bits):
+        if _rounding_tie(row):
+            continue
+        checked += 1
+        expected = _legacy_insights(row)
+        assert render_insights(b) == expected, row
+        profile = analyzer.analyze_musical_profile(LJPWCoordinates(*row))
+        assert profile['music_theory_insights'] == expected, row
+    assert checked > 0.95 * len(queries)
+
+
+def test_evaluate_insights_bit_layout():
+    """Bit i corresponds to INSIGHT_RULES[i]; matches are registry row indices"""
+    analyzer = MusicalSemanticsAnalyzer()
+    coords = np.array([[0.9, 0.2, 0.5, 0.5]])
+    matches = {'interval': np.array([analyzer.intervals.keys.index('TT')]),
+               'chord': np.array([analyzer.chords.keys.index('Maj')]),
+               'mode': np.array([analyzer.modes.keys.index('Dorian')])}
+    texts = render_insights(evaluate_insights(coords, matches)[0])
+    assert [t.split(':')[0] for t in texts] == [
+        "🎵 HIGH LOVE", "⚠️ LOW JUSTICE", "👿 TRITONE PRESENCE", "🌸 MAJOR TRIAD"]
+
+
+if __name__ == "__main__":
+    test_rules_match_legacy_insights()
+    test_evaluate_insights_bit_layout()
+    print("OK           insight rules match the original _generate_insights")